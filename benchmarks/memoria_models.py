@@ -0,0 +1,102 @@
+# benchmarks/memoria_models.py
+"""
+Memória por instância dos modelos que as telas mantêm em listas
+(Contrato, Assinatura, Usuario e PagamentoModel), com __slots__ e sem.
+
+Cria N cópias de uma instância de cada modelo e mede com tracemalloc
+quanto a lista ocupa além dela mesma. As cópias reaproveitam os valores
+dos atributos do modelo original (os setters não rodam de novo), então a
+diferença medida é só o layout do objeto. A versão "sem slots" copia os
+mesmos atributos para uma classe comum (um __dict__ por instância), como
+os modelos eram antes.
+
+Rodar: python benchmarks/memoria_models.py [quantidade]
+"""
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mvc.models.assinaturas_model import Assinatura  # noqa: E402
+from mvc.models.contratos_model import Contrato  # noqa: E402
+from mvc.models.forma_pagamento_enum import FormaPagamento  # noqa: E402
+from mvc.models.pagamentos_model import PagamentoModel  # noqa: E402
+from mvc.models.usuario_model import Usuario  # noqa: E402
+
+QUANTIDADE_PADRAO = 100_000
+
+
+def copiador(cls, atributos: list):
+    """Função origem -> nova instância de cls com os mesmos valores de atributos."""
+    def copiar(origem):
+        copia = cls.__new__(cls)
+        for nome in atributos:
+            setattr(copia, nome, getattr(origem, nome))
+        return copia
+    return copiar
+
+
+def classe_sem_slots(cls) -> type:
+    """
+    Classe comum para receber os atributos de cls num __dict__ por instância.
+    Uma classe por modelo, para o __dict__ compartilhar as chaves entre
+    instâncias como acontecia nos modelos originais.
+    """
+    return type(f"{cls.__name__}SemSlots", (), {})
+
+
+def _atributos(cls) -> list:
+    """Nomes de todos os __slots__ da classe e das classes-base, na ordem de criação."""
+    nomes = []
+    for base in reversed(cls.__mro__):
+        nomes.extend(getattr(base, "__slots__", ()))
+    return nomes
+
+
+# ---------------- FÁBRICAS ----------------
+def _contrato():
+    return Contrato("Aluguel", 1500.0, "2024-01-10", "Mensal", "Moradia", "Pix", contrato_id=1, user_id=1)
+
+
+def _assinatura():
+    return Assinatura("Netflix", "2024-01-10", 39.9, "Mensal", "Streaming", "Cartão",
+                      assinatura_id=1, user_id=1, created_at="2024-01-01T00:00:00")
+
+
+def _usuario():
+    return Usuario.from_db(1, "Ana", "ana@x.com", "pbkdf2_sha256$600000$sal$hash")
+
+
+def _pagamento():
+    return PagamentoModel("Pix", None, FormaPagamento.PIX)
+
+
+# ---------------- MEDIÇÃO ----------------
+def bytes_por_instancia(fabrica, quantidade: int) -> float:
+    """Memória alocada por instância ao criar `quantidade` objetos com fabrica()."""
+    tracemalloc.start()
+    antes = tracemalloc.get_traced_memory()[0]
+    objetos = [fabrica() for _ in range(quantidade)]
+    depois = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (depois - antes - sys.getsizeof(objetos)) / quantidade
+
+
+def main(quantidade: int = QUANTIDADE_PADRAO) -> None:
+    print(f"{quantidade} instâncias de cada modelo (bytes por instância)")
+    print(f"{'modelo':<16}{'sem slots':>12}{'com slots':>12}{'economia':>12}")
+    for nome, fabrica in (("Contrato", _contrato), ("Assinatura", _assinatura),
+                          ("Usuario", _usuario), ("PagamentoModel", _pagamento)):
+        modelo = fabrica()
+        atributos = _atributos(type(modelo))
+        copiar_com_slots = copiador(type(modelo), atributos)
+        copiar_sem_slots = copiador(classe_sem_slots(type(modelo)), atributos)
+        sem_slots = bytes_por_instancia(lambda: copiar_sem_slots(modelo), quantidade)
+        com_slots = bytes_por_instancia(lambda: copiar_com_slots(modelo), quantidade)
+        economia = 1 - com_slots / sem_slots
+        print(f"{nome:<16}{sem_slots:>12.0f}{com_slots:>12.0f}{economia:>12.0%}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else QUANTIDADE_PADRAO)
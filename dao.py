@@ -1,47 +1,359 @@
 # dao.py
+import heapq
+import os
 import sqlite3
-from typing import Optional, List
-from datetime import datetime
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, Optional, List
+from datetime import date, datetime
 from mvc.models.usuario_model import Usuario
+from mvc.models.contratos_model import Contrato
+from mvc.models.assinaturas_model import Assinatura
+from mvc.models.pagamentos_model import PagamentoModel
+from mvc.models.forma_pagamento_enum import FormaPagamento
+from mvc.models.status_enum import Status
+from migrations import NOMES_UNICOS, aplicar_migracoes, chave_nome
 
-class UserDAO:
-    def __init__(self, db_file="database.sqlite"):
-        self.conn = sqlite3.connect(db_file)
-        self._create_table()
-        self._ensure_limit_columns()
 
-    # ---------------- SCHEMA ----------------
-    def _create_table(self):
-        query = """
-        CREATE TABLE IF NOT EXISTS users (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            nome TEXT NOT NULL,
-            email TEXT UNIQUE NOT NULL,
-            senha_hash TEXT NOT NULL,
-            limite_assinaturas REAL NOT NULL DEFAULT 0,
-            limite_contratos REAL NOT NULL DEFAULT 0
-        )
+class SQLiteSettings:
+    """
+    Perfil de desempenho aplicado a cada conexão SQLite.
+
+    Os valores padrão usam WAL com synchronous=NORMAL, que faz fsync apenas
+    nos checkpoints e não a cada commit. Cada valor pode ser sobrescrito por
+    variável de ambiente (SIGNUM_SQLITE_<NOME>, ex.: SIGNUM_SQLITE_JOURNAL_MODE)
+    ou passando outra instância para ConnectionManager.configure().
+
+    Atenção: WAL depende de memória compartilhada e não é suportado em
+    compartilhamentos de rede (SMB/NFS). Nesses casos use
+    SIGNUM_SQLITE_JOURNAL_MODE=DELETE (ou TRUNCATE) e SIGNUM_SQLITE_MMAP_SIZE=0;
+    synchronous=NORMAL continua reduzindo os fsyncs por commit.
+    """
+
+    # Ordem de aplicação: busy_timeout primeiro para que a troca de
+    # journal_mode espere outro processo em vez de falhar com "locked".
+    CAMPOS = (
+        "busy_timeout",
+        "journal_mode",
+        "synchronous",
+        "cache_size",
+        "mmap_size",
+        "temp_store",
+    )
+
+    def __init__(
+        self,
+        journal_mode: str = "WAL",
+        synchronous: str = "NORMAL",
+        busy_timeout: int = 5000,
+        cache_size: int = -16000,
+        mmap_size: int = 64 * 1024 * 1024,
+        temp_store: str = "MEMORY",
+    ):
+        self.journal_mode = journal_mode
+        self.synchronous = synchronous
+        self.busy_timeout = int(busy_timeout)  # ms
+        self.cache_size = int(cache_size)  # negativo = KiB (-16000 ≈ 16 MB)
+        self.mmap_size = int(mmap_size)  # bytes; 0 desativa
+        self.temp_store = temp_store
+
+    @classmethod
+    def from_env(cls, prefixo: str = "SIGNUM_SQLITE_") -> "SQLiteSettings":
+        """Cria o perfil padrão aplicando as sobrescritas definidas no ambiente."""
+        settings = cls()
+        for campo in cls.CAMPOS:
+            valor = os.environ.get(prefixo + campo.upper())
+            if valor is None or not valor.strip():
+                continue
+            atual = getattr(settings, campo)
+            setattr(settings, campo, int(valor) if isinstance(atual, int) else valor.strip().upper())
+        return settings
+
+    def pragmas(self) -> list:
+        """Retorna os pares (pragma, valor) na ordem de aplicação."""
+        return [(campo, getattr(self, campo)) for campo in self.CAMPOS]
+
+
+class NomeDuplicadoError(ValueError):
+    """Já existe um registro do mesmo usuário com esse nome (sem diferenciar maiúsculas)."""
+
+
+@contextmanager
+def _traduz_nome_duplicado(conn: sqlite3.Connection):
+    """Converte a violação dos índices únicos de nome em NomeDuplicadoError."""
+    try:
+        yield
+    except sqlite3.IntegrityError as e:
+        if conn.in_transaction:
+            conn.rollback()
+        # Índice de coluna: a mensagem cita "tabela.nome_chave" em vez do nome do índice
+        if any(indice in str(e) or f"{tabela}.nome_chave" in str(e) for indice, tabela in NOMES_UNICOS):
+            raise NomeDuplicadoError(str(e)) from e
+        raise
+
+
+class ConnectionManager:
+    """
+    Fornece conexões SQLite compartilhadas por todos os DAOs.
+    Mantém uma conexão por thread e por arquivo de banco, aplicando
+    sempre o mesmo perfil (SQLiteSettings) na abertura.
+    """
+
+    settings = SQLiteSettings.from_env()
+
+    _local = threading.local()
+    _lock = threading.Lock()
+    _todas = []  # todas as conexões abertas (para close_all)
+    _migrados = set()  # arquivos cujo schema já foi verificado neste processo
+
+    @classmethod
+    def get_connection(cls, db_file: str = "database.sqlite") -> sqlite3.Connection:
+        """Retorna a conexão da thread atual para o arquivo informado, abrindo-a se necessário."""
+        conexoes = getattr(cls._local, "conexoes", None)
+        if conexoes is None:
+            conexoes = cls._local.conexoes = {}
+
+        conn = conexoes.get(db_file)
+        if conn is None:
+            conn = sqlite3.connect(db_file)
+            cls._aplicar_pragmas(conn)
+            conexoes[db_file] = conn
+            with cls._lock:
+                cls._todas.append(conn)
+            cls._garantir_migracoes(db_file, conn)
+        return conn
+
+    @classmethod
+    def _garantir_migracoes(cls, db_file: str, conn: sqlite3.Connection) -> None:
         """
-        self.conn.execute(query)
-        self.conn.commit()
+        Aplica as migrações pendentes uma única vez por arquivo e processo.
+        Cada conexão a ":memory:" é um banco novo e vazio, então é sempre migrada.
+        """
+        with cls._lock:
+            if db_file in cls._migrados:
+                return
+            aplicar_migracoes(conn)
+            if db_file != ":memory:":
+                cls._migrados.add(db_file)
+
+    @classmethod
+    def preparar_banco(cls, db_file: str = "database.sqlite") -> None:
+        """Abre o banco e aplica as migrações; chamado na inicialização da aplicação."""
+        cls.get_connection(db_file)
+
+    @classmethod
+    def configure(cls, settings: SQLiteSettings) -> None:
+        """
+        Substitui o perfil de PRAGMAs. Vale para conexões abertas depois da
+        chamada; use antes de preparar_banco() ou após close_all().
+        """
+        cls.settings = settings
+
+    @classmethod
+    def _aplicar_pragmas(cls, conn: sqlite3.Connection) -> None:
+        for nome, valor in cls.settings.pragmas():
+            conn.execute(f"PRAGMA {nome} = {valor}")
+
+    @classmethod
+    def close_all(cls) -> None:
+        """Fecha todas as conexões abertas (ex.: ao encerrar a aplicação)."""
+        with cls._lock:
+            conexoes, cls._todas = cls._todas, []
+        for conn in conexoes:
+            try:
+                conn.close()
+            except sqlite3.ProgrammingError:
+                # Conexão de outra thread; será liberada quando a thread terminar
+                pass
+        cls._local = threading.local()
+
+
+# ---------------- ROW FACTORIES ----------------
+# Cada tabela tem uma fábrica de linha que monta o model direto a partir da
+# tupla do cursor (cursor.row_factory), sem dicts intermediários. Os enums
+# são resolvidos por dicionários montados uma única vez, em vez de chamar
+# o construtor do Enum a cada linha.
+_STATUS_POR_VALOR = {s.value: s for s in Status}
+_FORMA_PAGAMENTO_POR_VALOR = {f.value: f for f in FormaPagamento}
+
+COLUNAS_ASSINATURA = (
+    "id, user_id, nome, data_vencimento, valor, periodicidade, categoria, forma_pagamento, "
+    "usuario_compartilhado, login, senha, favorito, status, created_at"
+)
+COLUNAS_CONTRATO = (
+    "id, user_id, nome, data_vencimento, valor, periodicidade, categoria, forma_pagamento, "
+    "usuario_compartilhado, favorito, status"
+)
+
+
+def _colunas_com_alias(colunas: str, alias: str) -> str:
+    """Prefixa as colunas com o alias da tabela (para JOINs)."""
+    return ", ".join(f"{alias}.{c.strip()}" for c in colunas.split(","))
+
+
+def _linha_assinatura(_cursor, row) -> Assinatura:
+    """Fábrica de linha para COLUNAS_ASSINATURA."""
+    return Assinatura(
+        nome=row[2],
+        data_vencimento=row[3],
+        valor=row[4],
+        periodicidade=row[5],
+        categoria=row[6],
+        forma_pagamento=row[7],
+        usuario_compartilhado=row[8],
+        login=row[9],
+        senha=row[10],
+        favorito=row[11],
+        assinatura_id=row[0],
+        user_id=row[1],
+        status=_STATUS_POR_VALOR.get(row[12], Status.ATIVO),
+        created_at=row[13],
+    )
+
+
+def _linha_assinatura_compartilhada(cursor, row) -> Assinatura:
+    """Como _linha_assinatura, marcando a assinatura como apenas leitura."""
+    assinatura = _linha_assinatura(cursor, row)
+    assinatura.is_readonly = True
+    return assinatura
+
+
+def _linha_contrato(_cursor, row) -> Contrato:
+    """Fábrica de linha para COLUNAS_CONTRATO."""
+    return Contrato(
+        contrato_id=row[0],
+        user_id=row[1],
+        nome=row[2],
+        data_vencimento=row[3],
+        valor=row[4],
+        periodicidade=row[5],
+        categoria=row[6],
+        forma_pagamento=row[7] or "",
+        usuario_compartilhado=row[8] or "",
+        favorito=1 if row[9] else 0,
+        status=_STATUS_POR_VALOR.get(row[10], Status.ATIVO),
+    )
+
+
+def _linha_contrato_compartilhado(cursor, row) -> Contrato:
+    """Como _linha_contrato, marcando o contrato como apenas leitura."""
+    contrato = _linha_contrato(cursor, row)
+    contrato.is_readonly = True
+    return contrato
 
-    def _ensure_limit_columns(self):
-        # Se o banco for antigo (sem colunas), adiciona via ALTER TABLE
-        cur = self.conn.execute("PRAGMA table_info(users)")
-        cols = {row[1] for row in cur.fetchall()}
-        altered = False
-        if "limite_assinaturas" not in cols:
-            self.conn.execute(
-                "ALTER TABLE users ADD COLUMN limite_assinaturas REAL NOT NULL DEFAULT 0"
-            )
-            altered = True
-        if "limite_contratos" not in cols:
-            self.conn.execute(
-                "ALTER TABLE users ADD COLUMN limite_contratos REAL NOT NULL DEFAULT 0"
-            )
-            altered = True
-        if altered:
-            self.conn.commit()
+
+def _linha_pagamento(_cursor, row) -> PagamentoModel:
+    """Fábrica de linha para (id, nome, vencimento, forma_pagamento)."""
+    pagamento = PagamentoModel(
+        nome=row[1],
+        vencimento=datetime.fromisoformat(row[2]).date() if row[2] else None,
+        forma_de_pagamento=_FORMA_PAGAMENTO_POR_VALOR[row[3]],
+    )
+    pagamento.id = row[0]
+    return pagamento
+
+
+def _consultar(conn: sqlite3.Connection, fabrica, query: str, params=()) -> sqlite3.Cursor:
+    """
+    Executa a consulta em um cursor próprio com a fábrica de linha informada.
+    A conexão é compartilhada entre os DAOs, por isso a fábrica é definida
+    no cursor e não em conn.row_factory.
+    """
+    cursor = conn.cursor()
+    cursor.row_factory = fabrica
+    return cursor.execute(query, params)
+
+
+# ---------------- PAGINAÇÃO (KEYSET) ----------------
+# As listas são paginadas pela própria chave de ordenação em vez de OFFSET:
+# a página seguinte começa logo após a última linha entregue, então o custo
+# de cada página não cresce com a quantidade de linhas já exibidas.
+# Assinaturas e contratos: favorito DESC, data_vencimento, id.
+# Pagamentos: vencimento (sem vencimento primeiro), id.
+PAGINA_PADRAO = 100
+
+
+def chave_favorito_vencimento(item) -> tuple:
+    """Cursor (favorito, data_vencimento, id) de uma assinatura ou contrato."""
+    return (1 if item.favorito else 0, item.data_vencimento, item.id)
+
+
+def _ordem_favorito_vencimento(item) -> tuple:
+    favorito, data_vencimento, item_id = chave_favorito_vencimento(item)
+    return (-favorito, data_vencimento, item_id)
+
+
+def _pagina_favorito_vencimento(conn, fabrica, base_sql: str, params, limite: int,
+                                apos: Optional[tuple] = None, alias: str = "") -> list:
+    """
+    Executa base_sql (SELECT ... WHERE <filtro do usuário>) a partir do cursor
+    `apos`, na ordem favorito DESC, data_vencimento, id.
+
+    Cada grupo de favorito é lido com uma comparação de row value sobre
+    (data_vencimento, id), que o SQLite resolve como busca por faixa no índice.
+    """
+    p = f"{alias}." if alias else ""
+    if apos is None:
+        query = f"{base_sql} ORDER BY {p}favorito DESC, {p}data_vencimento, {p}id LIMIT ?"
+        return _consultar(conn, fabrica, query, [*params, limite]).fetchall()
+
+    favorito, data_vencimento, item_id = apos
+    query = (
+        f"{base_sql} AND {p}favorito = ? AND ({p}data_vencimento, {p}id) > (?, ?) "
+        f"ORDER BY {p}data_vencimento, {p}id LIMIT ?"
+    )
+    linhas = _consultar(conn, fabrica, query, [*params, favorito, data_vencimento, item_id, limite]).fetchall()
+    if favorito and len(linhas) < limite:
+        # Acabaram os favoritos: continua do início dos não favoritos
+        query = f"{base_sql} AND {p}favorito = 0 ORDER BY {p}data_vencimento, {p}id LIMIT ?"
+        linhas += _consultar(conn, fabrica, query, [*params, limite - len(linhas)]).fetchall()
+    return linhas
+
+
+def _mesclar_paginas(listas, limite: int, chave, ordem) -> tuple:
+    """
+    Intercala listas já ordenadas (cada uma com até limite + 1 itens) e corta
+    na página.
+
+    Returns:
+        tuple: (itens, proximo) — proximo é o cursor da página seguinte, ou None
+    """
+    itens = list(heapq.merge(*listas, key=ordem))
+    if len(itens) > limite:
+        itens = itens[:limite]
+        return itens, chave(itens[-1])
+    return itens, None
+
+
+# ---------------- LEITURA EM LOTES ----------------
+# Variantes iter_*/iterar_* dos DAOs devolvem um gerador que lê o cursor com
+# fetchmany: a memória fica limitada ao lote, não ao tamanho da tabela.
+# Use-as em consumidores de passada única (renovação, exportações,
+# relatórios). O cursor fica aberto até o gerador ser esgotado ou fechado.
+LOTE_PADRAO = 500
+
+
+def _em_lotes(cursor: sqlite3.Cursor, tamanho_lote: int = LOTE_PADRAO) -> Iterator:
+    """Percorre o cursor em lotes de fetchmany, fechando-o ao final."""
+    try:
+        while True:
+            linhas = cursor.fetchmany(tamanho_lote)
+            if not linhas:
+                return
+            yield from linhas
+    finally:
+        cursor.close()
+
+
+class UserDAO:
+    def __init__(self, db_file="database.sqlite"):
+        self.db_file = db_file
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Conexão da thread atual, obtida do ConnectionManager."""
+        return ConnectionManager.get_connection(self.db_file)
 
     # ---------------- CREATE ----------------
     def add_user(self, user: Usuario):
@@ -60,6 +372,7 @@ class UserDAO:
             ),
         )
         self.conn.commit()
+        EmailResolver.invalidar_em(self.db_file, email=user.email)
 
     # ---------------- READ ----------------
     def get_user_by_email(self, email: str) -> Optional[Usuario]:
@@ -73,17 +386,15 @@ class UserDAO:
         row = cursor.fetchone()
         if row:
             user_id, nome, email_db, senha_hash, lim_ass, lim_con = row
-            # Cria o Usuario sem re-hash de senha
-            user = Usuario(
+            # Reaproveita o hash salvo: carregar um usuário não deriva chave
+            return Usuario.from_db(
+                user_id=user_id,
                 nome=nome,
                 email=email_db,
-                senha="",
-                user_id=user_id,
+                senha_hash=senha_hash,
                 limite_assinaturas=lim_ass,
                 limite_contratos=lim_con,
             )
-            user.senha_hash = senha_hash
-            return user
         return None
 
     # ---------------- UPDATE (apenas limites) ----------------
@@ -114,11 +425,22 @@ class UserDAO:
             (nome, email, senha_hash, user_id)
         )
         self.conn.commit()
+        # O email antigo deixa de apontar para este usuário e o novo passa a apontar
+        EmailResolver.invalidar_em(self.db_file, email=email, user_id=user_id)
     
+    def update_user_password(self, user_id: int, senha_hash: str) -> None:
+        """Atualiza apenas o hash de senha (ex.: rehash transparente no login)."""
+        self.conn.execute(
+            "UPDATE users SET senha_hash = ? WHERE id = ?",
+            (senha_hash, user_id),
+        )
+        self.conn.commit()
+
     # ---------------- GET USER ID BY EMAIL ----------------
     def get_user_id_by_email(self, email: str) -> Optional[int]:
         """
-        Retorna o ID do usuário baseado no email.
+        Retorna o ID do usuário baseado no email (sem diferenciar maiúsculas).
+        Para consultas repetidas prefira EmailResolver, que mantém cache.
         
         Args:
             email: Email do usuário
@@ -127,103 +449,220 @@ class UserDAO:
             ID do usuário ou None se não encontrado
         """
         cursor = self.conn.execute(
-            "SELECT id FROM users WHERE email = ?",
-            (email,)
+            "SELECT id FROM users WHERE email = ? COLLATE NOCASE ORDER BY id LIMIT 1",
+            (email.strip(),)
         )
         row = cursor.fetchone()
         return row[0] if row else None
 
+    def get_user_ids_by_emails(self, emails: Iterable[str]) -> Dict[str, int]:
+        """
+        Versão em lote de get_user_id_by_email.
+
+        Returns:
+            dict {email em minúsculas: id} apenas para os emails encontrados
+        """
+        emails = list(dict.fromkeys(e.strip().lower() for e in emails if e and e.strip()))
+        encontrados = {}
+        # Lotes abaixo do limite de parâmetros por consulta do SQLite
+        for inicio in range(0, len(emails), 500):
+            lote = emails[inicio:inicio + 500]
+            marcadores = ", ".join("?" * len(lote))
+            cursor = self.conn.execute(
+                f"""
+                SELECT lower(email), MIN(id) FROM users
+                WHERE email COLLATE NOCASE IN ({marcadores})
+                GROUP BY lower(email)
+                """,
+                lote,
+            )
+            encontrados.update(cursor.fetchall())
+        return encontrados
+
+
+class EmailResolver:
+    """
+    Resolve email -> ID de usuário na validação e no processamento de
+    compartilhamentos, sem repetir a consulta à tabela users a cada chamada.
+
+    Mantém um cache LRU limitado, com chaves normalizadas (strip + lower).
+    Só guarda emails encontrados: um email sem usuário volta a ser
+    consultado, já que a conta pode ser criada a qualquer momento (inclusive
+    por outro processo). UserDAO invalida as entradas afetadas ao cadastrar
+    um usuário ou alterar o email de um perfil.
+    Há uma instância por arquivo de banco, obtida com EmailResolver.para().
+    """
+
+    _instancias = {}
+    _instancias_lock = threading.Lock()
+
+    def __init__(self, db_file: str = "database.sqlite", capacidade: int = 512):
+        self.db_file = db_file
+        self.capacidade = capacidade
+        self._cache = OrderedDict()  # email normalizado -> id
+        self._geracao = 0  # muda a cada invalidação; descarta consultas concorrentes
+        self._lock = threading.Lock()
+
+    @classmethod
+    def para(cls, db_file: str = "database.sqlite") -> "EmailResolver":
+        """Retorna o resolvedor compartilhado do arquivo de banco."""
+        with cls._instancias_lock:
+            resolvedor = cls._instancias.get(db_file)
+            if resolvedor is None:
+                resolvedor = cls._instancias[db_file] = cls(db_file)
+            return resolvedor
+
+    @classmethod
+    def invalidar_em(cls, db_file: str, email: Optional[str] = None, user_id: Optional[int] = None) -> None:
+        """Invalida entradas do resolvedor do arquivo, se ele já foi criado."""
+        resolvedor = cls._instancias.get(db_file)
+        if resolvedor is not None:
+            resolvedor.invalidar(email=email, user_id=user_id)
+
+    @staticmethod
+    def normalizar(email: Optional[str]) -> str:
+        return (email or "").strip().lower()
+
+    # ---------------- CONSULTA ----------------
+    def resolver(self, email: str) -> Optional[int]:
+        """Retorna o ID do usuário com esse email, ou None se não existir."""
+        chave = self.normalizar(email)
+        if not chave:
+            return None
+
+        with self._lock:
+            if chave in self._cache:
+                self._cache.move_to_end(chave)
+                return self._cache[chave]
+            geracao = self._geracao
+
+        user_id = UserDAO(self.db_file).get_user_id_by_email(chave)
+        self._guardar({chave: user_id}, geracao)
+        return user_id
+
+    def resolver_varios(self, emails: Iterable[str]) -> Dict[str, Optional[int]]:
+        """
+        Resolve vários emails de uma vez; os que não estão em cache são
+        buscados em uma única consulta.
+
+        Returns:
+            dict {email normalizado: id ou None}
+        """
+        resultado = {}
+        faltantes = []
+        with self._lock:
+            for chave in dict.fromkeys(map(self.normalizar, emails)):
+                if not chave:
+                    continue
+                if chave in self._cache:
+                    self._cache.move_to_end(chave)
+                    resultado[chave] = self._cache[chave]
+                else:
+                    faltantes.append(chave)
+            geracao = self._geracao
+
+        if faltantes:
+            encontrados = UserDAO(self.db_file).get_user_ids_by_emails(faltantes)
+            novos = {chave: encontrados.get(chave) for chave in faltantes}
+            self._guardar(novos, geracao)
+            resultado.update(novos)
+        return resultado
+
+    # ---------------- CACHE ----------------
+    def invalidar(self, email: Optional[str] = None, user_id: Optional[int] = None) -> None:
+        """Remove o email informado e todas as entradas que apontam para user_id."""
+        with self._lock:
+            self._geracao += 1
+            if email:
+                self._cache.pop(self.normalizar(email), None)
+            if user_id is not None:
+                for chave in [c for c, valor in self._cache.items() if valor == user_id]:
+                    del self._cache[chave]
+
+    def limpar(self) -> None:
+        with self._lock:
+            self._geracao += 1
+            self._cache.clear()
+
+    def _guardar(self, entradas: dict, geracao: int) -> None:
+        with self._lock:
+            if geracao != self._geracao:
+                # Houve invalidação durante a consulta: o resultado pode estar desatualizado
+                return
+            for chave, user_id in entradas.items():
+                if user_id is None:
+                    continue
+                self._cache[chave] = user_id
+                self._cache.move_to_end(chave)
+            while len(self._cache) > self.capacidade:
+                self._cache.popitem(last=False)
+
 class PagamentosDAO:
     """DAO para gerenciar pagamentos no banco de dados."""
     
     def __init__(self, db_file="database.sqlite", user_id=None):
-        self.conn = sqlite3.connect(db_file)
+        self.db_file = db_file
         self.user_id = user_id
-        self._drop_and_create_table()
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Conexão da thread atual, obtida do ConnectionManager."""
+        return ConnectionManager.get_connection(self.db_file)
     
     def set_user_id(self, user_id):
         """Define o ID do usuário para filtrar operações."""
         self.user_id = user_id
     
-    def _drop_and_create_table(self):
-        """Recria a tabela para aplicar as alterações no schema."""
-        # Verifica se a tabela existe
-        cursor = self.conn.execute("""
-            SELECT name FROM sqlite_master 
-            WHERE type='table' AND name='pagamentos'
-        """)
-        if cursor.fetchone():
-            # Verifica coluna user_id
-            cursor = self.conn.execute("PRAGMA table_info(pagamentos)")
-            columns = [row[1] for row in cursor.fetchall()]
-            
-            if 'user_id' not in columns:
-                # Se não tem user_id, dropa a tabela
-                self.conn.execute("DROP TABLE pagamentos")
-                self.conn.commit()
-                dados_antigos = []
-            else:
-                # Se já tem user_id, mantém dados
-                cursor = self.conn.execute("SELECT * FROM pagamentos")
-                dados_antigos = cursor.fetchall()
-                self.conn.execute("DROP TABLE pagamentos")
-                self.conn.commit()
-        else:
-            dados_antigos = []
-
-        # Cria nova tabela com user_id
-        query = """
-        CREATE TABLE pagamentos (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            user_id INTEGER NOT NULL,
-            nome TEXT NOT NULL,
-            vencimento TEXT,
-            forma_pagamento TEXT NOT NULL,
-            FOREIGN KEY (user_id) REFERENCES users (id)
-        )
-        """
-        self.conn.execute(query)
-        
-        # Restaura dados antigos se tiverem user_id
-        if dados_antigos and len(dados_antigos[0]) >= 5:
-            self.conn.executemany(
-                "INSERT INTO pagamentos (id, user_id, nome, vencimento, forma_pagamento) VALUES (?, ?, ?, ?, ?)",
-                dados_antigos
-            )
-        
-        self.conn.commit()
-    
     def add_pagamento(self, pagamento):
         """Adiciona um novo pagamento ao banco."""
         if self.user_id is None:
             raise ValueError("user_id não definido no PagamentosDAO")
         
         query = """
-            INSERT INTO pagamentos (user_id, nome, vencimento, forma_pagamento)
-            VALUES (?, ?, ?, ?)
+            INSERT INTO pagamentos (user_id, nome, nome_chave, vencimento, forma_pagamento)
+            VALUES (?, ?, ?, ?, ?)
         """
-        cursor = self.conn.execute(
-            query,
-            (
-                self.user_id,
-                pagamento.nome,
-                pagamento.vencimento.isoformat() if pagamento.vencimento else None,
-                pagamento.forma_de_pagamento.value
+        with _traduz_nome_duplicado(self.conn):
+            cursor = self.conn.execute(
+                query,
+                (
+                    self.user_id,
+                    pagamento.nome,
+                    chave_nome(pagamento.nome),
+                    pagamento.vencimento.isoformat() if pagamento.vencimento else None,
+                    pagamento.forma_de_pagamento.value
+                )
             )
-        )
-        self.conn.commit()
-        return cursor.lastrowid
+            self.conn.commit()
+            return cursor.lastrowid
     
+    def existe_nome(self, nome: str, ignorar_id: Optional[int] = None) -> bool:
+        """
+        Indica se o usuário já tem um pagamento com esse nome sem diferenciar
+        maiúsculas de minúsculas: compara nome_chave (NFC + casefold, ver
+        chave_nome), pelo índice único (user_id, nome_chave).
+        """
+        if self.user_id is None:
+            raise ValueError("user_id não definido no PagamentosDAO")
+
+        row = self.conn.execute(
+            "SELECT id FROM pagamentos WHERE user_id = ? AND nome_chave = ?",
+            (self.user_id, chave_nome(nome)),
+        ).fetchone()
+        return row is not None and row[0] != ignorar_id
+
     def get_all_pagamentos(self):
         """Retorna todos os pagamentos do usuário ordenados por data de vencimento."""
+        return list(self.iter_pagamentos())
+
+    def iter_pagamentos(self, tamanho_lote: int = LOTE_PADRAO) -> Iterator[PagamentoModel]:
+        """Como get_all_pagamentos, mas lendo em lotes (gerador)."""
         if self.user_id is None:
             raise ValueError("user_id não definido no PagamentosDAO")
         
-        from mvc.models.pagamentos_model import PagamentoModel
-        from mvc.models.forma_pagamento_enum import FormaPagamento
-        from datetime import datetime
-
-        cursor = self.conn.execute(
+        cursor = _consultar(
+            self.conn,
+            _linha_pagamento,
             """
             SELECT id, nome, vencimento, forma_pagamento
             FROM pagamentos
@@ -232,21 +671,69 @@ class PagamentosDAO:
             """,
             (self.user_id,)
         )
-        
-        pagamentos = []
-        for row in cursor.fetchall():
-            # Converte data se não for None
-            vencimento = datetime.fromisoformat(row[2]).date() if row[2] else None
-            pagamento = PagamentoModel(
-                nome=row[1],
-                vencimento=vencimento,
-                forma_de_pagamento=FormaPagamento(row[3])
-            )
-            setattr(pagamento, 'id', row[0])
-            pagamentos.append(pagamento)
-        
-        return pagamentos
+        return _em_lotes(cursor, tamanho_lote)
     
+    def get_pagina_pagamentos(self, limite: int = PAGINA_PADRAO, apos: Optional[tuple] = None) -> tuple:
+        """
+        Página de pagamentos do usuário na ordem de get_all_pagamentos
+        (sem vencimento primeiro, depois por data), desempatada por id.
+
+        Args:
+            limite: quantidade máxima de itens
+            apos: cursor (vencimento_iso ou None, id) devolvido pela página anterior
+
+        Returns:
+            tuple: (lista de PagamentoModel, cursor da próxima página ou None)
+        """
+        if self.user_id is None:
+            raise ValueError("user_id não definido no PagamentosDAO")
+
+        base = "SELECT id, nome, vencimento, forma_pagamento FROM pagamentos WHERE user_id = ?"
+        params = [self.user_id]
+        if apos is None:
+            linhas = _consultar(
+                self.conn, _linha_pagamento, f"{base} ORDER BY vencimento, id LIMIT ?", [*params, limite + 1]
+            ).fetchall()
+        else:
+            vencimento, pagamento_id = apos
+            if vencimento is None:
+                linhas = _consultar(
+                    self.conn, _linha_pagamento,
+                    f"{base} AND vencimento IS NULL AND id > ? ORDER BY id LIMIT ?",
+                    [*params, pagamento_id, limite + 1]
+                ).fetchall()
+                if len(linhas) <= limite:
+                    # Acabaram os sem vencimento: continua pelos datados
+                    linhas += _consultar(
+                        self.conn, _linha_pagamento,
+                        f"{base} AND vencimento IS NOT NULL ORDER BY vencimento, id LIMIT ?",
+                        [*params, limite + 1 - len(linhas)]
+                    ).fetchall()
+            else:
+                linhas = _consultar(
+                    self.conn, _linha_pagamento,
+                    f"{base} AND (vencimento, id) > (?, ?) ORDER BY vencimento, id LIMIT ?",
+                    [*params, vencimento, pagamento_id, limite + 1]
+                ).fetchall()
+
+        return _mesclar_paginas(
+            [linhas], limite,
+            chave=lambda p: (p.vencimento.isoformat() if p.vencimento else None, p.id),
+            ordem=lambda p: (p.vencimento is not None, p.vencimento or date.min, p.id),
+        )
+
+    def get_pagamento_by_id(self, pagamento_id: int):
+        """Retorna o pagamento do usuário com esse ID, ou None."""
+        if self.user_id is None:
+            raise ValueError("user_id não definido no PagamentosDAO")
+
+        return _consultar(
+            self.conn,
+            _linha_pagamento,
+            "SELECT id, nome, vencimento, forma_pagamento FROM pagamentos WHERE id = ? AND user_id = ?",
+            (pagamento_id, self.user_id)
+        ).fetchone()
+
     def update_pagamento(self, pagamento_id, pagamento):
         """Atualiza um pagamento existente."""
         if self.user_id is None:
@@ -254,20 +741,22 @@ class PagamentosDAO:
         
         query = """
             UPDATE pagamentos
-            SET nome = ?, vencimento = ?, forma_pagamento = ?
+            SET nome = ?, nome_chave = ?, vencimento = ?, forma_pagamento = ?
             WHERE id = ? AND user_id = ?
         """
-        self.conn.execute(
-            query,
-            (
-                pagamento.nome,
-                pagamento.vencimento.isoformat() if pagamento.vencimento else None,
-                pagamento.forma_de_pagamento.value,
-                pagamento_id,
-                self.user_id
+        with _traduz_nome_duplicado(self.conn):
+            self.conn.execute(
+                query,
+                (
+                    pagamento.nome,
+                    chave_nome(pagamento.nome),
+                    pagamento.vencimento.isoformat() if pagamento.vencimento else None,
+                    pagamento.forma_de_pagamento.value,
+                    pagamento_id,
+                    self.user_id
+                )
             )
-        )
-        self.conn.commit()
+            self.conn.commit()
     
     def delete_pagamento(self, pagamento_id):
         """Remove um pagamento do banco."""
@@ -285,151 +774,27 @@ class AssinaturasDAO:
     
     def __init__(self, db_file="database.sqlite"):
         self.db_file = db_file
-        with sqlite3.connect(self.db_file) as conn:
-            self._create_table(conn)
-            self._create_compartilhamentos_table(conn)
-    
-    def _create_table(self, conn):
-        query = """
-        CREATE TABLE IF NOT EXISTS assinaturas (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            user_id INTEGER NOT NULL,
-            nome TEXT NOT NULL,
-            data_vencimento TEXT NOT NULL,
-            valor REAL NOT NULL,
-            periodicidade TEXT NOT NULL,
-            categoria TEXT NOT NULL,
-            forma_pagamento TEXT NOT NULL,
-            usuario_compartilhado TEXT,
-            login TEXT,
-            senha TEXT,
-            favorito INTEGER DEFAULT 0,
-            status TEXT NOT NULL DEFAULT 'Ativo',
-            created_at TEXT,
-            FOREIGN KEY (user_id) REFERENCES users (id)
-        )
-        """
-        conn.execute(query)
-        conn.commit()
-        
-        # Garante coluna favorito
-        self._ensure_favorito_column(conn)
-        self._ensure_status_column(conn)
-        self._ensure_created_at_column(conn)
-        self._ensure_categoria_column(conn)
-    
-    def _ensure_favorito_column(self, conn):
-        """Adiciona coluna favorito se não existir."""
-        cur = conn.execute("PRAGMA table_info(assinaturas)")
-        cols = {row[1] for row in cur.fetchall()}
-        if "favorito" not in cols:
-            conn.execute(
-                "ALTER TABLE assinaturas ADD COLUMN favorito INTEGER DEFAULT 0"
-            )
-            conn.commit()
-    
-    def _ensure_status_column(self, conn):
-        """Adiciona coluna status se não existir."""
-        cur = conn.execute("PRAGMA table_info(assinaturas)")
-        cols = {row[1] for row in cur.fetchall()}
-        if "status" not in cols:
-            conn.execute(
-                "ALTER TABLE assinaturas ADD COLUMN status TEXT NOT NULL DEFAULT 'Ativo'"
-            )
-            conn.commit()
-    
-    def _ensure_created_at_column(self, conn):
-        """Adiciona coluna created_at se não existir."""
-        cur = conn.execute("PRAGMA table_info(assinaturas)")
-        cols = {row[1] for row in cur.fetchall()}
-        if "created_at" not in cols:
-            # SQLite não permite DEFAULT CURRENT_TIMESTAMP em ALTER TABLE
-            # Usa data fixa como fallback
-            conn.execute(
-                "ALTER TABLE assinaturas ADD COLUMN created_at TEXT"
-            )
-            # Atualiza registros existentes com a data atual
-            conn.execute(
-                "UPDATE assinaturas SET created_at = ? WHERE created_at IS NULL",
-                (datetime.now().isoformat(),)
-            )
-            conn.commit()
-    
-    def _ensure_categoria_column(self, conn):
-        """Renomeia coluna tag para categoria se necessário."""
-        cur = conn.execute("PRAGMA table_info(assinaturas)")
-        cols = {row[1] for row in cur.fetchall()}
-        
-        if "tag" in cols and "categoria" not in cols:
-            # SQLite não suporta RENAME COLUMN antes da versão 3.25.0
-            # Vamos criar uma nova tabela e migrar os dados
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS assinaturas_new (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    user_id INTEGER NOT NULL,
-                    nome TEXT NOT NULL,
-                    data_vencimento TEXT NOT NULL,
-                    valor REAL NOT NULL,
-                    periodicidade TEXT NOT NULL,
-                    categoria TEXT NOT NULL,
-                    forma_pagamento TEXT NOT NULL,
-                    usuario_compartilhado TEXT,
-                    login TEXT,
-                    senha TEXT,
-                    favorito INTEGER DEFAULT 0,
-                    status TEXT NOT NULL DEFAULT 'Ativo',
-                    created_at TEXT,
-                    FOREIGN KEY (user_id) REFERENCES users (id)
-                )
-            """)
-            
-            # Copiar dados da tabela antiga para a nova
-            conn.execute("""
-                INSERT INTO assinaturas_new 
-                (id, user_id, nome, data_vencimento, valor, periodicidade, categoria, 
-                 forma_pagamento, usuario_compartilhado, login, senha, favorito, status, created_at)
-                SELECT id, user_id, nome, data_vencimento, valor, periodicidade, tag,
-                       forma_pagamento, usuario_compartilhado, login, senha, favorito, status, created_at
-                FROM assinaturas
-            """)
-            
-            # Remover tabela antiga e renomear a nova
-            conn.execute("DROP TABLE assinaturas")
-            conn.execute("ALTER TABLE assinaturas_new RENAME TO assinaturas")
-            conn.commit()
-    
-    def _create_compartilhamentos_table(self, conn):
-        """Cria tabela para gerenciar compartilhamentos de assinaturas."""
-        query = """
-        CREATE TABLE IF NOT EXISTS assinaturas_compartilhadas (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            assinatura_id INTEGER NOT NULL,
-            user_id_proprietario INTEGER NOT NULL,
-            user_id_compartilhado INTEGER NOT NULL,
-            compartilhado_em TEXT NOT NULL,
-            FOREIGN KEY (assinatura_id) REFERENCES assinaturas (id) ON DELETE CASCADE,
-            FOREIGN KEY (user_id_proprietario) REFERENCES users (id) ON DELETE CASCADE,
-            FOREIGN KEY (user_id_compartilhado) REFERENCES users (id) ON DELETE CASCADE,
-            UNIQUE(assinatura_id, user_id_compartilhado)
-        )
-        """
-        conn.execute(query)
-        conn.commit()
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Conexão da thread atual, obtida do ConnectionManager."""
+        return ConnectionManager.get_connection(self.db_file)
     
     def adicionar_assinatura(self, assinatura):
         """Adiciona uma nova assinatura ao banco."""
         query = """
             INSERT INTO assinaturas 
-            (user_id, nome, data_vencimento, valor, periodicidade, categoria, 
+            (user_id, nome, nome_chave, data_vencimento, valor, periodicidade, categoria, 
              forma_pagamento, usuario_compartilhado, login, senha, favorito, status, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         """
-        with sqlite3.connect(self.db_file) as conn:
+        with _traduz_nome_duplicado(self.conn), self.conn as conn:
             cursor = conn.execute(
                 query,
                 (
                     assinatura.user_id,
                     assinatura.nome,
+                    chave_nome(assinatura.nome),
                     assinatura.data_vencimento,
                     assinatura.valor,
                     assinatura.periodicidade,
@@ -443,49 +808,122 @@ class AssinaturasDAO:
                     assinatura.created_at if hasattr(assinatura, 'created_at') else datetime.now().isoformat()
                 )
             )
-            conn.commit()
             return cursor.lastrowid
     
     def obter_assinaturas_por_usuario(self, user_id: int) -> List:
         """Retorna todas as assinaturas de um usuário, favoritas primeiro."""
-        from mvc.models.assinaturas_model import Assinatura
-        with sqlite3.connect(self.db_file) as conn:
-            cursor = conn.execute(
-                """
-                SELECT id, user_id, nome, data_vencimento, valor, periodicidade, 
-                       categoria, forma_pagamento, usuario_compartilhado, login, senha, favorito, status, created_at
-                FROM assinaturas 
-                WHERE user_id = ?
-                ORDER BY favorito DESC, data_vencimento
-                """,
-                (user_id,)
+        return list(self.iterar_assinaturas_por_usuario(user_id))
+
+    def iterar_assinaturas_por_usuario(self, user_id: int, tamanho_lote: int = LOTE_PADRAO) -> Iterator[Assinatura]:
+        """Como obter_assinaturas_por_usuario, mas lendo em lotes (gerador)."""
+        cursor = _consultar(
+            self.conn,
+            _linha_assinatura,
+            f"""
+            SELECT {COLUNAS_ASSINATURA}
+            FROM assinaturas
+            WHERE user_id = ?
+            ORDER BY favorito DESC, data_vencimento
+            """,
+            (user_id,)
+        )
+        return _em_lotes(cursor, tamanho_lote)
+
+    def existe_nome(self, user_id: int, nome: str, ignorar_id: Optional[int] = None) -> bool:
+        """
+        Indica se o usuário já tem uma assinatura com esse nome sem diferenciar
+        maiúsculas de minúsculas: compara nome_chave (NFC + casefold, ver
+        chave_nome), pelo índice único (user_id, nome_chave).
+        """
+        row = self.conn.execute(
+            "SELECT id FROM assinaturas WHERE user_id = ? AND nome_chave = ?",
+            (user_id, chave_nome(nome)),
+        ).fetchone()
+        return row is not None and row[0] != ignorar_id
+
+    def obter_assinatura_por_id(self, assinatura_id: int, user_id: Optional[int] = None):
+        """
+        Busca uma assinatura pela chave primária.
+
+        Args:
+            assinatura_id: ID da assinatura
+            user_id: se informado, só retorna a assinatura se pertencer a este usuário
+
+        Returns:
+            Assinatura ou None se não existir (ou não for do usuário)
+        """
+        query = f"""
+            SELECT {COLUNAS_ASSINATURA}
+            FROM assinaturas
+            WHERE id = ?
+        """
+        params = [assinatura_id]
+        if user_id is not None:
+            query += " AND user_id = ?"
+            params.append(user_id)
+
+        return _consultar(self.conn, _linha_assinatura, query, params).fetchone()
+
+    def obter_vencidas(self, user_id: int, hoje_iso: str) -> List[tuple]:
+        """
+        Retorna (id, data_vencimento, periodicidade) das assinaturas ativas
+        do usuário com vencimento anterior a hoje_iso (AAAA-MM-DD).
+        """
+        return list(self.iterar_vencidas(user_id, hoje_iso))
+
+    def iterar_vencidas(self, user_id: int, hoje_iso: str, tamanho_lote: int = LOTE_PADRAO) -> Iterator[tuple]:
+        """Como obter_vencidas, mas lendo em lotes (gerador)."""
+        cursor = self.conn.execute(
+            """
+            SELECT id, data_vencimento, periodicidade
+            FROM assinaturas
+            WHERE user_id = ? AND status = 'Ativo' AND data_vencimento < ?
+            """,
+            (user_id, hoje_iso)
+        )
+        return _em_lotes(cursor, tamanho_lote)
+
+    def atualizar_vencimentos(self, pares: List[tuple]) -> None:
+        """Grava vários vencimentos [(nova_data_iso, id), ...] em uma única transação."""
+        with self.conn as conn:
+            conn.executemany(
+                "UPDATE assinaturas SET data_vencimento = ? WHERE id = ?",
+                pares
             )
-            
-            assinaturas = []
-            for row in cursor.fetchall():
-                assinatura = Assinatura(
-                    nome=row[2],
-                    data_vencimento=row[3],
-                    valor=row[4],
-                    periodicidade=row[5],
-                    categoria=row[6],
-                    forma_pagamento=row[7],
-                    usuario_compartilhado=row[8],
-                    login=row[9],
-                    senha=row[10],
-                    favorito=row[11],
-                    assinatura_id=row[0],
-                    user_id=row[1],
-                    status=row[12] if len(row) > 12 else 'Ativo',
-                    created_at=row[13] if len(row) > 13 else None
-                )
-                assinaturas.append(assinatura)
-            
-            return assinaturas
-    
+
+    def obter_totais_ativos(self, user_id: int) -> tuple:
+        """
+        Soma, no banco, o valor das assinaturas ativas que cabem ao usuário.
+        Próprias não compartilhadas contam o valor integral; próprias
+        compartilhadas e compartilhadas comigo contam metade.
+
+        Returns:
+            tuple: (total, quantidade de assinaturas ativas)
+        """
+        row = self.conn.execute(
+            """
+            SELECT COALESCE(SUM(parcela), 0), COUNT(*)
+            FROM (
+                SELECT CASE
+                           WHEN TRIM(COALESCE(usuario_compartilhado, '')) <> '' THEN valor / 2.0
+                           ELSE valor
+                       END AS parcela
+                FROM assinaturas
+                WHERE user_id = ? AND status = 'Ativo'
+                UNION ALL
+                SELECT a.valor / 2.0
+                FROM assinaturas_compartilhadas ac
+                INNER JOIN assinaturas a ON a.id = ac.assinatura_id
+                WHERE ac.user_id_compartilhado = ? AND a.status = 'Ativo'
+            )
+            """,
+            (user_id, user_id)
+        ).fetchone()
+        return float(row[0]), row[1]
+
     def alternar_favorito(self, assinatura_id: int):
         """Alterna o status de favorito."""
-        with sqlite3.connect(self.db_file) as conn:
+        with self.conn as conn:
             # Get current status
             cursor = conn.execute(
                 "SELECT favorito FROM assinaturas WHERE id = ?",
@@ -502,7 +940,7 @@ class AssinaturasDAO:
     
     def deletar_assinatura(self, assinatura_id: int):
         """Remove uma assinatura do banco."""
-        with sqlite3.connect(self.db_file) as conn:
+        with self.conn as conn:
             conn.execute(
                 "DELETE FROM assinaturas WHERE id = ?",
                 (assinatura_id,)
@@ -513,16 +951,17 @@ class AssinaturasDAO:
         """Atualiza uma assinatura existente."""
         query = """
             UPDATE assinaturas
-            SET nome = ?, data_vencimento = ?, valor = ?, periodicidade = ?,
+            SET nome = ?, nome_chave = ?, data_vencimento = ?, valor = ?, periodicidade = ?,
                 categoria = ?, forma_pagamento = ?, usuario_compartilhado = ?,
                 login = ?, senha = ?, favorito = ?, status = ?
             WHERE id = ?
         """
-        with sqlite3.connect(self.db_file) as conn:
+        with _traduz_nome_duplicado(self.conn), self.conn as conn:
             conn.execute(
                 query,
                 (
                     assinatura.nome,
+                    chave_nome(assinatura.nome),
                     assinatura.data_vencimento,
                     assinatura.valor,
                     assinatura.periodicidade,
@@ -536,7 +975,6 @@ class AssinaturasDAO:
                     assinatura.id
                 )
             )
-            conn.commit()
     
     def compartilhar_assinatura(self, assinatura_id: int, user_id_proprietario: int, user_id_compartilhado: int):
         """
@@ -547,7 +985,7 @@ class AssinaturasDAO:
             user_id_proprietario: ID do proprietário
             user_id_compartilhado: ID do usuário que receberá acesso readonly
         """
-        with sqlite3.connect(self.db_file) as conn:
+        with self.conn as conn:
             # Primeiro remove compartilhamento existente (se houver)
             conn.execute(
                 "DELETE FROM assinaturas_compartilhadas WHERE assinatura_id = ? AND user_id_compartilhado = ?",
@@ -568,13 +1006,48 @@ class AssinaturasDAO:
     
     def remover_compartilhamento(self, assinatura_id: int, user_id_compartilhado: int):
         """Remove um compartilhamento."""
-        with sqlite3.connect(self.db_file) as conn:
+        with self.conn as conn:
             conn.execute(
                 "DELETE FROM assinaturas_compartilhadas WHERE assinatura_id = ? AND user_id_compartilhado = ?",
                 (assinatura_id, user_id_compartilhado)
             )
             conn.commit()
     
+    def obter_pagina(self, user_id: int, limite: int = PAGINA_PADRAO, apos: Optional[tuple] = None) -> tuple:
+        """
+        Página das assinaturas visíveis ao usuário (próprias + compartilhadas
+        comigo), favoritas primeiro, depois por vencimento e id.
+
+        Args:
+            user_id: ID do usuário
+            limite: quantidade máxima de itens
+            apos: cursor devolvido pela página anterior (None = primeira página)
+
+        Returns:
+            tuple: (lista de Assinatura, cursor da próxima página ou None)
+        """
+        proprias = _pagina_favorito_vencimento(
+            self.conn, _linha_assinatura,
+            f"SELECT {COLUNAS_ASSINATURA} FROM assinaturas WHERE user_id = ?",
+            [user_id], limite + 1, apos
+        )
+        # Compartilhados comigo: busca pelo índice do destinatário, mas ordena num
+        # B-tree temporário (as colunas da ordem ficam na outra tabela). O custo é
+        # limitado à quantidade de itens compartilhados com o usuário.
+        compartilhadas = _pagina_favorito_vencimento(
+            self.conn, _linha_assinatura_compartilhada,
+            f"""
+            SELECT {_colunas_com_alias(COLUNAS_ASSINATURA, "a")}
+            FROM assinaturas a
+            INNER JOIN assinaturas_compartilhadas ac ON a.id = ac.assinatura_id
+            WHERE ac.user_id_compartilhado = ?
+            """,
+            [user_id], limite + 1, apos, alias="a"
+        )
+        return _mesclar_paginas(
+            [proprias, compartilhadas], limite, chave_favorito_vencimento, _ordem_favorito_vencimento
+        )
+
     def obter_assinaturas_compartilhadas_comigo(self, user_id: int) -> List:
         """
         Retorna assinaturas que foram compartilhadas COMIGO (readonly).
@@ -585,223 +1058,172 @@ class AssinaturasDAO:
         Returns:
             Lista de assinaturas compartilhadas (com flag is_readonly=True)
         """
-        from mvc.models.assinaturas_model import Assinatura
-        with sqlite3.connect(self.db_file) as conn:
-            cursor = conn.execute(
-                """
-                SELECT a.id, a.user_id, a.nome, a.data_vencimento, a.valor, a.periodicidade, 
-                       a.categoria, a.forma_pagamento, a.usuario_compartilhado, a.login, a.senha, 
-                       a.favorito, a.status, a.created_at
-                FROM assinaturas a
-                INNER JOIN assinaturas_compartilhadas ac ON a.id = ac.assinatura_id
-                WHERE ac.user_id_compartilhado = ?
-                ORDER BY a.data_vencimento
-                """,
-                (user_id,)
-            )
-            
-            assinaturas = []
-            for row in cursor.fetchall():
-                assinatura = Assinatura(
-                    nome=row[2],
-                    data_vencimento=row[3],
-                    valor=row[4],
-                    periodicidade=row[5],
-                    categoria=row[6],
-                    forma_pagamento=row[7],
-                    usuario_compartilhado=row[8],
-                    login=row[9],
-                    senha=row[10],
-                    favorito=row[11],
-                    assinatura_id=row[0],
-                    user_id=row[1],
-                    status=row[12] if len(row) > 12 else 'Ativo',
-                    created_at=row[13] if len(row) > 13 else None
-                )
-                assinatura.is_readonly = True  # Marca como apenas leitura
-                assinaturas.append(assinatura)
-            
-            return assinaturas
+        return list(self.iterar_assinaturas_compartilhadas_comigo(user_id))
+
+    def iterar_assinaturas_compartilhadas_comigo(self, user_id: int, tamanho_lote: int = LOTE_PADRAO) -> Iterator[Assinatura]:
+        """Como obter_assinaturas_compartilhadas_comigo, mas lendo em lotes (gerador)."""
+        cursor = _consultar(
+            self.conn,
+            _linha_assinatura_compartilhada,
+            f"""
+            SELECT {_colunas_com_alias(COLUNAS_ASSINATURA, "a")}
+            FROM assinaturas a
+            INNER JOIN assinaturas_compartilhadas ac ON a.id = ac.assinatura_id
+            WHERE ac.user_id_compartilhado = ?
+            ORDER BY a.data_vencimento
+            """,
+            (user_id,)
+        )
+        return _em_lotes(cursor, tamanho_lote)
 
 class ContratosDAO:
     """DAO para gerenciar contratos no banco de dados."""
     
     def __init__(self, db_file="database.sqlite"):
-        self.conn = sqlite3.connect(db_file)
-        self._create_table()
-        self._migrate_schema()
-        self._ensure_status_column()
-        self._ensure_forma_pagamento_column()
-        
-    def _create_table(self):
-        query = """
-        CREATE TABLE IF NOT EXISTS contratos (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            user_id INTEGER NOT NULL,
-            nome TEXT NOT NULL,
-            data_vencimento TEXT NOT NULL,
-            valor REAL NOT NULL,
-            periodicidade TEXT NOT NULL,
-            categoria TEXT NOT NULL,
-            usuario_compartilhado TEXT,
-            favorito INTEGER DEFAULT 0,
-            status TEXT NOT NULL DEFAULT 'Ativo',
-            FOREIGN KEY (user_id) REFERENCES users (id)
-        )
-        """
-        self.conn.execute(query)
-        self.conn.commit()
-        
-        # Cria tabela de compartilhamento de contratos
-        query_compartilhados = """
-        CREATE TABLE IF NOT EXISTS contratos_compartilhados (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            contrato_id INTEGER NOT NULL,
-            user_id_proprietario INTEGER NOT NULL,
-            user_id_compartilhado INTEGER NOT NULL,
-            FOREIGN KEY (contrato_id) REFERENCES contratos (id) ON DELETE CASCADE,
-            FOREIGN KEY (user_id_proprietario) REFERENCES users (id),
-            FOREIGN KEY (user_id_compartilhado) REFERENCES users (id),
-            UNIQUE(contrato_id, user_id_compartilhado)
-        )
-        """
-        self.conn.execute(query_compartilhados)
-        self.conn.commit()
+        self.db_file = db_file
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Conexão da thread atual, obtida do ConnectionManager."""
+        return ConnectionManager.get_connection(self.db_file)
         
-        self._ensure_favorito_column()
-    
-    def _ensure_favorito_column(self):
-        """Adiciona coluna favorito se não existir."""
-        cur = self.conn.execute("PRAGMA table_info(contratos)")
-        cols = {row[1] for row in cur.fetchall()}
-        if "favorito" not in cols:
-            self.conn.execute(
-                "ALTER TABLE contratos ADD COLUMN favorito INTEGER DEFAULT 0"
-            )
-            self.conn.commit()
-    
-    def _ensure_status_column(self):
-        """Adiciona coluna status se não existir."""
-        cur = self.conn.execute("PRAGMA table_info(contratos)")
-        cols = {row[1] for row in cur.fetchall()}
-        if "status" not in cols:
-            self.conn.execute(
-                "ALTER TABLE contratos ADD COLUMN status TEXT NOT NULL DEFAULT 'Ativo'"
-            )
-            self.conn.commit()
-    
-    def _ensure_forma_pagamento_column(self):
-        """Adiciona coluna forma_pagamento se não existir."""
-        cur = self.conn.execute("PRAGMA table_info(contratos)")
-        cols = {row[1] for row in cur.fetchall()}
-        if "forma_pagamento" not in cols:
-            self.conn.execute(
-                "ALTER TABLE contratos ADD COLUMN forma_pagamento TEXT"
-            )
-            self.conn.commit()
-    
-    def _migrate_schema(self):
-        """Migra schema antigo removendo colunas forma_pagamento/login/senha se existirem, e renomeia tag para categoria."""
-        try:
-            cur = self.conn.execute("PRAGMA table_info(contratos)")
-            cols = [row[1] for row in cur.fetchall()]
-            if not cols:
-                return
-            
-            # Verifica se precisa migrar tag para categoria ou remover colunas antigas
-            needs_migration = any(c in cols for c in ("forma_pagamento", "login", "senha", "tag"))
-            
-            if needs_migration:
-                # Determina qual coluna usar (tag ou categoria)
-                categoria_col = "tag" if "tag" in cols else "categoria"
-                
-                self.conn.execute(
-                    """
-                    CREATE TABLE contratos_new (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        user_id INTEGER NOT NULL,
-                        nome TEXT NOT NULL,
-                        data_vencimento TEXT NOT NULL,
-                        valor REAL NOT NULL,
-                        periodicidade TEXT NOT NULL,
-                        categoria TEXT NOT NULL,
-                        usuario_compartilhado TEXT,
-                        favorito INTEGER DEFAULT 0,
-                        status TEXT NOT NULL DEFAULT 'Ativo',
-                        FOREIGN KEY (user_id) REFERENCES users (id)
-                    )
-                    """
-                )
-                self.conn.execute(
-                    f"""
-                    INSERT INTO contratos_new (
-                        id, user_id, nome, data_vencimento, valor, periodicidade, categoria, usuario_compartilhado, favorito, status
-                    )
-                    SELECT 
-                        id, user_id, nome, data_vencimento, valor, periodicidade, {categoria_col}, usuario_compartilhado, COALESCE(favorito, 0), 'Ativo'
-                    FROM contratos
-                    """
-                )
-                self.conn.execute("DROP TABLE contratos")
-                self.conn.execute("ALTER TABLE contratos_new RENAME TO contratos")
-                self.conn.commit()
-        except Exception:
-            # Se algo falhar, não quebrar app; mantém tabela como está
-            pass
-    
     def add_contrato(self, contrato):
         """Adiciona um novo contrato ao banco."""
-        cursor = self.conn.execute(
-            """
-            INSERT INTO contratos (
-                user_id, nome, data_vencimento, valor, periodicidade, categoria, forma_pagamento, usuario_compartilhado, favorito, status
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                contrato.user_id,
-                contrato.nome,
-                contrato.data_vencimento,
-                contrato.valor,
-                contrato.periodicidade if isinstance(contrato.periodicidade, str) else contrato.periodicidade.value,
-                contrato.categoria if isinstance(contrato.categoria, str) else contrato.categoria.value,
-                getattr(contrato, "forma_pagamento", ""),
-                contrato.usuario_compartilhado,
-                1 if getattr(contrato, "favorito", False) else 0,
-                contrato.status.value if hasattr(contrato, 'status') else 'Ativo',
-            ),
-        )
-        self.conn.commit()
-        return cursor.lastrowid
+        with _traduz_nome_duplicado(self.conn):
+            cursor = self.conn.execute(
+                """
+                INSERT INTO contratos (
+                    user_id, nome, nome_chave, data_vencimento, valor, periodicidade, categoria, forma_pagamento, usuario_compartilhado, favorito, status
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    contrato.user_id,
+                    contrato.nome,
+                    chave_nome(contrato.nome),
+                    contrato.data_vencimento,
+                    contrato.valor,
+                    contrato.periodicidade if isinstance(contrato.periodicidade, str) else contrato.periodicidade.value,
+                    contrato.categoria if isinstance(contrato.categoria, str) else contrato.categoria.value,
+                    getattr(contrato, "forma_pagamento", ""),
+                    contrato.usuario_compartilhado,
+                    1 if getattr(contrato, "favorito", False) else 0,
+                    contrato.status.value if hasattr(contrato, 'status') else 'Ativo',
+                ),
+            )
+            self.conn.commit()
+            return cursor.lastrowid
     
-    def get_contratos_by_user(self, user_id: int) -> List:
+    def get_contratos_by_user(self, user_id: int) -> List[Contrato]:
         """Retorna todos os contratos de um usuário, favoritos primeiro."""
-        cursor = self.conn.execute(
-            """
-            SELECT id, user_id, nome, data_vencimento, valor, periodicidade, categoria, forma_pagamento, usuario_compartilhado, favorito, status
+        return list(self.iter_contratos_by_user(user_id))
+
+    def iter_contratos_by_user(self, user_id: int, tamanho_lote: int = LOTE_PADRAO) -> Iterator[Contrato]:
+        """Como get_contratos_by_user, mas lendo em lotes (gerador)."""
+        cursor = _consultar(
+            self.conn,
+            _linha_contrato,
+            f"""
+            SELECT {COLUNAS_CONTRATO}
             FROM contratos
             WHERE user_id = ?
             ORDER BY favorito DESC, id DESC
             """,
             (user_id,),
         )
-        rows = cursor.fetchall()
-        return [
-            {
-                "id": r[0],
-                "user_id": r[1],
-                "nome": r[2],
-                "data_vencimento": r[3],
-                "valor": r[4],
-                "periodicidade": r[5],
-                "categoria": r[6],
-                "forma_pagamento": r[7] or "",
-                "usuario_compartilhado": r[8] or "",
-                "favorito": bool(r[9]),
-                "status": r[10],
-            }
-            for r in rows
-        ]
-    
+        return _em_lotes(cursor, tamanho_lote)
+
+    def existe_nome(self, user_id: int, nome: str, ignorar_id: Optional[int] = None) -> bool:
+        """
+        Indica se o usuário já tem um contrato com esse nome sem diferenciar
+        maiúsculas de minúsculas: compara nome_chave (NFC + casefold, ver
+        chave_nome), pelo índice único (user_id, nome_chave).
+        """
+        row = self.conn.execute(
+            "SELECT id FROM contratos WHERE user_id = ? AND nome_chave = ?",
+            (user_id, chave_nome(nome)),
+        ).fetchone()
+        return row is not None and row[0] != ignorar_id
+
+    def get_contrato_by_id(self, contrato_id: int, user_id: Optional[int] = None) -> Optional[Contrato]:
+        """
+        Busca um contrato pela chave primária.
+
+        Args:
+            contrato_id: ID do contrato
+            user_id: se informado, só retorna o contrato se pertencer a este usuário
+
+        Returns:
+            Contrato ou None se não existir (ou não for do usuário)
+        """
+        query = f"""
+            SELECT {COLUNAS_CONTRATO}
+            FROM contratos
+            WHERE id = ?
+        """
+        params = [contrato_id]
+        if user_id is not None:
+            query += " AND user_id = ?"
+            params.append(user_id)
+
+        return _consultar(self.conn, _linha_contrato, query, params).fetchone()
+
+    def get_vencidos(self, user_id: int, hoje_iso: str) -> List[tuple]:
+        """
+        Retorna (id, data_vencimento, periodicidade) dos contratos ativos
+        do usuário com vencimento anterior a hoje_iso (AAAA-MM-DD).
+        """
+        return list(self.iter_vencidos(user_id, hoje_iso))
+
+    def iter_vencidos(self, user_id: int, hoje_iso: str, tamanho_lote: int = LOTE_PADRAO) -> Iterator[tuple]:
+        """Como get_vencidos, mas lendo em lotes (gerador)."""
+        cursor = self.conn.execute(
+            """
+            SELECT id, data_vencimento, periodicidade
+            FROM contratos
+            WHERE user_id = ? AND status = 'Ativo' AND data_vencimento < ?
+            """,
+            (user_id, hoje_iso),
+        )
+        return _em_lotes(cursor, tamanho_lote)
+
+    def update_vencimentos(self, pares: List[tuple]) -> None:
+        """Grava vários vencimentos [(nova_data_iso, id), ...] em uma única transação."""
+        with self.conn as conn:
+            conn.executemany(
+                "UPDATE contratos SET data_vencimento = ? WHERE id = ?",
+                pares,
+            )
+
+    def get_totais_ativos(self, user_id: int) -> tuple:
+        """
+        Soma, no banco, o valor dos contratos ativos que cabem ao usuário.
+        Próprios não compartilhados contam o valor integral; próprios
+        compartilhados e compartilhados comigo contam metade.
+
+        Returns:
+            tuple: (total, quantidade de contratos ativos)
+        """
+        row = self.conn.execute(
+            """
+            SELECT COALESCE(SUM(parcela), 0), COUNT(*)
+            FROM (
+                SELECT CASE
+                           WHEN TRIM(COALESCE(usuario_compartilhado, '')) <> '' THEN valor / 2.0
+                           ELSE valor
+                       END AS parcela
+                FROM contratos
+                WHERE user_id = ? AND status = 'Ativo'
+                UNION ALL
+                SELECT c.valor / 2.0
+                FROM contratos_compartilhados cc
+                INNER JOIN contratos c ON c.id = cc.contrato_id
+                WHERE cc.user_id_compartilhado = ? AND c.status = 'Ativo'
+            )
+            """,
+            (user_id, user_id),
+        ).fetchone()
+        return float(row[0]), row[1]
+
     def toggle_favorito(self, contrato_id: int):
         """Alterna o status de favorito."""
         cursor = self.conn.execute(
@@ -827,27 +1249,29 @@ class ContratosDAO:
     
     def update_contrato(self, contrato):
         """Atualiza um contrato existente."""
-        self.conn.execute(
-            """
-            UPDATE contratos
-            SET nome = ?, data_vencimento = ?, valor = ?, periodicidade = ?, categoria = ?, forma_pagamento = ?, usuario_compartilhado = ?, favorito = ?, status = ?
-            WHERE id = ? AND user_id = ?
-            """,
-            (
-                contrato.nome,
-                contrato.data_vencimento,
-                contrato.valor,
-                contrato.periodicidade if isinstance(contrato.periodicidade, str) else contrato.periodicidade.value,
-                contrato.categoria if isinstance(contrato.categoria, str) else contrato.categoria.value,
-                getattr(contrato, "forma_pagamento", ""),
-                contrato.usuario_compartilhado,
-                1 if getattr(contrato, "favorito", False) else 0,
-                contrato.status.value if hasattr(contrato, 'status') else 'Ativo',
-                contrato.id,
-                contrato.user_id,
-            ),
-        )
-        self.conn.commit()
+        with _traduz_nome_duplicado(self.conn):
+            self.conn.execute(
+                """
+                UPDATE contratos
+                SET nome = ?, nome_chave = ?, data_vencimento = ?, valor = ?, periodicidade = ?, categoria = ?, forma_pagamento = ?, usuario_compartilhado = ?, favorito = ?, status = ?
+                WHERE id = ? AND user_id = ?
+                """,
+                (
+                    contrato.nome,
+                    chave_nome(contrato.nome),
+                    contrato.data_vencimento,
+                    contrato.valor,
+                    contrato.periodicidade if isinstance(contrato.periodicidade, str) else contrato.periodicidade.value,
+                    contrato.categoria if isinstance(contrato.categoria, str) else contrato.categoria.value,
+                    getattr(contrato, "forma_pagamento", ""),
+                    contrato.usuario_compartilhado,
+                    1 if getattr(contrato, "favorito", False) else 0,
+                    contrato.status.value if hasattr(contrato, 'status') else 'Ativo',
+                    contrato.id,
+                    contrato.user_id,
+                ),
+            )
+            self.conn.commit()
     
     def compartilhar_contrato(self, contrato_id: int, user_id_proprietario: int, user_id_compartilhado: int):
         """Compartilha um contrato com outro usuário."""
@@ -873,12 +1297,52 @@ class ContratosDAO:
         self.conn.commit()
         return True
     
+    def get_pagina(self, user_id: int, limite: int = PAGINA_PADRAO, apos: Optional[tuple] = None) -> tuple:
+        """
+        Página dos contratos visíveis ao usuário (próprios + compartilhados
+        comigo), favoritos primeiro, depois por vencimento e id.
+
+        Args:
+            user_id: ID do usuário
+            limite: quantidade máxima de itens
+            apos: cursor devolvido pela página anterior (None = primeira página)
+
+        Returns:
+            tuple: (lista de Contrato, cursor da próxima página ou None)
+        """
+        proprios = _pagina_favorito_vencimento(
+            self.conn, _linha_contrato,
+            f"SELECT {COLUNAS_CONTRATO} FROM contratos WHERE user_id = ?",
+            [user_id], limite + 1, apos
+        )
+        # Compartilhados comigo: busca pelo índice do destinatário, mas ordena num
+        # B-tree temporário (as colunas da ordem ficam na outra tabela). O custo é
+        # limitado à quantidade de itens compartilhados com o usuário.
+        compartilhados = _pagina_favorito_vencimento(
+            self.conn, _linha_contrato_compartilhado,
+            f"""
+            SELECT {_colunas_com_alias(COLUNAS_CONTRATO, "c")}
+            FROM contratos c
+            INNER JOIN contratos_compartilhados cc ON c.id = cc.contrato_id
+            WHERE cc.user_id_compartilhado = ?
+            """,
+            [user_id], limite + 1, apos, alias="c"
+        )
+        return _mesclar_paginas(
+            [proprios, compartilhados], limite, chave_favorito_vencimento, _ordem_favorito_vencimento
+        )
+
     def obter_contratos_compartilhados_comigo(self, user_id: int) -> List:
         """Retorna contratos compartilhados comigo (readonly)."""
-        cursor = self.conn.execute(
-            """
-            SELECT c.id, c.user_id, c.nome, c.data_vencimento, c.valor, c.periodicidade, 
-                   c.categoria, c.forma_pagamento, c.usuario_compartilhado, c.favorito, c.status
+        return list(self.iterar_contratos_compartilhados_comigo(user_id))
+
+    def iterar_contratos_compartilhados_comigo(self, user_id: int, tamanho_lote: int = LOTE_PADRAO) -> Iterator[Contrato]:
+        """Como obter_contratos_compartilhados_comigo, mas lendo em lotes (gerador)."""
+        cursor = _consultar(
+            self.conn,
+            _linha_contrato_compartilhado,
+            f"""
+            SELECT {_colunas_com_alias(COLUNAS_CONTRATO, "c")}
             FROM contratos c
             INNER JOIN contratos_compartilhados cc ON c.id = cc.contrato_id
             WHERE cc.user_id_compartilhado = ?
@@ -886,26 +1350,4 @@ class ContratosDAO:
             """,
             (user_id,),
         )
-        rows = cursor.fetchall()
-        
-        contratos = []
-        for r in rows:
-            from mvc.models.contratos_model import Contrato
-            from mvc.models.status_enum import Status
-            contrato = Contrato(
-                contrato_id=r[0],
-                user_id=r[1],
-                nome=r[2],
-                data_vencimento=r[3],
-                valor=r[4],
-                periodicidade=r[5],
-                categoria=r[6],
-                forma_pagamento=r[7] or "",
-                usuario_compartilhado=r[8] or "",
-                favorito=r[9],
-                status=Status(r[10]) if r[10] else Status.ATIVO
-            )
-            contrato.is_readonly = True
-            contratos.append(contrato)
-        
-        return contratos
+        return _em_lotes(cursor, tamanho_lote)
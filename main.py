@@ -1,5 +1,7 @@
 import os
 import tkinter as tk
+from dao import ConnectionManager
+from mvc.controllers.background_executor import encerrar_executores
 from mvc.models.usuario_login_model import UserLoginModel
 from mvc.controllers.navegacao_controller import NavegacaoController
 from mvc.controllers.usuario_login_controller import UserLoginController
@@ -9,13 +11,17 @@ from mvc.controllers.usuario_controller import UsuarioController
 os.chdir(os.path.dirname(__file__))
 
 if __name__ == "__main__":
+    # aplica migrações pendentes antes de abrir qualquer tela
+    ConnectionManager.preparar_banco()
+
     root = tk.Tk()
     model = UserLoginModel()
     navegacao = NavegacaoController(root)
     controller = UserLoginController(model, navegacao)
     
-    # passa o model para o controller de usuário para que ele saiba quem está logado
-    usuario_controller = UsuarioController(model)
+    # o usuário logado é vinculado ao controller pela sessão criada no login
+    usuario_controller = UsuarioController()
     navegacao.usuario_controller = usuario_controller  # passa o controller para a navegação
     navegacao.home_view.on_logout = controller.logout
     root.mainloop()
+    encerrar_executores()
@@ -0,0 +1,405 @@
+# migrations.py
+"""
+Migrações versionadas do banco de dados.
+
+A versão do schema fica gravada em ``PRAGMA user_version``. Cada migração
+da lista MIGRACOES roda uma única vez por arquivo de banco, em ordem, e
+grava o seu número ao terminar. Os DAOs não fazem mais nenhuma verificação
+de schema: abrir uma tela não executa consultas de schema.
+
+Para adicionar uma alteração de schema, crie uma função que recebe a
+conexão e acrescente-a ao final de MIGRACOES com o próximo número.
+"""
+import sqlite3
+import unicodedata
+from datetime import datetime
+
+
+# ---------------- HELPERS ----------------
+def _colunas(conn: sqlite3.Connection, tabela: str) -> set:
+    """Retorna o conjunto de colunas da tabela (vazio se não existir)."""
+    cur = conn.execute(f"PRAGMA table_info({tabela})")
+    return {row[1] for row in cur.fetchall()}
+
+
+# ---------------- MIGRAÇÕES ----------------
+def _migracao_001_users(conn: sqlite3.Connection) -> None:
+    """Cria a tabela users e garante as colunas de limite (bancos antigos)."""
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS users (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            nome TEXT NOT NULL,
+            email TEXT UNIQUE NOT NULL,
+            senha_hash TEXT NOT NULL,
+            limite_assinaturas REAL NOT NULL DEFAULT 0,
+            limite_contratos REAL NOT NULL DEFAULT 0
+        )
+        """
+    )
+    cols = _colunas(conn, "users")
+    if "limite_assinaturas" not in cols:
+        conn.execute("ALTER TABLE users ADD COLUMN limite_assinaturas REAL NOT NULL DEFAULT 0")
+    if "limite_contratos" not in cols:
+        conn.execute("ALTER TABLE users ADD COLUMN limite_contratos REAL NOT NULL DEFAULT 0")
+
+
+def _migracao_002_assinaturas(conn: sqlite3.Connection) -> None:
+    """Cria assinaturas/assinaturas_compartilhadas e atualiza bancos antigos."""
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS assinaturas (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id INTEGER NOT NULL,
+            nome TEXT NOT NULL,
+            data_vencimento TEXT NOT NULL,
+            valor REAL NOT NULL,
+            periodicidade TEXT NOT NULL,
+            categoria TEXT NOT NULL,
+            forma_pagamento TEXT NOT NULL,
+            usuario_compartilhado TEXT,
+            login TEXT,
+            senha TEXT,
+            favorito INTEGER DEFAULT 0,
+            status TEXT NOT NULL DEFAULT 'Ativo',
+            created_at TEXT,
+            FOREIGN KEY (user_id) REFERENCES users (id)
+        )
+        """
+    )
+
+    cols = _colunas(conn, "assinaturas")
+    if "favorito" not in cols:
+        conn.execute("ALTER TABLE assinaturas ADD COLUMN favorito INTEGER DEFAULT 0")
+    if "status" not in cols:
+        conn.execute("ALTER TABLE assinaturas ADD COLUMN status TEXT NOT NULL DEFAULT 'Ativo'")
+    if "created_at" not in cols:
+        # SQLite não permite DEFAULT CURRENT_TIMESTAMP em ALTER TABLE
+        conn.execute("ALTER TABLE assinaturas ADD COLUMN created_at TEXT")
+        conn.execute(
+            "UPDATE assinaturas SET created_at = ? WHERE created_at IS NULL",
+            (datetime.now().isoformat(),)
+        )
+
+    # Renomeia tag -> categoria recriando a tabela (SQLite < 3.25 não tem RENAME COLUMN)
+    if "tag" in cols and "categoria" not in cols:
+        conn.execute(
+            """
+            CREATE TABLE assinaturas_new (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                user_id INTEGER NOT NULL,
+                nome TEXT NOT NULL,
+                data_vencimento TEXT NOT NULL,
+                valor REAL NOT NULL,
+                periodicidade TEXT NOT NULL,
+                categoria TEXT NOT NULL,
+                forma_pagamento TEXT NOT NULL,
+                usuario_compartilhado TEXT,
+                login TEXT,
+                senha TEXT,
+                favorito INTEGER DEFAULT 0,
+                status TEXT NOT NULL DEFAULT 'Ativo',
+                created_at TEXT,
+                FOREIGN KEY (user_id) REFERENCES users (id)
+            )
+            """
+        )
+        conn.execute(
+            """
+            INSERT INTO assinaturas_new
+            (id, user_id, nome, data_vencimento, valor, periodicidade, categoria,
+             forma_pagamento, usuario_compartilhado, login, senha, favorito, status, created_at)
+            SELECT id, user_id, nome, data_vencimento, valor, periodicidade, tag,
+                   forma_pagamento, usuario_compartilhado, login, senha, favorito, status, created_at
+            FROM assinaturas
+            """
+        )
+        conn.execute("DROP TABLE assinaturas")
+        conn.execute("ALTER TABLE assinaturas_new RENAME TO assinaturas")
+
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS assinaturas_compartilhadas (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            assinatura_id INTEGER NOT NULL,
+            user_id_proprietario INTEGER NOT NULL,
+            user_id_compartilhado INTEGER NOT NULL,
+            compartilhado_em TEXT NOT NULL,
+            FOREIGN KEY (assinatura_id) REFERENCES assinaturas (id) ON DELETE CASCADE,
+            FOREIGN KEY (user_id_proprietario) REFERENCES users (id) ON DELETE CASCADE,
+            FOREIGN KEY (user_id_compartilhado) REFERENCES users (id) ON DELETE CASCADE,
+            UNIQUE(assinatura_id, user_id_compartilhado)
+        )
+        """
+    )
+
+
+def _migracao_003_contratos(conn: sqlite3.Connection) -> None:
+    """Cria contratos/contratos_compartilhados e atualiza bancos antigos."""
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS contratos (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id INTEGER NOT NULL,
+            nome TEXT NOT NULL,
+            data_vencimento TEXT NOT NULL,
+            valor REAL NOT NULL,
+            periodicidade TEXT NOT NULL,
+            categoria TEXT NOT NULL,
+            usuario_compartilhado TEXT,
+            favorito INTEGER DEFAULT 0,
+            status TEXT NOT NULL DEFAULT 'Ativo',
+            forma_pagamento TEXT,
+            FOREIGN KEY (user_id) REFERENCES users (id)
+        )
+        """
+    )
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS contratos_compartilhados (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            contrato_id INTEGER NOT NULL,
+            user_id_proprietario INTEGER NOT NULL,
+            user_id_compartilhado INTEGER NOT NULL,
+            FOREIGN KEY (contrato_id) REFERENCES contratos (id) ON DELETE CASCADE,
+            FOREIGN KEY (user_id_proprietario) REFERENCES users (id),
+            FOREIGN KEY (user_id_compartilhado) REFERENCES users (id),
+            UNIQUE(contrato_id, user_id_compartilhado)
+        )
+        """
+    )
+
+    cols = _colunas(conn, "contratos")
+    if "favorito" not in cols:
+        conn.execute("ALTER TABLE contratos ADD COLUMN favorito INTEGER DEFAULT 0")
+        cols.add("favorito")
+
+    # Schema antigo: remove login/senha e renomeia tag -> categoria
+    if any(c in cols for c in ("login", "senha", "tag")):
+        categoria_col = "tag" if "tag" in cols else "categoria"
+        status_col = "status" if "status" in cols else "'Ativo'"
+        forma_col = "forma_pagamento" if "forma_pagamento" in cols else "NULL"
+        conn.execute(
+            """
+            CREATE TABLE contratos_new (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                user_id INTEGER NOT NULL,
+                nome TEXT NOT NULL,
+                data_vencimento TEXT NOT NULL,
+                valor REAL NOT NULL,
+                periodicidade TEXT NOT NULL,
+                categoria TEXT NOT NULL,
+                usuario_compartilhado TEXT,
+                favorito INTEGER DEFAULT 0,
+                status TEXT NOT NULL DEFAULT 'Ativo',
+                forma_pagamento TEXT,
+                FOREIGN KEY (user_id) REFERENCES users (id)
+            )
+            """
+        )
+        conn.execute(
+            f"""
+            INSERT INTO contratos_new (
+                id, user_id, nome, data_vencimento, valor, periodicidade, categoria,
+                usuario_compartilhado, favorito, status, forma_pagamento
+            )
+            SELECT
+                id, user_id, nome, data_vencimento, valor, periodicidade, {categoria_col},
+                usuario_compartilhado, COALESCE(favorito, 0), COALESCE({status_col}, 'Ativo'), {forma_col}
+            FROM contratos
+            """
+        )
+        conn.execute("DROP TABLE contratos")
+        conn.execute("ALTER TABLE contratos_new RENAME TO contratos")
+        cols = _colunas(conn, "contratos")
+
+    if "status" not in cols:
+        conn.execute("ALTER TABLE contratos ADD COLUMN status TEXT NOT NULL DEFAULT 'Ativo'")
+    if "forma_pagamento" not in cols:
+        conn.execute("ALTER TABLE contratos ADD COLUMN forma_pagamento TEXT")
+
+
+def _migracao_004_pagamentos(conn: sqlite3.Connection) -> None:
+    """Cria a tabela pagamentos; versões antigas sem user_id são descartadas."""
+    cols = _colunas(conn, "pagamentos")
+    if cols and "user_id" not in cols:
+        # Sem user_id não há como saber a quem pertencem os registros
+        conn.execute("DROP TABLE pagamentos")
+
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS pagamentos (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id INTEGER NOT NULL,
+            nome TEXT NOT NULL,
+            vencimento TEXT,
+            forma_pagamento TEXT NOT NULL,
+            FOREIGN KEY (user_id) REFERENCES users (id)
+        )
+        """
+    )
+
+
+def _migracao_005_datas_iso(conn: sqlite3.Connection) -> None:
+    """Converte data_vencimento de DD/MM/AAAA para ISO (AAAA-MM-DD)."""
+    for tabela in ("assinaturas", "contratos"):
+        conn.execute(
+            f"""
+            UPDATE {tabela}
+            SET data_vencimento = substr(data_vencimento, 7, 4) || '-' ||
+                                  substr(data_vencimento, 4, 2) || '-' ||
+                                  substr(data_vencimento, 1, 2)
+            WHERE data_vencimento LIKE '__/__/____'
+            """
+        )
+
+
+# Índices dos caminhos de acesso por usuário e das tabelas de compartilhamento.
+# users.email dispensa índice próprio: a restrição UNIQUE já cria um.
+INDICES = [
+    ("idx_assinaturas_user_status_venc", "assinaturas", "user_id, status, data_vencimento"),
+    ("idx_contratos_user_status_venc", "contratos", "user_id, status, data_vencimento"),
+    ("idx_pagamentos_user_venc", "pagamentos", "user_id, vencimento"),
+    ("idx_assinaturas_comp_destino", "assinaturas_compartilhadas", "user_id_compartilhado, assinatura_id"),
+    ("idx_contratos_comp_destino", "contratos_compartilhados", "user_id_compartilhado, contrato_id"),
+]
+
+
+def _migracao_006_indices(conn: sqlite3.Connection) -> None:
+    """Cria os índices de INDICES e atualiza as estatísticas do planejador."""
+    for nome, tabela, colunas in INDICES:
+        conn.execute(f"CREATE INDEX IF NOT EXISTS {nome} ON {tabela} ({colunas})")
+    conn.execute("ANALYZE")
+
+
+def chave_nome(nome: str) -> str:
+    """
+    Chave de comparação de nomes gravada em nome_chave: sem espaços nas
+    pontas, em NFC e com casefold() (que, ao contrário do lower() do
+    SQLite, também trata acentos: "Água" e "água" têm a mesma chave).
+    """
+    return unicodedata.normalize("NFC", nome.strip()).casefold()
+
+
+# Tabelas cujo nome deve ser único por usuário, sem diferenciar maiúsculas.
+# A versão 7 indexava lower(nome); a 10 passou para a coluna nome_chave.
+NOMES_UNICOS = [
+    ("ux_assinaturas_user_nome", "assinaturas"),
+    ("ux_contratos_user_nome", "contratos"),
+    ("ux_pagamentos_user_nome", "pagamentos"),
+]
+
+
+def _migracao_007_nomes_unicos(conn: sqlite3.Connection) -> None:
+    """Renomeia duplicatas antigas com o sufixo " (id)" e cria os índices únicos."""
+    for indice, tabela in NOMES_UNICOS:
+        # Mantém o registro mais antigo de cada grupo; repete caso o novo nome também colida
+        while True:
+            cur = conn.execute(
+                f"""
+                UPDATE {tabela}
+                SET nome = nome || ' (' || id || ')'
+                WHERE id NOT IN (
+                    SELECT MIN(id) FROM {tabela} GROUP BY user_id, lower(nome)
+                )
+                """
+            )
+            if cur.rowcount == 0:
+                break
+        conn.execute(f"CREATE UNIQUE INDEX IF NOT EXISTS {indice} ON {tabela} (user_id, lower(nome))")
+
+
+def _migracao_008_email_nocase(conn: sqlite3.Connection) -> None:
+    """Índice para buscar usuários por email sem diferenciar maiúsculas."""
+    # O índice do UNIQUE(email) usa a colação BINARY e não atende "email = ? COLLATE NOCASE"
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_users_email_nocase ON users (email COLLATE NOCASE)")
+
+
+def _migracao_009_paginacao(conn: sqlite3.Connection) -> None:
+    """Índices na ordem das listas paginadas (favorito DESC, data_vencimento, id)."""
+    for tabela in ("assinaturas", "contratos"):
+        # A paginação por keyset compara favorito por igualdade; NULL ficaria de fora
+        conn.execute(f"UPDATE {tabela} SET favorito = 0 WHERE favorito IS NULL")
+        # O id (rowid) já faz parte de toda entrada de índice, desempatando a ordem
+        conn.execute(
+            f"CREATE INDEX IF NOT EXISTS idx_{tabela}_user_fav_venc "
+            f"ON {tabela} (user_id, favorito DESC, data_vencimento)"
+        )
+
+
+def _migracao_010_nome_chave(conn: sqlite3.Connection) -> None:
+    """
+    Troca os índices únicos (user_id, lower(nome)) por (user_id, nome_chave),
+    preenchendo nome_chave com chave_nome() em Python. Nomes que só agora
+    colidem (ex.: "Água"/"água") ganham o sufixo " (id)", como na versão 7.
+    """
+    for indice, tabela in NOMES_UNICOS:
+        if "nome_chave" not in _colunas(conn, tabela):
+            conn.execute(f"ALTER TABLE {tabela} ADD COLUMN nome_chave TEXT")
+        conn.execute(f"DROP INDEX IF EXISTS {indice}")
+
+        vistos = set()
+        alteracoes = []
+        for id_, user_id, nome in conn.execute(f"SELECT id, user_id, nome FROM {tabela} ORDER BY id"):
+            # Mantém o registro mais antigo de cada grupo
+            while (user_id, chave_nome(nome)) in vistos:
+                nome = f"{nome} ({id_})"
+            vistos.add((user_id, chave_nome(nome)))
+            alteracoes.append((nome, chave_nome(nome), id_))
+        conn.executemany(f"UPDATE {tabela} SET nome = ?, nome_chave = ? WHERE id = ?", alteracoes)
+
+        conn.execute(f"CREATE UNIQUE INDEX {indice} ON {tabela} (user_id, nome_chave)")
+
+
+# (versão, descrição, função) — nunca altere ou reordene migrações já publicadas
+MIGRACOES = [
+    (1, "tabela users com limites", _migracao_001_users),
+    (2, "tabelas de assinaturas", _migracao_002_assinaturas),
+    (3, "tabelas de contratos", _migracao_003_contratos),
+    (4, "tabela pagamentos", _migracao_004_pagamentos),
+    (5, "data_vencimento em ISO", _migracao_005_datas_iso),
+    (6, "índices por usuário e de compartilhamento", _migracao_006_indices),
+    (7, "nomes únicos por usuário", _migracao_007_nomes_unicos),
+    (8, "índice de email sem diferenciar maiúsculas", _migracao_008_email_nocase),
+    (9, "índices das listas paginadas", _migracao_009_paginacao),
+    (10, "nomes únicos por chave casefold", _migracao_010_nome_chave),
+]
+
+
+# ---------------- ENGINE ----------------
+def versao_atual(conn: sqlite3.Connection) -> int:
+    """Retorna a versão de schema gravada no banco."""
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def aplicar_migracoes(conn: sqlite3.Connection) -> int:
+    """
+    Aplica, em ordem, as migrações ainda não executadas neste banco.
+    Cada migração roda em sua própria transação junto com a atualização
+    de user_version, então uma falha não deixa o schema pela metade.
+
+    Returns:
+        int: versão do schema após a execução
+    """
+    versao = versao_atual(conn)
+    pendentes = [m for m in MIGRACOES if m[0] > versao]
+    if not pendentes:
+        return versao
+
+    if conn.in_transaction:
+        conn.commit()
+
+    for numero, _descricao, migracao in pendentes:
+        # IMMEDIATE garante que outro processo não aplique a mesma migração em paralelo
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if versao_atual(conn) >= numero:
+                conn.rollback()
+                continue
+            migracao(conn)
+            conn.execute(f"PRAGMA user_version = {int(numero)}")
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+    return versao_atual(conn)
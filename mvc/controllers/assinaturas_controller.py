@@ -1,59 +1,29 @@
-from dao import AssinaturasDAO
+from dao import AssinaturasDAO, NomeDuplicadoError
 from mvc.models.assinaturas_model import Assinatura
 from mvc.models.periodicidade_enum import Periodicidade
 from mvc.models.assinatura_categoria_enum import CategoriaAssinatura
 from mvc.models.status_enum import Status
 from datetime import datetime
-from tkinter import messagebox
+from mvc.datas import para_iso
+from mvc.renovacao import calcular_renovacao, renovar_vencidos
+from mvc.controllers.lista_paginada_controller import ListaPaginadaController
 
 
-class AssinaturasController:
+class AssinaturasController(ListaPaginadaController):
     """Controller para Assinaturas."""
     
-    def __init__(self, view, user_id=None, usuario_controller=None):
-        self.view = view
-        self.user_id = user_id
-        self.usuario_controller = usuario_controller
-        self.dao = AssinaturasDAO()
-        self.view.controller = self
-        
-        from mvc.controllers.pagamentos_controller import PagamentosController
-        self.pagamentos_controller = PagamentosController(user_id=user_id)
-        
-        self.view.set_combo_values(
-            [p.value for p in Periodicidade],
-            [c.value for c in CategoriaAssinatura],
-            self.pagamentos_controller.obter_nomes_metodos_pagamento()
-        )
-        
-        self._carregar_assinaturas()
+    CHAVE_LISTA = "assinaturas:lista"
+    CHAVE_MAIS = "assinaturas:mais"
+    CHAVE_FORMAS = "assinaturas:formas_pagamento"
     
-    # Métodos de mensagens
-    
-    @staticmethod
-    def mostrar_sucesso(titulo: str, mensagem: str):
-        """Exibe mensagem de sucesso com ícone verde."""
-        messagebox.showinfo(f"✅ {titulo}", mensagem)
+    CATEGORIAS = CategoriaAssinatura
+    DESCRICAO = "as assinaturas"
+    MENSAGEM_NOME_DUPLICADO = "Já existe uma assinatura com esse nome! Tente outro."
     
-    @staticmethod
-    def mostrar_erro(titulo: str, mensagem: str):
-        """Exibe mensagem de erro com ícone vermelho."""
-        messagebox.showerror(f"❌ {titulo}", mensagem)
+    def __init__(self, view, user_id=None, usuario_controller=None, executor=None):
+        super().__init__(view, AssinaturasDAO(), user_id, usuario_controller, executor)
     
-    @staticmethod
-    def mostrar_aviso(titulo: str, mensagem: str):
-        """Exibe mensagem de aviso com ícone amarelo."""
-        messagebox.showwarning(f"⚠️ {titulo}", mensagem)
-    
-    @staticmethod
-    def confirmar_acao(titulo: str, mensagem: str) -> bool:
-        """
-        Exibe diálogo de confirmação.
-        
-        Returns:
-            bool: True se confirmou, False se cancelou
-        """
-        return messagebox.askyesno(f"❓ {titulo}", mensagem)
+    # Métodos de mensagens
     
     def _exibir_erro_campos_obrigatorios(self, mensagem: str):
         """Exibe erro de campos obrigatórios não preenchidos."""
@@ -112,25 +82,14 @@ class AssinaturasController:
     
     # Métodos de negócio
     
-    def _carregar_assinaturas(self):
-        """Carrega e exibe as assinaturas do usuário (próprias + compartilhadas)."""
-        if self.user_id:
-            # Renova assinaturas ativas vencidas
-            self.renovar_todas_assinaturas_ativas()
-            
-            # Busca assinaturas próprias
-            assinaturas_proprias = self.dao.obter_assinaturas_por_usuario(self.user_id)
-            
-            # Busca assinaturas compartilhadas comigo
-            assinaturas_compartilhadas = self.dao.obter_assinaturas_compartilhadas_comigo(self.user_id)
-            
-            # Combina listas
-            todas_assinaturas = assinaturas_proprias + assinaturas_compartilhadas
-            
-            # Ordena favoritos primeiro
-            todas_assinaturas.sort(key=lambda a: (a.favorito != 1, a.data_vencimento))
-            
-            self.view.atualizar_lista(todas_assinaturas)
+    def _buscar_pagina(self, limite, apos):
+        return self.dao.obter_pagina(self.user_id, limite, apos)
+    
+    def _renovar_vencidos(self):
+        self.renovar_todas_assinaturas_ativas()
+    
+    def _calcular_total(self):
+        return self.calcular_total_assinaturas()
     
     def calcular_total_assinaturas(self, assinaturas=None):
         """
@@ -141,8 +100,10 @@ class AssinaturasController:
         - Assinatura própria compartilhada: metade do valor
         - Assinatura compartilhada comigo: metade do valor
         
+        O cálculo é feito por uma única consulta agregada no banco.
+        
         Args:
-            assinaturas: Lista de assinaturas (opcional). Se None, busca do usuário atual.
+            assinaturas: Ignorado; mantido por compatibilidade com as views.
             
         Returns:
             float: Soma total dos valores
@@ -150,35 +111,16 @@ class AssinaturasController:
         if not self.user_id:
             return 0.0
         
-        # Busca assinaturas próprias
-        assinaturas_proprias = self.dao.obter_assinaturas_por_usuario(self.user_id)
-        
-        # Busca compartilhadas comigo
-        assinaturas_compartilhadas = self.dao.obter_assinaturas_compartilhadas_comigo(self.user_id)
-        
-        total = 0.0
-        
-        # Calcula total próprias
-        for assinatura in assinaturas_proprias:
-            if assinatura.status == Status.ATIVO:
-                # Se compartilhou, paga metade
-                if assinatura.usuario_compartilhado and assinatura.usuario_compartilhado.strip():
-                    total += assinatura.valor / 2
-                else:
-                    total += assinatura.valor
-        
-        # Calcula total compartilhadas
-        for assinatura in assinaturas_compartilhadas:
-            if assinatura.status == Status.ATIVO:
-                # Sempre paga metade
-                total += assinatura.valor / 2
-        
+        total, _quantidade = self.dao.obter_totais_ativos(self.user_id)
         return total
     
-    def calcular_diferenca_meta(self):
+    def calcular_diferenca_meta(self, total_ativo=None):
         """
         Calcula a diferença entre a meta de assinaturas e o total de assinaturas ativas.
         
+        Args:
+            total_ativo: total já calculado (None = consulta o banco)
+        
         Returns:
             float: Meta - Total de assinaturas ativas (positivo = dentro da meta, negativo = acima da meta)
         """
@@ -187,7 +129,8 @@ class AssinaturasController:
             return 0.0
         
         meta = float(self.usuario_controller.get_limite_assinaturas())
-        total_ativo = self.calcular_total_assinaturas()
+        if total_ativo is None:
+            total_ativo = self.calcular_total_assinaturas()
         
         return meta - total_ativo
     
@@ -253,18 +196,11 @@ class AssinaturasController:
         if not self.user_id:
             return {'duplicate': False, 'message': ''}
         
-        assinaturas = self.dao.obter_assinaturas_por_usuario(self.user_id)
-        
-        for assinatura in assinaturas:
-            # Ignora própria assinatura ao editar
-            if assinatura_id and assinatura.id == assinatura_id:
-                continue
-            
-            if assinatura.nome.lower() == nome.lower():
-                return {
-                    'duplicate': True,
-                    'message': 'Já existe uma assinatura com esse nome! Tente outro.'
-                }
+        if self.dao.existe_nome(self.user_id, nome, ignorar_id=assinatura_id):
+            return {
+                'duplicate': True,
+                'message': 'Já existe uma assinatura com esse nome! Tente outro.'
+            }
         
         return {'duplicate': False, 'message': ''}
     
@@ -417,9 +353,7 @@ class AssinaturasController:
             return {'success': True, 'error_code': 'OK', 'data': data}
         
         # Busca user_id do email
-        from dao import UserDAO
-        user_dao = UserDAO()
-        user_id_compartilhado = user_dao.get_user_id_by_email(usuario_compartilhado)
+        user_id_compartilhado = self.emails.resolver(usuario_compartilhado)
         
         # Verifica compartilhamento consigo mesmo
         if user_id_compartilhado == self.user_id:
@@ -523,7 +457,7 @@ class AssinaturasController:
             assinatura_id=assinatura_id,
             user_id=self.user_id,
             nome=nome,
-            data_vencimento=data_vencimento,
+            data_vencimento=para_iso(data_vencimento),
             valor=valor,
             periodicidade=periodicidade,
             categoria=categoria,
@@ -555,11 +489,11 @@ class AssinaturasController:
             resultado = self.processar_compartilhamento(assinatura_id, usuario_compartilhado)
             if not resultado['success']:
                 # Se falhar compartilhamento, retorna erro mas operação já foi feita
-                self._carregar_assinaturas()
+                self._carregar_lista()
                 resultado_final = {'success': False, 'message': resultado['message']}
                 return resultado_final
         
-        self._carregar_assinaturas()
+        self._carregar_lista()
         resultado_final = {'success': True, 'message': mensagem_sucesso}
         return resultado_final
     
@@ -589,7 +523,11 @@ class AssinaturasController:
             favorito=0,
             status=Status.ATIVO
         )
-        assinatura_id = self.dao.adicionar_assinatura(assinatura)
+        try:
+            assinatura_id = self.dao.adicionar_assinatura(assinatura)
+        except NomeDuplicadoError:
+            # Outro cadastro com o mesmo nome entrou entre a validação e a gravação
+            return self._erro_nome_duplicado()
         
         resultado = self._finalizar_operacao(
             assinatura_id, 
@@ -612,8 +550,7 @@ class AssinaturasController:
             return {'can_remove': False, 'message': 'Usuário não identificado!'}
         
         # Busca a assinatura APENAS entre as do próprio usuário (não nas compartilhadas)
-        assinaturas_proprias = self.dao.obter_assinaturas_por_usuario(self.user_id)
-        assinatura = next((a for a in assinaturas_proprias if a.id == assinatura_id), None)
+        assinatura = self.dao.obter_assinatura_por_id(assinatura_id, user_id=self.user_id)
         
         if not assinatura:
             # Assinatura não encontrada entre as do usuário = não é proprietário ou não existe
@@ -642,73 +579,14 @@ class AssinaturasController:
         
         # Remove a assinatura
         self.dao.deletar_assinatura(assinatura_id)
-        self._carregar_assinaturas()
+        self._carregar_lista()
         return {'success': True, 'message': 'Assinatura removida com sucesso!'}
     
     def alternar_favorito(self, assinatura_id: int):
         """Alterna o status de favorito de uma assinatura."""
         if self.user_id:
             self.dao.alternar_favorito(assinatura_id)
-            self._carregar_assinaturas()
-    
-    def _ultimo_dia_mes(self, ano: int, mes: int) -> int:
-        """Retorna o último dia do mês."""
-        import calendar
-        return calendar.monthrange(ano, mes)[1]
-    
-    def _calcular_proxima_data(self, data_atual, periodicidade: str):
-        """
-        Calcula a próxima data de vencimento baseado na periodicidade.
-        Extrai lógica de cálculo para evitar duplicação.
-        
-        Args:
-            data_atual: datetime.date - Data atual a ser incrementada
-            periodicidade: str - Periodicidade da assinatura
-            
-        Returns:
-            datetime.date: Próxima data de vencimento
-        """
-        from mvc.models.periodicidade_enum import Periodicidade
-        
-        if periodicidade == Periodicidade.MENSAL.value:
-            # Adiciona 1 mês
-            mes = data_atual.month + 1
-            ano = data_atual.year
-            if mes > 12:
-                mes = 1
-                ano += 1
-            dia = min(data_atual.day, self._ultimo_dia_mes(ano, mes))
-            return data_atual.replace(year=ano, month=mes, day=dia)
-            
-        elif periodicidade == Periodicidade.TRIMESTRAL.value:
-            # Adiciona 3 meses
-            mes = data_atual.month + 3
-            ano = data_atual.year
-            while mes > 12:
-                mes -= 12
-                ano += 1
-            dia = min(data_atual.day, self._ultimo_dia_mes(ano, mes))
-            return data_atual.replace(year=ano, month=mes, day=dia)
-            
-        elif periodicidade == Periodicidade.SEMESTRAL.value:
-            # Adiciona 6 meses
-            mes = data_atual.month + 6
-            ano = data_atual.year
-            if mes > 12:
-                mes -= 12
-                ano += 1
-            dia = min(data_atual.day, self._ultimo_dia_mes(ano, mes))
-            return data_atual.replace(year=ano, month=mes, day=dia)
-            
-        elif periodicidade == Periodicidade.ANUAL.value:
-            # Adiciona 1 ano
-            ano = data_atual.year + 1
-            mes = data_atual.month
-            dia = min(data_atual.day, self._ultimo_dia_mes(ano, mes))
-            return data_atual.replace(year=ano, day=dia)
-        
-        # Periodicidade desconhecida, retorna a mesma data
-        return data_atual
+            self._carregar_lista()
     
     def renovar_vencimento_se_necessario(self, assinatura_id: int):
         """
@@ -725,64 +603,38 @@ class AssinaturasController:
             return False
         
         # Busca a assinatura
-        assinaturas = self.dao.obter_assinaturas_por_usuario(self.user_id)
-        assinatura = next((a for a in assinaturas if a.id == assinatura_id), None)
+        assinatura = self.dao.obter_assinatura_por_id(assinatura_id, user_id=self.user_id)
         
         if not assinatura or assinatura.status != Status.ATIVO:
             return False
         
-        try:
-            # Converte a data de vencimento
-            data_vencimento = datetime.strptime(assinatura.data_vencimento, "%d/%m/%Y").date()
-            hoje = datetime.now().date()
-            
-            # Se a data de vencimento já passou
-            if data_vencimento < hoje:
-                # Continua renovando até que a data seja >= hoje
-                nova_data = data_vencimento
-                while nova_data < hoje:
-                    nova_data = self._calcular_proxima_data(nova_data, assinatura.periodicidade)
-                    
-                    # Segurança contra loop infinito (periodicidade desconhecida)
-                    if nova_data == data_vencimento:
-                        return False
-                
-                # Atualiza a assinatura com a nova data
-                self.editar(
-                    assinatura_id=assinatura.id,
-                    nome=assinatura.nome,
-                    data_vencimento=nova_data.strftime("%d/%m/%Y"),
-                    valor=assinatura.valor,
-                    periodicidade=assinatura.periodicidade,
-                    categoria=assinatura.categoria,
-                    forma_pagamento=assinatura.forma_pagamento,
-                    usuario_compartilhado=assinatura.usuario_compartilhado,
-                    login=assinatura.login,
-                    senha=assinatura.senha,
-                    favorito=assinatura.favorito,
-                    status=assinatura.status
-                )
-                return True
-            
-            return False
-            
-        except ValueError:
-            # Se a data for inválida, não renova
+        nova_data = calcular_renovacao(
+            assinatura.data_vencimento,
+            assinatura.periodicidade,
+            datetime.now().date()
+        )
+        if nova_data is None:
             return False
+        
+        self.dao.atualizar_vencimentos([(para_iso(nova_data), assinatura_id)])
+        return True
     
     def renovar_todas_assinaturas_ativas(self):
         """
         Renova todas as assinaturas ativas que estão vencidas.
-        Chamado ao carregar a lista de assinaturas.
+        Busca só as vencidas, calcula as novas datas e grava tudo em
+        uma única transação. Chamado ao carregar a lista de assinaturas.
+        
+        Returns:
+            dict: resumo de renovar_vencidos ({'renovados', 'ignorados', 'itens'})
         """
         if not self.user_id:
-            return
-        
-        assinaturas = self.dao.obter_assinaturas_por_usuario(self.user_id)
+            return {'renovados': 0, 'ignorados': 0, 'itens': []}
         
-        for assinatura in assinaturas:
-            if assinatura.status == Status.ATIVO:
-                self.renovar_vencimento_se_necessario(assinatura.id)
+        return renovar_vencidos(
+            lambda hoje_iso: self.dao.iterar_vencidas(self.user_id, hoje_iso),
+            self.dao.atualizar_vencimentos
+        )
     
     def editar(
         self,
@@ -814,7 +666,10 @@ class AssinaturasController:
             favorito=favorito,
             status=status
         )
-        self.dao.atualizar_assinatura(assinatura)
+        try:
+            self.dao.atualizar_assinatura(assinatura)
+        except NomeDuplicadoError:
+            return self._erro_nome_duplicado()
         
         return self._finalizar_operacao(
             assinatura_id, 
@@ -858,12 +713,9 @@ class AssinaturasController:
         Returns:
             dict: {'success': bool, 'message': str}
         """
-        from dao import UserDAO
-        user_dao = UserDAO()
-        
         # Normaliza email e busca user_id
         email_normalizado = email_compartilhado.strip().lower()
-        user_id_compartilhado = user_dao.get_user_id_by_email(email_normalizado)
+        user_id_compartilhado = self.emails.resolver(email_normalizado)
         
         # Cria o compartilhamento
         resultado = self._criar_compartilhamento_assinatura(
@@ -0,0 +1,214 @@
+# mvc/controllers/background_executor.py
+import itertools
+import queue
+import sys
+import tkinter as tk
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+
+class BackgroundExecutor:
+    """
+    Executa tarefas lentas (hash de senha, consultas) fora da thread do Tk
+    e entrega o resultado de volta na thread principal.
+
+    O Tk não é thread-safe: as threads do pool apenas colocam o resultado
+    em uma fila, e a própria thread do Tk consome essa fila via widget.after()
+    enquanto houver tarefas pendentes. Os callbacks on_success/on_error
+    sempre rodam na thread principal, podendo mexer na interface.
+
+    Cada tarefa tem uma chave; enquanto uma tarefa com a mesma chave estiver
+    em andamento, novos submits com essa chave são ignorados (ex.: duplo
+    clique em "Login"). Com substituir=True o novo submit vence: a tarefa
+    anterior vira obsoleta e seu resultado é descartado ao chegar (ex.:
+    recarregar uma lista enquanto a carga anterior ainda não terminou).
+    """
+
+    def __init__(self, widget: tk.Misc, max_workers: int = 2, poll_ms: int = 30):
+        self.widget = widget
+        self.poll_ms = poll_ms
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="signum-bg")
+        self._resultados = queue.Queue()
+        self._em_andamento = {}  # chave -> (geração, future, on_success, on_error)
+        self._geracoes = itertools.count(1)
+        self._poll_agendado = False
+
+    # ---------------- API ----------------
+    def submit(self, chave: str, func: Callable, *args,
+               on_success: Optional[Callable] = None,
+               on_error: Optional[Callable] = None,
+               substituir: bool = False, **kwargs) -> bool:
+        """
+        Agenda func(*args, **kwargs) no pool.
+
+        Args:
+            substituir: se já houver tarefa com esta chave, descarta o resultado
+                dela e agenda esta no lugar
+
+        Returns:
+            bool: False se já existe tarefa em andamento com esta chave (submit ignorado)
+        """
+        if chave in self._em_andamento:
+            if not substituir:
+                return False
+            self.cancelar(chave)
+
+        geracao = next(self._geracoes)
+        future = self._pool.submit(func, *args, **kwargs)
+        self._em_andamento[chave] = (geracao, future, on_success, on_error)
+        future.add_done_callback(lambda f: self._resultados.put((chave, geracao, f)))
+        self._agendar_poll()
+        return True
+
+    def cancelar(self, chave: str) -> bool:
+        """
+        Descarta a tarefa com esta chave: se ainda não começou, não roda;
+        se já está rodando, o resultado é ignorado quando chegar.
+
+        Returns:
+            bool: True se havia tarefa em andamento com esta chave
+        """
+        tarefa = self._em_andamento.pop(chave, None)
+        if tarefa is None:
+            return False
+        tarefa[1].cancel()
+        return True
+
+    def is_busy(self, chave: Optional[str] = None) -> bool:
+        """Indica se há tarefa em andamento (com a chave informada, ou qualquer uma)."""
+        if chave is None:
+            return bool(self._em_andamento)
+        return chave in self._em_andamento
+
+    def shutdown(self) -> None:
+        """Descarta callbacks pendentes e encerra o pool sem esperar as tarefas."""
+        self._em_andamento.clear()
+        self._pool.shutdown(wait=False)
+
+    # ---------------- ENTREGA NA THREAD DO TK ----------------
+    def _agendar_poll(self) -> None:
+        if self._poll_agendado:
+            return
+        try:
+            self.widget.after(self.poll_ms, self._poll)
+            self._poll_agendado = True
+        except tk.TclError:
+            # Widget destruído: não há mais para quem entregar resultados
+            self._em_andamento.clear()
+
+    def _poll(self) -> None:
+        self._poll_agendado = False
+        try:
+            while True:
+                try:
+                    chave, geracao, future = self._resultados.get_nowait()
+                except queue.Empty:
+                    break
+
+                tarefa = self._em_andamento.get(chave)
+                if tarefa is None or tarefa[0] != geracao:
+                    # Cancelada ou substituída por um submit mais novo
+                    continue
+                del self._em_andamento[chave]
+                _geracao, _future, on_success, on_error = tarefa
+                self._entregar(future, on_success, on_error)
+        finally:
+            if self._em_andamento:
+                self._agendar_poll()
+
+    def _entregar(self, future, on_success: Optional[Callable], on_error: Optional[Callable]) -> None:
+        """
+        Chama o callback da tarefa. Um callback que falha (ex.: TclError de
+        uma tela já destruída) é reportado e não impede a entrega dos demais.
+        """
+        try:
+            erro = future.exception()
+            if erro is not None:
+                if on_error:
+                    on_error(erro)
+            elif on_success:
+                on_success(future.result())
+        except Exception:
+            self._reportar_erro()
+
+    def _reportar_erro(self) -> None:
+        """Reporta a exceção atual como o Tk faz com erros em callbacks."""
+        reportar = getattr(self.widget, "report_callback_exception", None)
+        if callable(reportar):
+            reportar(*sys.exc_info())
+        else:
+            traceback.print_exc()
+
+
+class InlineExecutor:
+    """
+    Mesma interface do BackgroundExecutor, mas roda a tarefa na hora, na
+    thread de quem chamou. Usado quando não há janela para receber os
+    resultados (scripts, controllers criados sem executor).
+    """
+
+    def submit(self, chave: str, func: Callable, *args,
+               on_success: Optional[Callable] = None,
+               on_error: Optional[Callable] = None,
+               substituir: bool = False, **kwargs) -> bool:
+        try:
+            resultado = func(*args, **kwargs)
+        except Exception as erro:
+            if on_error:
+                on_error(erro)
+            else:
+                raise
+            return True
+        if on_success:
+            on_success(resultado)
+        return True
+
+    def cancelar(self, chave: str) -> bool:
+        return False
+
+    def is_busy(self, chave: Optional[str] = None) -> bool:
+        return False
+
+    def shutdown(self) -> None:
+        pass
+
+
+# ---------------- EXECUTORES COMPARTILHADOS ----------------
+# Um executor por finalidade, ligado à janela principal (os resultados
+# voltam via root.after) e encerrado em um só lugar: encerrar_executores().
+_compartilhados = {}  # finalidade -> BackgroundExecutor
+
+
+def _executor_compartilhado(finalidade: str, widget: tk.Misc, max_workers: int) -> BackgroundExecutor:
+    raiz = widget.winfo_toplevel()
+    executor = _compartilhados.get(finalidade)
+    if executor is None or executor.widget is not raiz:
+        if executor is not None:
+            executor.shutdown()
+        executor = _compartilhados[finalidade] = BackgroundExecutor(raiz, max_workers=max_workers)
+    return executor
+
+
+def executor_de_dados(widget: tk.Misc) -> BackgroundExecutor:
+    """
+    Retorna o executor usado pelas telas para carregar dados do banco,
+    compartilhado por todos os controllers. Chamado só na thread do Tk.
+    """
+    return _executor_compartilhado("dados", widget, max_workers=2)
+
+
+def executor_de_autenticacao(widget: tk.Misc) -> BackgroundExecutor:
+    """
+    Retorna o executor do hash/verificação de senha (login, cadastro e
+    edição de perfil), compartilhado para que reconstruir uma tela não
+    crie outro pool. Chamado só na thread do Tk.
+    """
+    return _executor_compartilhado("autenticacao", widget, max_workers=2)
+
+
+def encerrar_executores() -> None:
+    """Encerra os executores compartilhados (ao fechar a aplicação)."""
+    for executor in _compartilhados.values():
+        executor.shutdown()
+    _compartilhados.clear()
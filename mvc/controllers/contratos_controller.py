@@ -1,60 +1,29 @@
-from dao import ContratosDAO
+from dao import ContratosDAO, NomeDuplicadoError
 from mvc.models.contratos_model import Contrato
 from mvc.models.periodicidade_enum import Periodicidade
 from mvc.models.contrato_categoria_enum import CategoriaContrato
 from mvc.models.status_enum import Status
 from datetime import datetime
-from tkinter import messagebox
+from mvc.datas import para_iso
+from mvc.renovacao import calcular_renovacao, renovar_vencidos
+from mvc.controllers.lista_paginada_controller import ListaPaginadaController
 
 
-class ContratosController:
+class ContratosController(ListaPaginadaController):
     """Controller para Contratos com funcionalidades avançadas."""
     
-    def __init__(self, view, user_id=None, usuario_controller=None):
-        self.view = view
-        self.user_id = user_id
-        self.usuario_controller = usuario_controller
-        self.dao = ContratosDAO()
-        self.view.controller = self
-        
-        from mvc.controllers.pagamentos_controller import PagamentosController
-        self.pagamentos_controller = PagamentosController(user_id=user_id)
-        
-        # Popula os comboboxes (periodicidade, categorias e formas de pagamento) via enums
-        self.view.set_combo_values(
-            [p.value for p in Periodicidade],
-            [c.value for c in CategoriaContrato],
-            self.pagamentos_controller.obter_nomes_metodos_pagamento()
-        )
-        
-        self._carregar_contratos()
-    
-    # ==================== MÉTODOS DE MENSAGENS ====================
+    CHAVE_LISTA = "contratos:lista"
+    CHAVE_MAIS = "contratos:mais"
+    CHAVE_FORMAS = "contratos:formas_pagamento"
     
-    @staticmethod
-    def mostrar_sucesso(titulo: str, mensagem: str):
-        """Exibe mensagem de sucesso com ícone verde."""
-        messagebox.showinfo(f"✅ {titulo}", mensagem)
+    CATEGORIAS = CategoriaContrato
+    DESCRICAO = "os contratos"
+    MENSAGEM_NOME_DUPLICADO = "Já existe um contrato com esse nome! Tente outro."
     
-    @staticmethod
-    def mostrar_erro(titulo: str, mensagem: str):
-        """Exibe mensagem de erro com ícone vermelho."""
-        messagebox.showerror(f"❌ {titulo}", mensagem)
+    def __init__(self, view, user_id=None, usuario_controller=None, executor=None):
+        super().__init__(view, ContratosDAO(), user_id, usuario_controller, executor)
     
-    @staticmethod
-    def mostrar_aviso(titulo: str, mensagem: str):
-        """Exibe mensagem de aviso com ícone amarelo."""
-        messagebox.showwarning(f"⚠️ {titulo}", mensagem)
-    
-    @staticmethod
-    def confirmar_acao(titulo: str, mensagem: str) -> bool:
-        """
-        Exibe diálogo de confirmação.
-        
-        Returns:
-            bool: True se confirmou, False se cancelou
-        """
-        return messagebox.askyesno(f"❓ {titulo}", mensagem)
+    # ==================== MÉTODOS DE MENSAGENS ====================
     
     def exibir_erro_validacao(self, validation):
         """
@@ -79,43 +48,14 @@ class ContratosController:
     
     # ==================== MÉTODOS DE NEGÓCIO ====================
     
-    def _carregar_contratos(self):
-        """Carrega e exibe os contratos do usuário (próprios + compartilhados)."""
-        if self.user_id:
-            # Primeiro renova todos os contratos ativos vencidos (apenas os próprios)
-            self.renovar_todos_contratos_ativos()
-            
-            # Busca contratos próprios
-            contratos_proprios = self.dao.get_contratos_by_user(self.user_id)
-            
-            # Converte para objetos Contrato
-            contratos_obj = [
-                Contrato(
-                    contrato_id=r["id"],
-                    user_id=r["user_id"],
-                    nome=r["nome"],
-                    data_vencimento=r["data_vencimento"],
-                    valor=r["valor"],
-                    periodicidade=r["periodicidade"],
-                    categoria=r["categoria"],
-                    forma_pagamento=r.get("forma_pagamento", ""),
-                    usuario_compartilhado=r.get("usuario_compartilhado") or "",
-                    favorito=1 if r.get("favorito") else 0,
-                    status=Status(r.get("status", "Ativo"))
-                )
-                for r in contratos_proprios
-            ]
-            
-            # Busca contratos compartilhados comigo (readonly)
-            contratos_compartilhados = self.dao.obter_contratos_compartilhados_comigo(self.user_id)
-            
-            # Combina as duas listas
-            todos_contratos = contratos_obj + contratos_compartilhados
-            
-            # Ordena: favoritos primeiro, depois por data de vencimento
-            todos_contratos.sort(key=lambda c: (c.favorito != 1, c.data_vencimento))
-            
-            self.view.atualizar_lista(todos_contratos)
+    def _buscar_pagina(self, limite, apos):
+        return self.dao.get_pagina(self.user_id, limite, apos)
+    
+    def _renovar_vencidos(self):
+        self.renovar_todos_contratos_ativos()
+    
+    def _calcular_total(self):
+        return self.calcular_total_contratos()
     
     def calcular_total_contratos(self, contratos=None):
         """
@@ -126,8 +66,10 @@ class ContratosController:
         - Contrato próprio compartilhado: metade do valor
         - Contrato compartilhado comigo: metade do valor
         
+        O cálculo é feito por uma única consulta agregada no banco.
+        
         Args:
-            contratos: Lista de contratos (opcional). Se None, busca do usuário atual.
+            contratos: Ignorado; mantido por compatibilidade com as views.
             
         Returns:
             float: Soma total dos valores
@@ -135,35 +77,16 @@ class ContratosController:
         if not self.user_id:
             return 0.0
         
-        # Busca contratos próprios
-        contratos_proprios = self.dao.get_contratos_by_user(self.user_id)
-        
-        # Busca contratos compartilhados comigo
-        contratos_compartilhados = self.dao.obter_contratos_compartilhados_comigo(self.user_id)
-        
-        total = 0.0
-        
-        # Calcula total dos contratos próprios
-        for contrato in contratos_proprios:
-            if contrato["status"] == "Ativo":
-                # Se compartilhou com alguém, paga metade
-                if contrato.get("usuario_compartilhado") and contrato["usuario_compartilhado"].strip():
-                    total += contrato["valor"] / 2
-                else:
-                    total += contrato["valor"]
-        
-        # Calcula total dos contratos compartilhados comigo
-        for contrato in contratos_compartilhados:
-            if contrato.status == Status.ATIVO:
-                # Sempre paga metade (outra metade é do proprietário)
-                total += contrato.valor / 2
-        
+        total, _quantidade = self.dao.get_totais_ativos(self.user_id)
         return total
     
-    def calcular_diferenca_meta(self):
+    def calcular_diferenca_meta(self, total_ativo=None):
         """
         Calcula a diferença entre a meta de contratos e o total de contratos ativos.
         
+        Args:
+            total_ativo: total já calculado (None = consulta o banco)
+        
         Returns:
             float: Meta - Total de contratos ativos (positivo = dentro da meta, negativo = acima da meta)
         """
@@ -172,7 +95,8 @@ class ContratosController:
             return 0.0
         
         meta = float(self.usuario_controller.get_limite_contratos())
-        total_ativo = self.calcular_total_contratos()
+        if total_ativo is None:
+            total_ativo = self.calcular_total_contratos()
         
         return meta - total_ativo
     
@@ -236,18 +160,11 @@ class ContratosController:
         if not self.user_id:
             return {'duplicate': False, 'message': ''}
         
-        contratos = self.dao.get_contratos_by_user(self.user_id)
-        
-        for contrato in contratos:
-            # Ignora o próprio contrato ao editar
-            if contrato_id and contrato["id"] == contrato_id:
-                continue
-            
-            if contrato["nome"].lower() == nome.lower():
-                return {
-                    'duplicate': True,
-                    'message': 'Já existe um contrato com esse nome! Tente outro.'
-                }
+        if self.dao.existe_nome(self.user_id, nome, ignorar_id=contrato_id):
+            return {
+                'duplicate': True,
+                'message': 'Já existe um contrato com esse nome! Tente outro.'
+            }
         
         return {'duplicate': False, 'message': ''}
     
@@ -268,9 +185,7 @@ class ContratosController:
             return {'success': True, 'error_code': 'OK', 'data': data}
         
         # Busca o user_id do email de compartilhamento
-        from dao import UserDAO
-        user_dao = UserDAO()
-        user_id_compartilhado = user_dao.get_user_id_by_email(usuario_compartilhado)
+        user_id_compartilhado = self.emails.resolver(usuario_compartilhado)
         
         # Verifica se está tentando compartilhar consigo mesmo
         if user_id_compartilhado == self.user_id:
@@ -405,7 +320,7 @@ class ContratosController:
             contrato_id=contrato_id,
             user_id=self.user_id,
             nome=nome,
-            data_vencimento=data_vencimento,
+            data_vencimento=para_iso(data_vencimento),
             valor=valor,
             periodicidade=periodicidade,
             categoria=categoria,
@@ -435,10 +350,10 @@ class ContratosController:
             resultado = self.processar_compartilhamento(contrato_id, usuario_compartilhado)
             if not resultado['success']:
                 # Se falhar compartilhamento, retorna erro mas operação já foi feita
-                self._carregar_contratos()
+                self._carregar_lista()
                 return {'success': False, 'message': resultado['message']}
         
-        self._carregar_contratos()
+        self._carregar_lista()
         return {'success': True, 'message': mensagem_sucesso}
     
     def adicionar(
@@ -463,7 +378,11 @@ class ContratosController:
             favorito=0,
             status=Status.ATIVO
         )
-        contrato_id = self.dao.add_contrato(contrato)
+        try:
+            contrato_id = self.dao.add_contrato(contrato)
+        except NomeDuplicadoError:
+            # Outro cadastro com o mesmo nome entrou entre a validação e a gravação
+            return self._erro_nome_duplicado()
         
         return self._finalizar_operacao(
             contrato_id, 
@@ -485,8 +404,7 @@ class ContratosController:
             return {'can_remove': False, 'message': 'Usuário não identificado!'}
         
         # Busca o contrato APENAS entre os do próprio usuário (não nas compartilhados)
-        contratos_proprios = self.dao.get_contratos_by_user(self.user_id)
-        contrato = next((c for c in contratos_proprios if c["id"] == contrato_id), None)
+        contrato = self.dao.get_contrato_by_id(contrato_id, user_id=self.user_id)
         
         if not contrato:
             # Contrato não encontrado entre os do usuário = não é proprietário ou não existe
@@ -496,7 +414,7 @@ class ContratosController:
             }
         
         # Verifica se o status é ENCERRADO
-        if contrato.get("status") == "Encerrado":
+        if contrato.status == Status.ENCERRADO:
             return {'can_remove': True, 'message': ''}
         
         # Não pode remover se ainda está ATIVO
@@ -515,14 +433,14 @@ class ContratosController:
         
         # Remove o contrato
         self.dao.delete_contrato(contrato_id)
-        self._carregar_contratos()
+        self._carregar_lista()
         return {'success': True, 'message': 'Contrato removido com sucesso!'}
     
     def toggle_favorito(self, contrato_id: int):
         """Alterna o status de favorito de um contrato."""
         if self.user_id:
             self.dao.toggle_favorito(contrato_id)
-            self._carregar_contratos()
+            self._carregar_lista()
     
     def renovar_vencimento_se_necessario(self, contrato_id: int):
         """
@@ -539,117 +457,38 @@ class ContratosController:
             return False
         
         # Busca o contrato
-        contratos = self.dao.get_contratos_by_user(self.user_id)
-        contrato = next((c for c in contratos if c["id"] == contrato_id), None)
+        contrato = self.dao.get_contrato_by_id(contrato_id, user_id=self.user_id)
         
-        if not contrato or contrato.get("status") != "Ativo":
+        if not contrato or contrato.status != Status.ATIVO:
             return False
         
-        try:
-            # Converte a data de vencimento
-            data_vencimento = datetime.strptime(contrato["data_vencimento"], "%d/%m/%Y").date()
-            hoje = datetime.now().date()
-            
-            # Se a data de vencimento já passou
-            if data_vencimento < hoje:
-                # Continua renovando até que a data seja >= hoje
-                nova_data = data_vencimento
-                while nova_data < hoje:
-                    nova_data = self._calcular_proxima_data(nova_data, contrato["periodicidade"])
-                    
-                    # Segurança contra loop infinito (periodicidade desconhecida)
-                    if nova_data == data_vencimento:
-                        return False
-                
-                # Atualiza o contrato com a nova data
-                self.editar(
-                    contrato_id=contrato["id"],
-                    nome=contrato["nome"],
-                    data_vencimento=nova_data.strftime("%d/%m/%Y"),
-                    valor=contrato["valor"],
-                    periodicidade=contrato["periodicidade"],
-                    categoria=contrato["categoria"],
-                    usuario_compartilhado=contrato.get("usuario_compartilhado") or "",
-                    favorito=1 if contrato.get("favorito") else 0,
-                    status=Status(contrato.get("status", "Ativo"))
-                )
-                return True
-            
-            return False
-            
-        except ValueError:
-            # Se a data for inválida, não renova
+        nova_data = calcular_renovacao(
+            contrato.data_vencimento,
+            contrato.periodicidade,
+            datetime.now().date()
+        )
+        if nova_data is None:
             return False
-    
-    def _ultimo_dia_mes(self, ano: int, mes: int) -> int:
-        """Retorna o último dia do mês."""
-        import calendar
-        return calendar.monthrange(ano, mes)[1]
-    
-    def _calcular_proxima_data(self, data_atual, periodicidade: str):
-        """
-        Calcula a próxima data de vencimento baseado na periodicidade.
         
-        Args:
-            data_atual: datetime.date - Data atual a ser incrementada
-            periodicidade: str - Periodicidade do contrato
-            
-        Returns:
-            datetime.date: Próxima data de vencimento
-        """
-        if periodicidade == Periodicidade.MENSAL.value:
-            # Adiciona 1 mês
-            mes = data_atual.month + 1
-            ano = data_atual.year
-            if mes > 12:
-                mes = 1
-                ano += 1
-            dia = min(data_atual.day, self._ultimo_dia_mes(ano, mes))
-            return data_atual.replace(year=ano, month=mes, day=dia)
-            
-        elif periodicidade == Periodicidade.TRIMESTRAL.value:
-            # Adiciona 3 meses
-            mes = data_atual.month + 3
-            ano = data_atual.year
-            while mes > 12:
-                mes -= 12
-                ano += 1
-            dia = min(data_atual.day, self._ultimo_dia_mes(ano, mes))
-            return data_atual.replace(year=ano, month=mes, day=dia)
-            
-        elif periodicidade == Periodicidade.SEMESTRAL.value:
-            # Adiciona 6 meses
-            mes = data_atual.month + 6
-            ano = data_atual.year
-            if mes > 12:
-                mes -= 12
-                ano += 1
-            dia = min(data_atual.day, self._ultimo_dia_mes(ano, mes))
-            return data_atual.replace(year=ano, month=mes, day=dia)
-            
-        elif periodicidade == Periodicidade.ANUAL.value:
-            # Adiciona 1 ano
-            ano = data_atual.year + 1
-            mes = data_atual.month
-            dia = min(data_atual.day, self._ultimo_dia_mes(ano, mes))
-            return data_atual.replace(year=ano, day=dia)
-        
-        # Periodicidade desconhecida, retorna a mesma data
-        return data_atual
+        self.dao.update_vencimentos([(para_iso(nova_data), contrato_id)])
+        return True
     
     def renovar_todos_contratos_ativos(self):
         """
         Renova todos os contratos ativos que estão vencidos.
-        Chamado ao carregar a lista de contratos.
+        Busca só os vencidos, calcula as novas datas e grava tudo em
+        uma única transação. Chamado ao carregar a lista de contratos.
+        
+        Returns:
+            dict: resumo de renovar_vencidos ({'renovados', 'ignorados', 'itens'})
         """
         if not self.user_id:
-            return
-        
-        contratos = self.dao.get_contratos_by_user(self.user_id)
+            return {'renovados': 0, 'ignorados': 0, 'itens': []}
         
-        for contrato in contratos:
-            if contrato.get("status") == "Ativo":
-                self.renovar_vencimento_se_necessario(contrato["id"])
+        return renovar_vencidos(
+            lambda hoje_iso: self.dao.iter_vencidos(self.user_id, hoje_iso),
+            self.dao.update_vencimentos
+        )
     
     def editar(
         self,
@@ -680,7 +519,10 @@ class ContratosController:
             favorito=favorito,
             status=status
         )
-        self.dao.update_contrato(contrato)
+        try:
+            self.dao.update_contrato(contrato)
+        except NomeDuplicadoError:
+            return self._erro_nome_duplicado()
         
         return self._finalizar_operacao(
             contrato_id, 
@@ -720,12 +562,9 @@ class ContratosController:
         Returns:
             dict: {'success': bool, 'message': str}
         """
-        from dao import UserDAO
-        user_dao = UserDAO()
-        
         # Normaliza email e busca user_id
         email_normalizado = email_compartilhado.strip().lower()
-        user_id_compartilhado = user_dao.get_user_id_by_email(email_normalizado)
+        user_id_compartilhado = self.emails.resolver(email_normalizado)
         
         # Cria o compartilhamento
         resultado = self._criar_compartilhamento_contrato(
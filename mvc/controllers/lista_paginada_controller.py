@@ -0,0 +1,231 @@
+from tkinter import messagebox
+
+from dao import PAGINA_PADRAO, EmailResolver
+from mvc.models.periodicidade_enum import Periodicidade
+from mvc.controllers.background_executor import InlineExecutor
+
+
+class ListaPaginadaController:
+    """
+    Base dos controllers de telas com lista paginada de itens recorrentes
+    (assinaturas e contratos): mensagens, carga da lista no executor,
+    próximas páginas ao rolar e preenchimento dos comboboxes do formulário.
+
+    Cada subclasse informa as chaves das tarefas no executor, as categorias
+    do formulário e os textos das mensagens, e implementa os ganchos
+    _buscar_pagina, _renovar_vencidos e _calcular_total sobre o seu DAO.
+    """
+
+    # Chaves das tarefas de leitura no executor (uma de cada em andamento)
+    CHAVE_LISTA = None
+    CHAVE_MAIS = None
+    CHAVE_FORMAS = None
+
+    CATEGORIAS = ()  # enum de categorias do formulário
+    DESCRICAO = "os itens"  # usado em "Não foi possível carregar {DESCRICAO}"
+    MENSAGEM_NOME_DUPLICADO = "Já existe um item com esse nome! Tente outro."
+
+    def __init__(self, view, dao, user_id=None, usuario_controller=None, executor=None):
+        self.view = view
+        self.user_id = user_id
+        self.usuario_controller = usuario_controller
+        # Leituras do banco rodam no executor; sem ele (scripts), na própria thread
+        self.executor = executor or InlineExecutor()
+        self.dao = dao
+        self.emails = EmailResolver.para()
+        self.tamanho_pagina = PAGINA_PADRAO
+        self._proxima_pagina = None  # cursor da próxima página da lista exibida
+        self._carregados = 0  # quantos itens a lista exibida já tem
+        self._lista_completa = False  # ordenação por coluna: manter todas as páginas carregadas
+        self.view.controller = self
+
+        from mvc.controllers.pagamentos_controller import PagamentosController
+        self.pagamentos_controller = PagamentosController(user_id=user_id)
+
+        self.recarregar()
+
+    # ---------------- MENSAGENS ----------------
+    @staticmethod
+    def mostrar_sucesso(titulo: str, mensagem: str):
+        """Exibe mensagem de sucesso com ícone verde."""
+        messagebox.showinfo(f"✅ {titulo}", mensagem)
+
+    @staticmethod
+    def mostrar_erro(titulo: str, mensagem: str):
+        """Exibe mensagem de erro com ícone vermelho."""
+        messagebox.showerror(f"❌ {titulo}", mensagem)
+
+    @staticmethod
+    def mostrar_aviso(titulo: str, mensagem: str):
+        """Exibe mensagem de aviso com ícone amarelo."""
+        messagebox.showwarning(f"⚠️ {titulo}", mensagem)
+
+    @staticmethod
+    def confirmar_acao(titulo: str, mensagem: str) -> bool:
+        """
+        Exibe diálogo de confirmação.
+
+        Returns:
+            bool: True se confirmou, False se cancelou
+        """
+        return messagebox.askyesno(f"❓ {titulo}", mensagem)
+
+    def _erro_nome_duplicado(self):
+        """Resultado de adicionar/editar quando o banco rejeita o nome repetido."""
+        return {
+            'success': False,
+            'message': self.MENSAGEM_NOME_DUPLICADO,
+            'error_code': 'DUPLICATE_NAME'
+        }
+
+    # ---------------- GANCHOS ----------------
+    def _buscar_pagina(self, limite: int, apos):
+        """Lê uma página do DAO: (itens, cursor da próxima página ou None)."""
+        raise NotImplementedError
+
+    def _renovar_vencidos(self):
+        """Renova os itens ativos vencidos antes de ler a lista."""
+        raise NotImplementedError
+
+    def _calcular_total(self) -> float:
+        """Total dos itens ativos exibido junto da lista."""
+        raise NotImplementedError
+
+    # ---------------- CARGA DA LISTA ----------------
+    def recarregar(self):
+        """
+        Preenche os comboboxes do formulário e recarrega a lista.
+        Chamado na criação e quando a tela volta a ser exibida com dados desatualizados.
+        """
+        self.executor.submit(
+            self.CHAVE_FORMAS, self.pagamentos_controller.obter_nomes_metodos_pagamento,
+            substituir=True, on_success=self._preencher_combos
+        )
+        self._carregar_lista()
+
+    def _preencher_combos(self, formas_pagamento):
+        # Popula os comboboxes (periodicidade, categorias e formas de pagamento) via enums
+        self.view.set_combo_values(
+            [p.value for p in Periodicidade],
+            [c.value for c in self.CATEGORIAS],
+            formas_pagamento
+        )
+
+    def _carregar_lista(self):
+        """
+        Carrega e exibe os itens do usuário (próprios + compartilhados).
+        A renovação, a leitura e o total rodam no executor; a view recebe o
+        resultado na thread do Tk. Enquanto isso a lista mostra o aviso de carregamento.
+        """
+        if not self.user_id:
+            return
+
+        # Ao recarregar (favorito, edição...), mantém o que já foi carregado
+        # para que a view reconcilie só as linhas que mudaram.
+        limite = max(self.tamanho_pagina, self._carregados)
+
+        # Uma recarga torna obsoletas a carga anterior e a próxima página pedida
+        self.executor.cancelar(self.CHAVE_MAIS)
+        self.view.mostrar_carregando(True)
+        self.executor.submit(
+            self.CHAVE_LISTA, self._ler_lista, limite, self._lista_completa, substituir=True,
+            on_success=self._exibir_lista, on_error=self._falha_ao_carregar
+        )
+
+    def _ler_lista(self, limite, completa=False):
+        """Roda no executor (fora da thread do Tk): não toca na view."""
+        self._renovar_vencidos()
+
+        # Primeira página (próprios + compartilhados comigo, favoritos primeiro).
+        itens, proxima_pagina = self.listar_pagina(limite=limite)
+        if completa:
+            restantes, proxima_pagina = self._ler_restante(proxima_pagina)
+            itens.extend(restantes)
+        return itens, proxima_pagina, self._calcular_total()
+
+    def _exibir_lista(self, resultado):
+        itens, self._proxima_pagina, total = resultado
+        self._carregados = len(itens)
+        self.view.mostrar_carregando(False)
+        self.view.atualizar_lista(itens, total)
+
+    def _falha_ao_carregar(self, erro):
+        self.view.mostrar_carregando(False)
+        self.mostrar_erro("Erro ao carregar", f"Não foi possível carregar {self.DESCRICAO}: {erro}")
+
+    def cancelar_carregamento(self) -> bool:
+        """
+        Descarta as leituras em andamento (ex.: o usuário saiu da tela).
+
+        Returns:
+            bool: True se alguma leitura foi descartada (a lista ficou desatualizada)
+        """
+        cancelados = [self.executor.cancelar(chave) for chave in (self.CHAVE_LISTA, self.CHAVE_MAIS, self.CHAVE_FORMAS)]
+        self.view.mostrar_carregando(False)
+        return any(cancelados)
+
+    # ---------------- PAGINAÇÃO ----------------
+    def listar_pagina(self, apos=None, limite=None):
+        """
+        Retorna uma página dos itens visíveis ao usuário.
+
+        Args:
+            apos: cursor devolvido pela página anterior (None = primeira página)
+            limite: tamanho da página (padrão: self.tamanho_pagina)
+
+        Returns:
+            tuple: (lista de itens, cursor da próxima página ou None)
+        """
+        if not self.user_id:
+            return [], None
+        return self._buscar_pagina(limite or self.tamanho_pagina, apos)
+
+    def carregar_mais(self):
+        """
+        Anexa a próxima página à lista exibida (chamado pela view ao rolar até o fim).
+        A página é lida no executor e anexada quando chegar.
+
+        Returns:
+            bool: False se não havia mais itens a carregar
+        """
+        if self._proxima_pagina is None:
+            return False
+        if self.executor.is_busy(self.CHAVE_LISTA):
+            # A lista está sendo recarregada; o cursor atual vai mudar
+            return True
+
+        self.executor.submit(
+            self.CHAVE_MAIS, self.listar_pagina, self._proxima_pagina,
+            on_success=self._anexar_pagina, on_error=self._falha_ao_carregar
+        )
+        return True
+
+    def carregar_restante(self):
+        """
+        Carrega todas as páginas que faltam e passa a recarregar a lista inteira.
+        Chamado pela view ao ordenar por coluna: a ordenação é em memória e
+        precisa de todas as linhas, não só das páginas já exibidas.
+        """
+        self._lista_completa = True
+        if self._proxima_pagina is None or self.executor.is_busy(self.CHAVE_LISTA):
+            # Nada a carregar, ou a recarga em andamento já lerá a lista inteira
+            return
+
+        # Substitui uma próxima página pedida ao rolar: esta leitura a inclui
+        self.executor.submit(
+            self.CHAVE_MAIS, self._ler_restante, self._proxima_pagina, substituir=True,
+            on_success=self._anexar_pagina, on_error=self._falha_ao_carregar
+        )
+
+    def _ler_restante(self, apos):
+        """Roda no executor: lê as páginas a partir do cursor até o fim."""
+        itens = []
+        while apos is not None:
+            pagina, apos = self.listar_pagina(apos)
+            itens.extend(pagina)
+        return itens, None
+
+    def _anexar_pagina(self, resultado):
+        itens, self._proxima_pagina = resultado
+        self._carregados += len(itens)
+        self.view.anexar_lista(itens)
@@ -1,5 +1,5 @@
 from mvc.models.pagamentos_model import PagamentoModel
-from dao import PagamentosDAO
+from dao import PAGINA_PADRAO, PagamentosDAO
 from datetime import date
 from mvc.models.forma_pagamento_enum import FormaPagamento
 from typing import List, Optional
@@ -34,6 +34,28 @@ class PagamentosController:
         """
         return self.dao.get_all_pagamentos()
 
+    def listar_pagina(self, apos: Optional[tuple] = None, limite: int = PAGINA_PADRAO) -> tuple:
+        """
+        Lista uma página de pagamentos, na mesma ordem de listar_pagamentos.
+        
+        Args:
+            apos: Cursor devolvido pela página anterior (None para a primeira)
+            limite: Tamanho da página
+            
+        Returns:
+            Tupla (lista de PagamentoModel, cursor da próxima página ou None)
+        """
+        return self.dao.get_pagina_pagamentos(limite, apos)
+
+    def obter_pagamento(self, pagamento_id: int) -> Optional[PagamentoModel]:
+        """
+        Busca um pagamento do usuário pelo ID.
+        
+        Returns:
+            PagamentoModel ou None se não encontrado
+        """
+        return self.dao.get_pagamento_by_id(pagamento_id)
+
     def atualizar_pagamento(self, pagamento_id: int, nome: str, vencimento: Optional[date], 
                           forma_pagamento: FormaPagamento) -> None:
         """
@@ -57,6 +79,19 @@ class PagamentosController:
         """
         self.dao.delete_pagamento(pagamento_id)
         
+    def nome_existe(self, nome: str, ignorar_id: Optional[int] = None) -> bool:
+        """
+        Verifica se já existe um pagamento com o mesmo nome (sem diferenciar maiúsculas).
+        
+        Args:
+            nome: Nome a verificar
+            ignorar_id: ID do próprio pagamento, na edição
+            
+        Returns:
+            True se o nome já está em uso
+        """
+        return self.dao.existe_nome(nome, ignorar_id)
+
     def obter_nomes_metodos_pagamento(self) -> List[str]:
         """
         Retorna uma lista com os nomes dos métodos de pagamento cadastrados.
@@ -2,6 +2,7 @@
 from typing import Optional
 from dao import UserDAO
 from mvc.models.usuario_model import Usuario
+from mvc.models.sessao_model import Sessao
 
 
 class UsuarioController:
@@ -9,20 +10,33 @@ class UsuarioController:
     Controller para operações do usuário já autenticado (não cuida de login).
     - Leitura/atualização de limites (assinaturas/contratos).
     - Persiste mudanças via DAO quando possível.
+    - Os dados do usuário vêm da Sessao criada no login (sem nova consulta).
     """
 
     def __init__(self, usuario: Optional[Usuario] = None, dao: Optional[UserDAO] = None):
         self.usuario: Optional[Usuario] = usuario
+        self.sessao: Optional[Sessao] = Sessao(usuario) if usuario else None
         self.dao: UserDAO = dao or UserDAO()
 
     # ---------------- VÍNCULO DO USUÁRIO ----------------
     def bind_usuario(self, usuario: Usuario) -> None:
         """Vincula o usuário logado a este controller."""
         self.usuario = usuario
+        self.sessao = Sessao(usuario) if usuario else None
+
+    def iniciar_sessao(self, sessao: Sessao) -> None:
+        """Vincula a sessão retornada por authenticate() ao controller."""
+        self.sessao = sessao
+        self.usuario = sessao.usuario
+
+    def get_user_id(self) -> Optional[int]:
+        """ID do usuário da sessão atual (ou None se não houver login)."""
+        return self.sessao.user_id if self.sessao else None
 
     def logout(self) -> None:
         """Desvincula o usuário atual (logout)."""
         self.usuario = None
+        self.sessao = None
 
     def carregar_por_email(self, email: str) -> Optional[Usuario]:
         """
@@ -31,14 +45,15 @@ class UsuarioController:
         """
         user = self.dao.get_user_by_email(email)
         self.usuario = user
+        self.sessao = Sessao(user) if user else None
         return user
 
     # ---------------- GETTERS DE LIMITES ----------------
     def get_limite_assinaturas(self) -> float:
-        return float(self.usuario.limite_assinaturas) if self.usuario else 0.0
+        return self.sessao.limite_assinaturas if self.sessao else 0.0
 
     def get_limite_contratos(self) -> float:
-        return float(self.usuario.limite_contratos) if self.usuario else 0.0
+        return self.sessao.limite_contratos if self.sessao else 0.0
 
     # ---------------- SETTERS DE LIMITES ----------------
     def definir_limite_assinaturas(self, novo_limite: float) -> float:
@@ -83,7 +98,46 @@ class UsuarioController:
         if not self.usuario:
             raise RuntimeError("Nenhum usuário vinculado ao UsuarioController.")
 
-    def update_profile(self, new_name: str, new_email: str, new_password: str = None):
+    def gerar_hash_senha(self, senha: str) -> str:
+        """Gera o hash da senha (PBKDF2). Pode rodar fora da thread do Tk."""
+        self._garante_usuario()
+        return self.usuario._hash_password(senha)
+
+    def update_profile_async(self, executor, new_name: str, new_email: str, new_password: str = None,
+                             on_success=None, on_error=None) -> bool:
+        """
+        Atualiza o perfil sem travar a janela: o hash da nova senha é gerado
+        no executor e a gravação acontece depois, na thread do Tk.
+
+        Returns:
+            bool: False se já havia uma atualização em andamento (pedido ignorado)
+        """
+        def concluir(senha_hash):
+            try:
+                self.update_profile(new_name, new_email, senha_hash=senha_hash)
+            except Exception as e:
+                if on_error:
+                    on_error(e)
+                return
+            if on_success:
+                on_success()
+
+        if not new_password:
+            if executor.is_busy("perfil"):
+                return False
+            concluir(None)
+            return True
+
+        return executor.submit(
+            "perfil", self.gerar_hash_senha, new_password,
+            on_success=concluir, on_error=on_error
+        )
+
+    def update_profile(self, new_name: str, new_email: str, new_password: str = None, senha_hash: str = None):
+        """
+        Atualiza nome/e-mail e, opcionalmente, a senha.
+        senha_hash permite informar um hash já calculado (ver update_profile_async).
+        """
         if not self.usuario:
             raise Exception("Nenhum usuário logado!")
 
@@ -96,7 +150,9 @@ class UsuarioController:
         # Atualiza o objeto usuário
         self.usuario.nome = new_name
         self.usuario.email = new_email
-        if new_password:
+        if senha_hash:
+            self.usuario.senha_hash = senha_hash
+        elif new_password:
             # Usa o método correto do modelo para gerar o hash da senha
             self.usuario.senha_hash = self.usuario._hash_password(new_password)
 
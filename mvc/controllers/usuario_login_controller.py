@@ -1,12 +1,20 @@
+from mvc.controllers.background_executor import BackgroundExecutor, executor_de_autenticacao
+
+
 class UserLoginController:
     """
     Controller para funcionalidade de login e registro.
     Gerencia eventos de entrada do usuário e atualiza o BD através do Model.
     Trabalha com NavegacaoController para gerenciar transições de tela.
+    O hash/verificação de senha roda em segundo plano (auth_worker) para
+    não travar a janela.
     """
-    def __init__(self, model, navegacao):
+    AUTH_JOB = "auth"
+
+    def __init__(self, model, navegacao, auth_worker: BackgroundExecutor = None):
         self.model = model
         self.navegacao = navegacao
+        self.auth_worker = auth_worker or executor_de_autenticacao(navegacao.root)
 
         # Bind buttons
         self.navegacao.register_button.config(command=self.handle_register)
@@ -30,7 +38,18 @@ class UserLoginController:
         email = self.navegacao.register_view.get_field_value(self.navegacao.reg_email)
         senha = self.navegacao.register_view.get_field_value(self.navegacao.reg_password)
 
-        if self.model.register_user(nome, email, senha):
+        # Ignora cliques repetidos enquanto o registro anterior não terminou
+        if not self.auth_worker.submit(
+            self.AUTH_JOB, self.model.register_user, nome, email, senha,
+            on_success=self._register_concluido,
+            on_error=self._auth_falhou,
+        ):
+            return
+        self.navegacao.register_view.set_busy(True)
+
+    def _register_concluido(self, registrado: bool):
+        self.navegacao.register_view.set_busy(False)
+        if registrado:
             self.navegacao.mostrar_mensagem("Sucesso", "Usuário registrado com sucesso!")
             self.navegacao.mostrar_tela_login()
         else:
@@ -47,23 +66,38 @@ class UserLoginController:
         email = self.navegacao.login_view.get_field_value(self.navegacao.login_email)
         senha = self.navegacao.login_view.get_field_value(self.navegacao.login_password)
 
-        if self.model.login_user(email, senha):
-            # Vincula o usuário ao controller usado pela tela Metas
-            uc = getattr(self.navegacao, "usuario_controller", None)
-            if uc is not None:
-                usuario = uc.carregar_por_email(email)  # carrega do DAO com limites
-                if usuario is None:
-                    self.navegacao.mostrar_erro("Erro", "Usuário não encontrado no banco após login.")
-                    return
-
-            # Agora o uc.usuario tem limite_assinaturas/limite_contratos carregados
-            self.navegacao.mostrar_tela_home()
-        else:
+        # Ignora cliques repetidos enquanto a verificação anterior não terminou
+        if not self.auth_worker.submit(
+            self.AUTH_JOB, self.model.authenticate, email, senha,
+            on_success=self._login_concluido,
+            on_error=self._auth_falhou,
+        ):
+            return
+        self.navegacao.login_view.set_busy(True)
+
+    def _login_concluido(self, sessao):
+        self.navegacao.login_view.set_busy(False)
+        if sessao is None:
             self.navegacao.mostrar_erro("Erro", "Email ou senha incorretos.")
+            return
+
+        # Vincula a sessão (usuário + limites) ao controller usado pelas telas
+        uc = getattr(self.navegacao, "usuario_controller", None)
+        if uc is not None:
+            uc.iniciar_sessao(sessao)
+
+        self.navegacao.mostrar_tela_home()
+
+    def _auth_falhou(self, erro: Exception):
+        self.navegacao.login_view.set_busy(False)
+        self.navegacao.register_view.set_busy(False)
+        self.navegacao.mostrar_erro("Erro", str(erro))
 
     def logout(self):
         """Efetua logout e retorna à tela de login."""
         uc = getattr(self.navegacao, "usuario_controller", None)
         if uc is not None:
             uc.logout()
+        # As telas da sessão (e os dados carregados nelas) não sobrevivem ao logout
+        self.navegacao.home_view.limpar_telas()
         self.navegacao.mostrar_tela_login()
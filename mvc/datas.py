@@ -0,0 +1,55 @@
+# mvc/datas.py
+"""
+Conversão de datas entre o formato gravado no banco e o formato de tela.
+
+O banco guarda datas em ISO (AAAA-MM-DD), que ordena corretamente como
+texto e permite consultas por intervalo usando índice. A interface
+continua exibindo e recebendo DD/MM/AAAA; a conversão acontece só nas
+bordas (views para exibir, controllers antes de gravar).
+"""
+from datetime import date, datetime
+from typing import Union
+
+# ---------------- FORMATOS ----------------
+FORMATO_ISO = "%Y-%m-%d"
+FORMATO_EXIBICAO = "%d/%m/%Y"
+
+
+# ---------------- CONVERSÕES ----------------
+def parse_data(valor: Union[str, date]) -> date:
+    """
+    Converte uma data em ISO ou DD/MM/AAAA para datetime.date.
+
+    Raises:
+        ValueError: se o texto não estiver em nenhum dos dois formatos
+    """
+    if isinstance(valor, datetime):
+        return valor.date()
+    if isinstance(valor, date):
+        return valor
+
+    texto = (valor or "").strip()
+    for formato in (FORMATO_ISO, FORMATO_EXIBICAO):
+        try:
+            return datetime.strptime(texto, formato).date()
+        except ValueError:
+            continue
+    raise ValueError(f"Data inválida: {valor!r}")
+
+
+def para_iso(valor: Union[str, date]) -> str:
+    """Retorna a data no formato de armazenamento (AAAA-MM-DD)."""
+    return parse_data(valor).strftime(FORMATO_ISO)
+
+
+def para_exibicao(valor: Union[str, date, None]) -> str:
+    """
+    Retorna a data no formato de tela (DD/MM/AAAA).
+    Valores que não são datas válidas são devolvidos como vieram.
+    """
+    if not valor:
+        return ""
+    try:
+        return parse_data(valor).strftime(FORMATO_EXIBICAO)
+    except ValueError:
+        return str(valor)
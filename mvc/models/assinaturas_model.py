@@ -5,6 +5,8 @@ from datetime import datetime
 
 class Assinatura(Contrato):
     """Model para Assinatura - herda de Contrato e adiciona login/senha e forma de pagamento."""
+
+    __slots__ = ("login", "senha", "created_at")
     
     def __init__(
         self, 
@@ -40,7 +42,6 @@ class Assinatura(Contrato):
         self.login = login
         self.senha = senha
         self.created_at = created_at if created_at else datetime.now().isoformat()
-        self.is_readonly = False
         
         # status: define o estado da assinatura
         if status is None:
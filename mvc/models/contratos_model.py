@@ -2,6 +2,13 @@ from mvc.models.status_enum import Status
 
 class Contrato:
     """Classe concreta para Contrato (com forma de pagamento)."""
+
+    # Sem __dict__ por instância: as telas mantêm listas inteiras de contratos em memória
+    __slots__ = (
+        "id", "user_id", "nome", "valor", "data_vencimento", "periodicidade", "categoria",
+        "forma_pagamento", "usuario_compartilhado", "favorito", "status", "is_readonly",
+    )
+
     def __init__(
         self,
         nome: str,
@@ -28,6 +35,7 @@ class Contrato:
         self.usuario_compartilhado = usuario_compartilhado
         self.favorito = favorito
         self.status = status
+        self.is_readonly = False
 
 
     @property
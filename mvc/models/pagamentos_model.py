@@ -4,8 +4,11 @@ from mvc.models.forma_pagamento_enum import FormaPagamento
 
 class PagamentoModel:
     """Modelo para representar informações de pagamento."""
+
+    __slots__ = ("id", "_nome", "_vencimento", "_forma_de_pagamento")
     
     def __init__(self, nome: str, vencimento: date, forma_de_pagamento: FormaPagamento):
+        self.id = None  # preenchido ao carregar do banco
         self._nome = None
         self._vencimento = None
         self._forma_de_pagamento = None
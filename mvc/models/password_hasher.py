@@ -0,0 +1,189 @@
+# mvc/models/password_hasher.py
+"""
+Hash de senhas em formato autodescritivo.
+
+Formatos gravados em users.senha_hash:
+- ``pbkdf2_sha256$<iteracoes>$<salt_hex>$<hash_hex>``
+- ``bcrypt$<hash do bcrypt>`` (ex.: ``bcrypt$$2b$12$...``)
+- legado: ``<salt_hex(64)><hash_hex(64)>``, PBKDF2-SHA256 com 100000 iterações
+
+O custo (iterações do PBKDF2 ou rounds do bcrypt) é calibrado uma vez por
+processo para que uma verificação leve cerca de SIGNUM_HASH_TARGET_MS
+nesta máquina. Hashes com custo fora da faixa aceitável, em formato legado
+ou em outro algoritmo são refeitos de forma transparente no próximo login.
+"""
+import hashlib
+import hmac
+import os
+import threading
+import time
+from typing import Optional
+
+try:
+    import bcrypt
+except ImportError:  # dependência opcional; sem ela usamos PBKDF2
+    bcrypt = None
+
+PBKDF2 = "pbkdf2_sha256"
+BCRYPT = "bcrypt"
+
+ITERACOES_LEGADO = 100000
+ITERACOES_MINIMAS = 100000
+ITERACOES_MAXIMAS = 5000000
+BCRYPT_ROUNDS_MIN = 10
+BCRYPT_ROUNDS_MAX = 16
+TAMANHO_SALT = 32
+
+# A calibração é refeita a cada processo e varia com a carga da máquina;
+# hashes até 25% abaixo do custo calibrado (ou um round do bcrypt) são
+# aceitos, senão cada login pagaria outra derivação e uma gravação e o
+# custo gravado subiria até o topo do ruído.
+TOLERANCIA_REHASH = 0.75
+
+
+class PasswordHasher:
+    """Gera, verifica e avalia hashes de senha para um algoritmo e custo definidos."""
+
+    def __init__(self, algoritmo: str = PBKDF2, iteracoes: int = ITERACOES_MINIMAS, bcrypt_rounds: int = 12):
+        if algoritmo == BCRYPT and bcrypt is None:
+            algoritmo = PBKDF2
+        self.algoritmo = algoritmo
+        self.iteracoes = int(iteracoes)
+        self.bcrypt_rounds = int(bcrypt_rounds)
+
+    # ---------------- CALIBRAÇÃO ----------------
+    @classmethod
+    def calibrar(cls, alvo_ms: float = 250, algoritmo: str = PBKDF2) -> "PasswordHasher":
+        """
+        Mede o custo do algoritmo nesta máquina e escolhe o maior custo
+        cuja verificação ainda cabe em alvo_ms (respeitando os limites mínimos).
+        """
+        alvo = alvo_ms / 1000.0
+
+        if algoritmo == BCRYPT and bcrypt is not None:
+            rounds = BCRYPT_ROUNDS_MIN
+            inicio = time.perf_counter()
+            bcrypt.hashpw(b"calibracao", bcrypt.gensalt(rounds))
+            duracao = time.perf_counter() - inicio
+            # Cada round a mais dobra o custo
+            while rounds < BCRYPT_ROUNDS_MAX and duracao * 2 <= alvo:
+                rounds += 1
+                duracao *= 2
+            return cls(BCRYPT, bcrypt_rounds=rounds)
+
+        amostra = 20000
+        inicio = time.perf_counter()
+        hashlib.pbkdf2_hmac("sha256", b"calibracao", os.urandom(TAMANHO_SALT), amostra)
+        por_iteracao = max(time.perf_counter() - inicio, 1e-9) / amostra
+        iteracoes = int(alvo / por_iteracao) // 10000 * 10000
+        iteracoes = max(ITERACOES_MINIMAS, min(ITERACOES_MAXIMAS, iteracoes))
+        return cls(PBKDF2, iteracoes=iteracoes)
+
+    # ---------------- HASH ----------------
+    def hash(self, senha: str) -> str:
+        """Gera o hash da senha no formato autodescritivo."""
+        if self.algoritmo == BCRYPT:
+            gerado = bcrypt.hashpw(senha.encode("utf-8"), bcrypt.gensalt(self.bcrypt_rounds))
+            return f"{BCRYPT}${gerado.decode('ascii')}"
+
+        salt = os.urandom(TAMANHO_SALT)
+        derivado = hashlib.pbkdf2_hmac("sha256", senha.encode("utf-8"), salt, self.iteracoes)
+        return f"{PBKDF2}${self.iteracoes}${salt.hex()}${derivado.hex()}"
+
+    # ---------------- VERIFICAÇÃO ----------------
+    @staticmethod
+    def identificar(senha_hash: str) -> Optional[tuple]:
+        """
+        Decompõe um hash gravado.
+
+        Returns:
+            (algoritmo, custo, dados) ou None se o formato for desconhecido
+        """
+        if not senha_hash:
+            return None
+        if senha_hash.startswith(BCRYPT + "$"):
+            dados = senha_hash[len(BCRYPT) + 1:]
+            partes = dados.split("$")  # ['', '2b', '12', '...']
+            try:
+                return BCRYPT, int(partes[2]), dados
+            except (IndexError, ValueError):
+                return None
+        if senha_hash.startswith(PBKDF2 + "$"):
+            partes = senha_hash.split("$")
+            if len(partes) != 4:
+                return None
+            try:
+                return PBKDF2, int(partes[1]), (partes[2], partes[3])
+            except ValueError:
+                return None
+        if len(senha_hash) == 128:
+            # Formato legado: salt (32 bytes) + hash (32 bytes), em hex
+            return PBKDF2, ITERACOES_LEGADO, (senha_hash[:64], senha_hash[64:])
+        return None
+
+    def verify(self, senha: str, senha_hash: str) -> bool:
+        """Verifica a senha contra um hash em qualquer formato suportado."""
+        info = self.identificar(senha_hash)
+        if info is None:
+            return False
+        algoritmo, custo, dados = info
+
+        if algoritmo == BCRYPT:
+            if bcrypt is None:
+                return False
+            return bcrypt.checkpw(senha.encode("utf-8"), dados.encode("ascii"))
+
+        salt_hex, hash_hex = dados
+        try:
+            salt = bytes.fromhex(salt_hex)
+        except ValueError:
+            return False
+        derivado = hashlib.pbkdf2_hmac("sha256", senha.encode("utf-8"), salt, custo)
+        return hmac.compare_digest(derivado.hex(), hash_hex)
+
+    def needs_rehash(self, senha_hash: str) -> bool:
+        """
+        Indica se o hash deve ser refeito com a configuração atual: formato
+        legado, outro algoritmo ou custo fora da faixa (abaixo do mínimo,
+        bem abaixo do calibrado — ver TOLERANCIA_REHASH — ou mais que o
+        dobro dele, o que deixaria o login lento).
+        """
+        if not senha_hash or not senha_hash.startswith((PBKDF2 + "$", BCRYPT + "$")):
+            return True
+        info = self.identificar(senha_hash)
+        if info is None or info[0] != self.algoritmo:
+            return True
+
+        custo = info[1]
+        if self.algoritmo == BCRYPT:
+            # Cada round dobra o custo: aceita um round a menos ou a mais
+            return custo < max(BCRYPT_ROUNDS_MIN, self.bcrypt_rounds - 1) or custo > self.bcrypt_rounds + 1
+        minimo = max(ITERACOES_MINIMAS, int(self.iteracoes * TOLERANCIA_REHASH))
+        return custo < minimo or custo > self.iteracoes * 2
+
+
+# ---------------- HASHER PADRÃO DO PROCESSO ----------------
+_padrao = None
+_padrao_lock = threading.Lock()
+
+
+def hasher_padrao() -> PasswordHasher:
+    """
+    Retorna o hasher do processo, calibrado no primeiro uso.
+    Variáveis de ambiente: SIGNUM_HASH_ALGORITHM (pbkdf2_sha256 | bcrypt)
+    e SIGNUM_HASH_TARGET_MS (latência alvo da verificação, padrão 250).
+    """
+    global _padrao
+    with _padrao_lock:
+        if _padrao is None:
+            algoritmo = os.environ.get("SIGNUM_HASH_ALGORITHM", PBKDF2).strip().lower()
+            alvo_ms = float(os.environ.get("SIGNUM_HASH_TARGET_MS", "250"))
+            _padrao = PasswordHasher.calibrar(alvo_ms, algoritmo)
+        return _padrao
+
+
+def configurar_hasher(hasher: PasswordHasher) -> None:
+    """Substitui o hasher padrão (ex.: custo fixo em vez de calibrado)."""
+    global _padrao
+    with _padrao_lock:
+        _padrao = hasher
@@ -0,0 +1,38 @@
+# mvc/models/sessao_model.py
+from datetime import datetime
+from mvc.models.usuario_model import Usuario
+
+
+class Sessao:
+    """
+    Sessão do usuário autenticado.
+    Guarda o Usuario carregado no login (com os limites) para que as telas
+    leiam dele em vez de consultar o banco novamente.
+    """
+
+    def __init__(self, usuario: Usuario):
+        self.usuario = usuario
+        self.iniciada_em = datetime.now()
+
+    @property
+    def user_id(self) -> int:
+        return self.usuario.id
+
+    @property
+    def nome(self) -> str:
+        return self.usuario.nome
+
+    @property
+    def email(self) -> str:
+        return self.usuario.email
+
+    @property
+    def limite_assinaturas(self) -> float:
+        return float(self.usuario.limite_assinaturas)
+
+    @property
+    def limite_contratos(self) -> float:
+        return float(self.usuario.limite_contratos)
+
+    def __repr__(self):
+        return f"<Sessao user_id={self.user_id} iniciada_em={self.iniciada_em:%H:%M:%S}>"
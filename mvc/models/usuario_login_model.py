@@ -1,5 +1,7 @@
+from typing import Optional
 from dao import UserDAO
 from mvc.models.usuario_model import Usuario
+from mvc.models.sessao_model import Sessao
 
 class UserLoginModel:
     """
@@ -15,8 +17,23 @@ class UserLoginModel:
         self.dao.add_user(user)
         return True
 
-    def login_user(self, email: str, senha: str) -> bool:
+    def authenticate(self, email: str, senha: str) -> Optional[Sessao]:
+        """
+        Autentica com uma única consulta e uma única verificação de senha.
+
+        Returns:
+            Sessao com o usuário carregado (e seus limites), ou None se falhar
+        """
         user = self.dao.get_user_by_email(email)
-        if not user:
-            return False
-        return user.verify_password(senha)
\ No newline at end of file
+        if not user or not user.verify_password(senha):
+            return None
+
+        # Login válido: aproveita a senha em mãos para atualizar hashes
+        # legados ou com custo fora do calibrado para esta máquina
+        if user.precisa_rehash():
+            user.senha_hash = user._hash_password(senha)
+            self.dao.update_user_password(user.id, user.senha_hash)
+        return Sessao(user)
+
+    def login_user(self, email: str, senha: str) -> bool:
+        return self.authenticate(email, senha) is not None
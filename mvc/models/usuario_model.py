@@ -1,7 +1,8 @@
-import hashlib
-import os
+from mvc.models.password_hasher import hasher_padrao
 
 class Usuario:
+    __slots__ = ("id", "nome", "email", "senha_hash", "_limite_assinaturas", "_limite_contratos")
+
     def __init__(self, nome: str, email: str, senha: str, user_id: int = None,  limite_assinaturas: float = 0.0, limite_contratos: float = 0.0):
         self.id = user_id
         self.nome = nome
@@ -10,23 +11,33 @@ class Usuario:
         self._limite_assinaturas = limite_assinaturas
         self._limite_contratos = limite_contratos
 
+    # ---------------- HIDRATAÇÃO ----------------
+    @classmethod
+    def from_db(cls, user_id: int, nome: str, email: str, senha_hash: str,
+                limite_assinaturas: float = 0.0, limite_contratos: float = 0.0) -> "Usuario":
+        """Cria um Usuario a partir de uma linha do banco, reaproveitando o hash salvo (sem PBKDF2)."""
+        user = cls.__new__(cls)
+        user.id = user_id
+        user.nome = nome
+        user.email = email
+        user.senha_hash = senha_hash
+        user._limite_assinaturas = limite_assinaturas
+        user._limite_contratos = limite_contratos
+        return user
+
     # ---------------- HASH PASSWORD ----------------
     def _hash_password(self, senha: str) -> str:
-        """Cria um hash seguro usando sha256 + salt"""
-        salt = os.urandom(32)  # salt aleatório de 32 bytes
-        pwdhash = hashlib.pbkdf2_hmac('sha256', senha.encode('utf-8'), salt, 100000)
-        # Salva salt + hash juntos
-        return salt.hex() + pwdhash.hex()
+        """Cria um hash seguro no formato autodescritivo (ver password_hasher)"""
+        return hasher_padrao().hash(senha)
 
     # ---------------- VERIFY PASSWORD ----------------
     def verify_password(self, senha: str) -> bool:
-        """Verifica se a senha fornecida bate com o hash salvo"""
-        salt_hex = self.senha_hash[:64]  # primeiros 32 bytes em hex
-        pwdhash_hex = self.senha_hash[64:]  # resto do hash
-        salt = bytes.fromhex(salt_hex)
-        pwdhash = bytes.fromhex(pwdhash_hex)
-        check_hash = hashlib.pbkdf2_hmac('sha256', senha.encode('utf-8'), salt, 100000)
-        return check_hash.hex() == pwdhash_hex
+        """Verifica se a senha fornecida bate com o hash salvo (aceita o formato legado)"""
+        return hasher_padrao().verify(senha, self.senha_hash)
+
+    def precisa_rehash(self) -> bool:
+        """Indica se o hash salvo está em formato legado ou com custo fora da faixa aceita em torno do calibrado"""
+        return hasher_padrao().needs_rehash(self.senha_hash)
 
     # ---------------- REPRESENTAÇÃO ----------------
     def __repr__(self):
@@ -0,0 +1,89 @@
+# mvc/recorrencia.py
+"""
+Cálculo de vencimentos recorrentes (assinaturas e contratos).
+
+Cada periodicidade corresponde a um número fixo de meses. A k-ésima
+ocorrência é calculada diretamente a partir da data informada (âncora),
+somando k * meses e limitando o dia ao último dia do mês de destino.
+Dentro de um mesmo cálculo de várias ocorrências, um vencimento em 31/01
+cai em 29/02 (ou 28/02) e volta para 31/03.
+
+Entre renovações isso não se mantém: cada renovação grava a data já
+ajustada como novo vencimento, e ela vira a âncora da próxima. Assim um
+mensal em 31/01 renovado mês a mês fica em 29/02 e depois em 29/03.
+"""
+from datetime import date
+from typing import Iterable, List, Optional
+
+from mvc.models.periodicidade_enum import Periodicidade
+
+# ---------------- PERIODICIDADES ----------------
+MESES_POR_PERIODICIDADE = {
+    Periodicidade.MENSAL.value: 1,
+    Periodicidade.TRIMESTRAL.value: 3,
+    Periodicidade.SEMESTRAL.value: 6,
+    Periodicidade.ANUAL.value: 12,
+}
+
+# Último dia de cada mês em ano comum (fevereiro é ajustado em _ultimo_dia)
+_DIAS_NO_MES = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _ultimo_dia(ano: int, mes: int) -> int:
+    """Retorna o último dia do mês (1-12)."""
+    if mes == 2 and ano % 4 == 0 and (ano % 100 != 0 or ano % 400 == 0):
+        return 29
+    return _DIAS_NO_MES[mes - 1]
+
+
+def meses_da_periodicidade(periodicidade) -> Optional[int]:
+    """Retorna o passo em meses da periodicidade (valor ou enum), ou None se desconhecida."""
+    if isinstance(periodicidade, Periodicidade):
+        periodicidade = periodicidade.value
+    return MESES_POR_PERIODICIDADE.get(periodicidade)
+
+
+# ---------------- CÁLCULO ----------------
+def adicionar_meses(ancora: date, meses: int) -> date:
+    """Soma meses à data, limitando o dia ao último dia do mês de destino."""
+    indice = ancora.year * 12 + (ancora.month - 1) + meses
+    ano, mes = divmod(indice, 12)
+    mes += 1
+    return date(ano, mes, min(ancora.day, _ultimo_dia(ano, mes)))
+
+
+def proxima_ocorrencia(ancora: date, periodicidade, alvo: date) -> Optional[date]:
+    """
+    Retorna a primeira ocorrência da série iniciada em `ancora` que cai em
+    `alvo` ou depois, em tempo constante (sem iterar período a período).
+
+    Returns:
+        date, ou None se a periodicidade for desconhecida
+    """
+    passo = meses_da_periodicidade(periodicidade)
+    if not passo:
+        return None
+    if ancora >= alvo:
+        return ancora
+
+    meses_ate_alvo = (alvo.year - ancora.year) * 12 + (alvo.month - ancora.month)
+    k = meses_ate_alvo // passo
+    candidata = adicionar_meses(ancora, k * passo)
+    if candidata < alvo:
+        # Ainda no mês do alvo (ou antes): a ocorrência seguinte já é posterior
+        candidata = adicionar_meses(ancora, (k + 1) * passo)
+    return candidata
+
+
+def proximas_ocorrencias(itens: Iterable[tuple], alvo: date) -> List[Optional[date]]:
+    """
+    Versão em lote de proxima_ocorrencia para vários itens de uma vez.
+
+    Args:
+        itens: pares (ancora, periodicidade)
+        alvo: data de referência comum a todos os itens
+
+    Returns:
+        lista na mesma ordem de `itens` (None onde a periodicidade é desconhecida)
+    """
+    return [proxima_ocorrencia(ancora, periodicidade, alvo) for ancora, periodicidade in itens]
@@ -0,0 +1,85 @@
+# mvc/renovacao.py
+"""
+Renovação automática de vencimentos de itens recorrentes (assinaturas e contratos).
+
+O fluxo é sempre o mesmo para os dois tipos de item: o DAO devolve, em uma
+consulta, apenas os itens ativos com vencimento anterior a hoje; as novas
+datas são calculadas de uma vez por mvc.recorrencia; e o DAO grava todas
+em uma única transação.
+"""
+from datetime import date
+from typing import Callable, Iterable, Optional
+
+from mvc.datas import parse_data, para_iso
+from mvc.recorrencia import proxima_ocorrencia, proximas_ocorrencias
+
+
+def calcular_renovacao(data_vencimento, periodicidade: str, hoje: date) -> Optional[date]:
+    """
+    Calcula o novo vencimento (primeira ocorrência >= hoje) de um item.
+
+    Args:
+        data_vencimento: data atual do item (date ou texto ISO/DD/MM/AAAA)
+        periodicidade: valor de Periodicidade do item
+        hoje: data de referência
+
+    Returns:
+        date com o novo vencimento, ou None se não há o que renovar
+        (data inválida, ainda não venceu ou periodicidade desconhecida)
+    """
+    try:
+        original = parse_data(data_vencimento)
+    except ValueError:
+        return None
+
+    if original >= hoje:
+        return None
+    return proxima_ocorrencia(original, periodicidade, hoje)
+
+
+def renovar_vencidos(
+    buscar_vencidos: Callable[[str], Iterable],
+    gravar_vencimentos: Callable[[list], None],
+    hoje: Optional[date] = None,
+) -> dict:
+    """
+    Renova em lote todos os itens vencidos.
+
+    Args:
+        buscar_vencidos: função (hoje_iso) -> linhas (id, data_vencimento, periodicidade);
+            pode ser um gerador: é consumido por inteiro antes de qualquer gravação
+        gravar_vencimentos: função que recebe [(nova_data_iso, id), ...] e grava em uma transação
+        hoje: data de referência (padrão: hoje)
+
+    Returns:
+        dict: {'renovados': int, 'ignorados': int, 'itens': [(id, data_antiga, data_nova), ...]}
+    """
+    hoje = hoje or date.today()
+
+    validos = []
+    ignorados = 0
+    for item_id, data_vencimento, periodicidade in buscar_vencidos(para_iso(hoje)):
+        try:
+            validos.append((item_id, data_vencimento, parse_data(data_vencimento), periodicidade))
+        except ValueError:
+            ignorados += 1
+
+    novas_datas = proximas_ocorrencias(
+        ((ancora, periodicidade) for _id, _texto, ancora, periodicidade in validos),
+        hoje
+    )
+
+    pares = []
+    itens = []
+    for (item_id, data_vencimento, _ancora, _periodicidade), nova_data in zip(validos, novas_datas):
+        if nova_data is None:
+            ignorados += 1
+            continue
+        nova_iso = para_iso(nova_data)
+        pares.append((nova_iso, item_id))
+        itens.append((item_id, data_vencimento, nova_iso))
+
+    if pares:
+        gravar_vencimentos(pares)
+
+    return {'renovados': len(pares), 'ignorados': ignorados, 'itens': itens}
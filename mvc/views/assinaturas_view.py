@@ -1,16 +1,28 @@
 import tkinter as tk
 from tkinter import ttk
 from mvc import ui_constants as UI
+from mvc.datas import para_exibicao
+from mvc.views.column_sorter import ColumnSorter
+from mvc.views.virtual_list import VirtualList
 
 
 class AssinaturasView:
     """View para tela de Assinaturas."""
     
+    # Chave de ordenação de cada coluna do treeview
+    CHAVES_ORDENACAO = {
+        "fav": lambda a: a.favorito,
+        "Nome": lambda a: a.nome,
+        "Valor": lambda a: float(a.valor),
+        "Vencimento": lambda a: a.data_vencimento,
+        "Periodicidade": lambda a: a.periodicidade,
+        "Categoria": lambda a: a.categoria,
+    }
+    
     def __init__(self, parent, controller=None):
         self.parent = parent
         self.controller = controller
         self.assinaturas_data = []
-        self.sort_reverse = {}
         self._create_ui()
     
     def _create_ui(self):
@@ -176,15 +188,18 @@ class AssinaturasView:
             tree_container,
             columns=columns,
             show="headings",
-            yscrollcommand=scrollbar_y.set,
             xscrollcommand=scrollbar_x.set,
             height=15,
             displaycolumns=("fav", "Nome", "Valor", "Vencimento", "Periodicidade", "Categoria")
         )
         
-        scrollbar_y.config(command=self.tree.yview)
         scrollbar_x.config(command=self.tree.xview)
         
+        # Lista virtualizada: só as linhas visíveis (mais uma margem) existem no Treeview.
+        # Linhas identificadas pelo id da assinatura; a próxima página é carregada ao rolar até o fim
+        self._lista = VirtualList(self.tree, scrollbar_y, self._valores_linha,
+                                  ao_chegar_no_fim=self._ao_chegar_no_fim)
+        
         # Posicionar scrollbars e treeview
         self.tree.grid(row=0, column=0, sticky="nsew")
         scrollbar_y.grid(row=0, column=1, sticky="ns")
@@ -193,16 +208,9 @@ class AssinaturasView:
         tree_container.grid_rowconfigure(0, weight=1)
         tree_container.grid_columnconfigure(0, weight=1)
         
-        # Definir colunas com comando de ordenação
-        self.tree.heading("fav", text="★", command=lambda: self._ordenar_coluna("fav"))
-        self.tree.heading("Nome", text="Nome", command=lambda: self._ordenar_coluna("Nome"))
-        self.tree.heading("Valor", text="Valor", command=lambda: self._ordenar_coluna("Valor"))
-        self.tree.heading("Vencimento", text="Vencimento", command=lambda: self._ordenar_coluna("Vencimento"))
-        self.tree.heading("Periodicidade", text="Periodicidade", command=lambda: self._ordenar_coluna("Periodicidade"))
-        self.tree.heading("Categoria", text="Categoria", command=lambda: self._ordenar_coluna("Categoria"))
-        
-        for col in ("fav", "Nome", "Valor", "Vencimento", "Periodicidade", "Categoria"):
-            self.sort_reverse[col] = False
+        # Cabeçalhos ordenam a lista em memória; a coluna de favorito tem a direção invertida
+        self._ordenacao = ColumnSorter(self.tree, self.CHAVES_ORDENACAO, self._ordenar_coluna,
+                                       rotulos={"fav": "★"}, invertidas=("fav",))
         
         # Larguras das colunas
         self.tree.column("fav", width=40, minwidth=40, anchor="center")
@@ -296,90 +304,60 @@ class AssinaturasView:
                     self.controller.alternar_favorito(assinatura_id)
     
     def _ordenar_coluna(self, col):
-        """Ordena o treeview pela coluna clicada."""
-        # Toggle sort direction
-        self.sort_reverse[col] = not self.sort_reverse[col]
-        reverse = self.sort_reverse[col]
-        
-        # Sort assinaturas_data
-        if col == "fav":
-            self.assinaturas_data.sort(
-                key=lambda x: x.favorito,
-                reverse=not reverse  # Inverted so favorites come first by default
-            )
-        elif col == "Valor":
-            self.assinaturas_data.sort(
-                key=lambda x: float(x.valor),
-                reverse=reverse
-            )
-        else:
-            attr_map = {
-                "Nome": "nome",
-                "Vencimento": "data_vencimento",
-                "Periodicidade": "periodicidade",
-                "Categoria": "categoria"
-            }
-            attr = attr_map.get(col, "nome")
-            self.assinaturas_data.sort(
-                key=lambda x: getattr(x, attr, ""),
-                reverse=reverse
-            )
-        
-        # Update treeview
-        self._atualizar_treeview()
-        
-        # Update heading to show sort direction
-        visible_cols = ("fav", "Nome", "Valor", "Vencimento", "Periodicidade", "Categoria")
-        for c in visible_cols:
-            if c == col:
-                if c == "fav":
-                    arrow = " ▼" if not reverse else " ▲"
-                    self.tree.heading(c, text="★" + arrow)
-                else:
-                    arrow = " ▼" if reverse else " ▲"
-                    self.tree.heading(c, text=c + arrow)
-            else:
-                self.tree.heading(c, text="★" if c == "fav" else c)
+        """
+        Ordena o treeview pela coluna clicada (em memória, sem consultar o banco).
+        As páginas ainda não carregadas são pedidas ao controller e entram na
+        ordenação ao chegar (anexar_lista), então ela cobre a lista inteira.
+        """
+        self._ordenacao.alternar(col)
+        self._ordenacao.ordenar(self.assinaturas_data)
+        # Só a ordem mudou: move as linhas, sem refazer valores nem totais
+        self._lista.reordenar(self.assinaturas_data)
+        if self.controller:
+            self.controller.carregar_restante()
     
-    def _atualizar_treeview(self):
-        """Atualiza o treeview com os dados ordenados."""
-        # Limpa o treeview
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        # Re-adiciona as assinaturas
-        for assinatura in self.assinaturas_data:
-            fav_symbol = "★" if assinatura.favorito == 1 else "☆"
-            
-            self.tree.insert(
-                "",
-                "end",
-                values=(
-                    assinatura.id,  # Hidden but stored
-                    fav_symbol,
-                    assinatura.nome,
-                    f"R$ {assinatura.valor:.2f}",
-                    assinatura.data_vencimento,
-                    assinatura.periodicidade,
-                    assinatura.categoria
-                )
-            )
+    def _atualizar_treeview(self, total=None):
+        """
+        Atualiza o treeview com os dados ordenados (só as linhas que mudaram).
+        total: total já calculado pelo controller (evita nova consulta na thread do Tk)
+        """
+        self._lista.reconciliar(self.assinaturas_data)
         
         # Calcula e atualiza o total usando o controller
         if self.controller:
-            total = self.controller.calcular_total_assinaturas(self.assinaturas_data)
+            if total is None:
+                total = self.controller.calcular_total_assinaturas(self.assinaturas_data)
             self._atualizar_total(total)
-            self._atualizar_diferenca()
+            self._atualizar_diferenca(total)
+    
+    def _valores_linha(self, assinatura):
+        """Valores exibidos na linha de uma assinatura."""
+        fav_symbol = "★" if assinatura.favorito == 1 else "☆"
+        
+        return (
+            assinatura.id,  # Hidden but stored
+            fav_symbol,
+            assinatura.nome,
+            f"R$ {assinatura.valor:.2f}",
+            para_exibicao(assinatura.data_vencimento),
+            assinatura.periodicidade,
+            assinatura.categoria
+        )
+    
+    def _ao_chegar_no_fim(self):
+        """Pede ao controller a próxima página da lista."""
+        if self.controller:
+            self.controller.carregar_mais()
     
     def _atualizar_total(self, total: float):
         """Atualiza o label com o valor total das assinaturas."""
         if hasattr(self, 'label_total'):
             self.label_total.config(text=f"R$ {total:.2f}")
     
-    def _atualizar_diferenca(self):
+    def _atualizar_diferenca(self, total=None):
         """Atualiza o label com a diferença entre meta e total de assinaturas ativas."""
         if hasattr(self, 'label_diferenca') and self.controller:
-            diferenca = self.controller.calcular_diferenca_meta()
+            diferenca = self.controller.calcular_diferenca_meta(total)
             
             # Muda a cor baseado no valor
             if diferenca >= 0:
@@ -497,7 +475,7 @@ class AssinaturasView:
         details = [
             ("Nome:", assinatura.nome),
             ("Valor:", f"R$ {assinatura.valor:.2f}"),
-            ("Data de Vencimento:", assinatura.data_vencimento),
+            ("Data de Vencimento:", para_exibicao(assinatura.data_vencimento)),
             ("Periodicidade:", assinatura.periodicidade),
             ("Categoria:", assinatura.categoria),
             ("Forma de Pagamento:", assinatura.forma_pagamento),
@@ -643,7 +621,7 @@ class AssinaturasView:
         tk.Label(data_frame, text="Vencimento (DD/MM/AAAA): ", font=UI.FONT_LABEL, bg=UI.BOX_BG).pack(side="left")
         tk.Label(data_frame, text="*", font=UI.FONT_LABEL, bg=UI.BOX_BG, fg="#d32f2f").pack(side="left")
         entry_data = tk.Entry(content_frame, font=UI.FONT_ENTRY, bg=UI.ENTRY_BG, fg=UI.ENTRY_FG)
-        entry_data.insert(0, assinatura.data_vencimento)
+        entry_data.insert(0, para_exibicao(assinatura.data_vencimento))
         entry_data.pack(fill="x", pady=(0, 10))
         
         period_frame = tk.Frame(content_frame, bg=UI.BOX_BG)
@@ -744,6 +722,8 @@ class AssinaturasView:
                 
                 if resultado['success']:
                     self.controller.mostrar_sucesso("Sucesso", resultado['message'])
+                elif resultado.get('error_code') == 'DUPLICATE_NAME':
+                    self.controller.exibir_erro_validacao(resultado)
                 else:
                     self.controller.mostrar_erro("Erro no Compartilhamento", resultado['message'])
         
@@ -808,6 +788,8 @@ class AssinaturasView:
                 # Limpa o formulário
                 self.controller.limpar_formulario()
                 self.controller.mostrar_sucesso("Sucesso", resultado['message'])
+            elif resultado.get('error_code') == 'DUPLICATE_NAME':
+                self.controller.exibir_erro_validacao(resultado)
             else:
                 self.controller.mostrar_erro("Erro no Compartilhamento", resultado['message'])
     
@@ -841,19 +823,36 @@ class AssinaturasView:
         self.combo_categoria['values'] = categorias
         self.combo_pagamento['values'] = formas_pagamento
         
-        # Selecionar primeiro item por padrão
-        if periodicidades:
+        # Selecionar primeiro item por padrão (mantém a escolha atual se ainda for válida)
+        if periodicidades and self.combo_periodicidade.get() not in periodicidades:
             self.combo_periodicidade.current(0)
-        if categorias:
+        if categorias and self.combo_categoria.get() not in categorias:
             self.combo_categoria.current(0)
-        if formas_pagamento:
+        if formas_pagamento and self.combo_pagamento.get() not in formas_pagamento:
             self.combo_pagamento.current(0)
     
-    def atualizar_lista(self, assinaturas):
-        """Atualiza a lista de assinaturas no treeview."""
+    def mostrar_carregando(self, ativo: bool):
+        """Exibe/esconde o aviso de carregamento da lista."""
+        self._lista.mostrar_carregando(ativo)
+    
+    def atualizar_lista(self, assinaturas, total=None):
+        """Atualiza a lista de assinaturas no treeview (dados novos: recalcula o total)."""
         # Store full data
         self.assinaturas_data = assinaturas
+        self._ordenacao.invalidar()
+        self._ordenacao.ordenar(self.assinaturas_data)
         
         # Refresh treeview
-        self._atualizar_treeview()
+        self._atualizar_treeview(total)
+    
+    def anexar_lista(self, assinaturas):
+        """Acrescenta uma página de assinaturas, sem redesenhar as já exibidas."""
+        self.assinaturas_data.extend(assinaturas)
+        self._ordenacao.invalidar()
+        if not self._ordenacao.ativa:
+            self._lista.anexar(assinaturas)
+        else:
+            # Mantém a ordenação escolhida: as linhas restantes (carregar_restante) se intercalam às exibidas
+            self._ordenacao.ordenar(self.assinaturas_data)
+            self._lista.reconciliar(self.assinaturas_data)
 
@@ -0,0 +1,75 @@
+from tkinter import ttk
+from typing import Callable, Dict, Iterable, Optional
+
+
+class ColumnSorter:
+    """
+    Ordenação em memória por coluna de um ttk.Treeview (clique no cabeçalho).
+
+    Liga o command de cada cabeçalho, alterna a direção a cada clique e
+    mostra a seta na coluna escolhida. As chaves de ordenação de cada coluna
+    são calculadas uma vez por registro e reaproveitadas até os dados
+    mudarem (invalidar()), então cliques seguintes só reordenam.
+    """
+
+    def __init__(self, tree: ttk.Treeview, chaves: Dict[str, Callable],
+                 ao_ordenar: Callable[[str], None],
+                 rotulos: Optional[Dict[str, str]] = None,
+                 invertidas: Iterable[str] = ()):
+        """
+        Args:
+            tree: Treeview cujos cabeçalhos disparam a ordenação
+            chaves: coluna -> função item -> chave de ordenação
+            ao_ordenar: chamado com a coluna clicada
+            rotulos: texto do cabeçalho, quando diferente do nome da coluna
+            invertidas: colunas com a direção invertida em relação às demais (ex.: favorito)
+        """
+        self.tree = tree
+        self.chaves = chaves
+        self.rotulos = {coluna: (rotulos or {}).get(coluna, coluna) for coluna in chaves}
+        self.invertidas = set(invertidas)
+        self._reverso = {coluna: False for coluna in chaves}
+        self._escolhida = None  # (coluna, reverse) da última ordenação por coluna
+        self._cache = {}  # coluna -> {id: chave}, válido até os dados mudarem
+
+        for coluna in chaves:
+            tree.heading(coluna, text=self.rotulos[coluna], command=lambda c=coluna: ao_ordenar(c))
+
+    @property
+    def ativa(self) -> bool:
+        """Indica se o usuário escolheu uma coluna (a lista não está na ordem do banco)."""
+        return self._escolhida is not None
+
+    def alternar(self, coluna: str) -> None:
+        """Escolhe a coluna (invertendo a direção se já era ela) e atualiza as setas."""
+        self._reverso[coluna] = not self._reverso[coluna]
+        self._escolhida = (coluna, self._reverso[coluna])
+        self._atualizar_cabecalhos()
+
+    def ordenar(self, itens: list) -> None:
+        """Ordena itens (no lugar) pela coluna escolhida, se houver."""
+        if self._escolhida is None:
+            return
+        coluna, reverso = self._escolhida
+
+        chaves = self._cache.get(coluna)
+        if chaves is None:
+            funcao = self.chaves[coluna]
+            chaves = self._cache[coluna] = {item.id: funcao(item) for item in itens}
+
+        if coluna in self.invertidas:
+            reverso = not reverso
+        itens.sort(key=lambda item: chaves[item.id], reverse=reverso)
+
+    def invalidar(self) -> None:
+        """Descarta as chaves calculadas (os dados exibidos mudaram)."""
+        self._cache.clear()
+
+    def _atualizar_cabecalhos(self) -> None:
+        coluna_escolhida, reverso = self._escolhida
+        for coluna, rotulo in self.rotulos.items():
+            if coluna != coluna_escolhida:
+                self.tree.heading(coluna, text=rotulo)
+                continue
+            descendo = reverso != (coluna in self.invertidas)
+            self.tree.heading(coluna, text=rotulo + (" ▼" if descendo else " ▲"))
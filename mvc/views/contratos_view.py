@@ -1,16 +1,29 @@
 import tkinter as tk
 from tkinter import ttk
 from mvc import ui_constants as UI
+from mvc.datas import para_exibicao
+from mvc.views.column_sorter import ColumnSorter
+from mvc.views.virtual_list import VirtualList
 
 
 class ContratosView:
     """View para tela de Contratos (independente, sem herança de AssinaturasView)."""
 
+    # Chave de ordenação de cada coluna do treeview
+    CHAVES_ORDENACAO = {
+        "fav": lambda c: c.favorito,
+        "Nome": lambda c: c.nome,
+        "Valor": lambda c: float(c.valor),
+        "Vencimento": lambda c: c.data_vencimento,
+        "Periodicidade": lambda c: c.periodicidade,
+        "Categoria": lambda c: c.categoria,
+        "Status": lambda c: c.status.value if hasattr(c.status, 'value') else c.status,
+    }
+
     def __init__(self, parent, controller=None):
         self.parent = parent
         self.controller = controller
         self.contratos_data = []  # Store full data for sorting
-        self.sort_reverse = {}  # Track sort direction per column
         self._create_ui()
 
     def _create_ui(self):
@@ -157,12 +170,12 @@ class ContratosView:
         self.combo_categoria['values'] = categorias
         self.combo_forma_pagamento['values'] = formas_pagamento
 
-        # Selecionar primeiro item por padrão
-        if periodicidades:
+        # Selecionar primeiro item por padrão (mantém a escolha atual se ainda for válida)
+        if periodicidades and self.combo_periodicidade.get() not in periodicidades:
             self.combo_periodicidade.current(0)
-        if categorias:
+        if categorias and self.combo_categoria.get() not in categorias:
             self.combo_categoria.current(0)
-        if formas_pagamento:
+        if formas_pagamento and self.combo_forma_pagamento.get() not in formas_pagamento:
             self.combo_forma_pagamento.current(0)
 
     def _create_treeview(self, parent):
@@ -181,15 +194,18 @@ class ContratosView:
             tree_container,
             columns=columns,
             show="headings",
-            yscrollcommand=scrollbar_y.set,
             xscrollcommand=scrollbar_x.set,
             height=15,
             displaycolumns=("fav", "Nome", "Valor", "Vencimento", "Periodicidade", "Categoria", "Status")
         )
 
-        scrollbar_y.config(command=self.tree.yview)
         scrollbar_x.config(command=self.tree.xview)
 
+        # Lista virtualizada: só as linhas visíveis (mais uma margem) existem no Treeview.
+        # Linhas identificadas pelo id do contrato; a próxima página é carregada ao rolar até o fim
+        self._lista = VirtualList(self.tree, scrollbar_y, self._valores_linha,
+                                  ao_chegar_no_fim=self._ao_chegar_no_fim)
+
         # Posicionar scrollbars e treeview
         self.tree.grid(row=0, column=0, sticky="nsew")
         scrollbar_y.grid(row=0, column=1, sticky="ns")
@@ -198,19 +214,9 @@ class ContratosView:
         tree_container.grid_rowconfigure(0, weight=1)
         tree_container.grid_columnconfigure(0, weight=1)
 
-        # Definir colunas com comando de ordenação
-        self.tree.heading("fav", text="★", command=lambda: self._sort_column("fav"))
-        self.tree.heading("Nome", text="Nome", command=lambda: self._sort_column("Nome"))
-        self.tree.heading("Valor", text="Valor", command=lambda: self._sort_column("Valor"))
-        self.tree.heading("Vencimento", text="Vencimento", command=lambda: self._sort_column("Vencimento"))
-        self.tree.heading("Periodicidade", text="Periodicidade", command=lambda: self._sort_column("Periodicidade"))
-        self.tree.heading("Categoria", text="Categoria", command=lambda: self._sort_column("Categoria"))
-        self.tree.heading("Status", text="Status", command=lambda: self._sort_column("Status"))
-
-        # Inicializar dicionário de ordenação
-        self.sort_reverse = {}
-        for col in ("fav", "Nome", "Valor", "Vencimento", "Periodicidade", "Categoria", "Status"):
-            self.sort_reverse[col] = False
+        # Cabeçalhos ordenam a lista em memória; a coluna de favorito tem a direção invertida
+        self._ordenacao = ColumnSorter(self.tree, self.CHAVES_ORDENACAO, self._ordenar_coluna,
+                                       rotulos={"fav": "★"}, invertidas=("fav",))
 
         # Larguras das colunas
         self.tree.column("fav", width=40, minwidth=40, anchor="center")
@@ -286,47 +292,63 @@ class ContratosView:
         )
         self.label_diferenca.pack(side="right", padx=15, pady=10)
 
-    def _refresh_treeview(self):
-        """Atualiza o treeview com os dados ordenados."""
-        # Limpa o treeview
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-
-        # Re-adiciona os contratos
-        for contrato in self.contratos_data:
-            fav_symbol = "★" if contrato.favorito == 1 else "☆"
-            status_value = contrato.status.value if hasattr(contrato.status, 'value') else contrato.status
-
-            self.tree.insert(
-                "",
-                "end",
-                values=(
-                    contrato.id,
-                    fav_symbol,
-                    contrato.nome,
-                    f"R$ {contrato.valor:.2f}",
-                    contrato.data_vencimento,
-                    contrato.periodicidade,
-                    contrato.categoria,  # Categoria do contrato
-                    status_value
-                )
-            )
+    def _ordenar_coluna(self, col):
+        """
+        Ordena o treeview pela coluna clicada (em memória, sem consultar o banco).
+        As páginas ainda não carregadas são pedidas ao controller e entram na
+        ordenação ao chegar (anexar_lista), então ela cobre a lista inteira.
+        """
+        self._ordenacao.alternar(col)
+        self._ordenacao.ordenar(self.contratos_data)
+        # Só a ordem mudou: move as linhas, sem refazer valores nem totais
+        self._lista.reordenar(self.contratos_data)
+        if self.controller:
+            self.controller.carregar_restante()
+
+    def _refresh_treeview(self, total=None):
+        """
+        Atualiza o treeview com os dados ordenados (só as linhas que mudaram).
+        total: total já calculado pelo controller (evita nova consulta na thread do Tk)
+        """
+        self._lista.reconciliar(self.contratos_data)
 
         # Calcula e atualiza o total usando o controller
         if self.controller:
-            total = self.controller.calcular_total_contratos(self.contratos_data)
+            if total is None:
+                total = self.controller.calcular_total_contratos(self.contratos_data)
             self._atualizar_total(total)
-            self._atualizar_diferenca()
+            self._atualizar_diferenca(total)
+
+    def _valores_linha(self, contrato):
+        """Valores exibidos na linha de um contrato."""
+        fav_symbol = "★" if contrato.favorito == 1 else "☆"
+        status_value = contrato.status.value if hasattr(contrato.status, 'value') else contrato.status
+
+        return (
+            contrato.id,
+            fav_symbol,
+            contrato.nome,
+            f"R$ {contrato.valor:.2f}",
+            para_exibicao(contrato.data_vencimento),
+            contrato.periodicidade,
+            contrato.categoria,  # Categoria do contrato
+            status_value
+        )
+
+    def _ao_chegar_no_fim(self):
+        """Pede ao controller a próxima página da lista."""
+        if self.controller:
+            self.controller.carregar_mais()
 
     def _atualizar_total(self, total: float):
         """Atualiza o label com o valor total dos contratos."""
         if hasattr(self, 'label_total'):
             self.label_total.config(text=f"R$ {total:.2f}")
     
-    def _atualizar_diferenca(self):
+    def _atualizar_diferenca(self, total=None):
         """Atualiza o label com a diferença entre meta e total de contratos ativos."""
         if hasattr(self, 'label_diferenca') and self.controller:
-            diferenca = self.controller.calcular_diferenca_meta()
+            diferenca = self.controller.calcular_diferenca_meta(total)
             
             # Muda a cor baseado no valor
             if diferenca >= 0:
@@ -367,6 +389,8 @@ class ContratosView:
                 # Limpa o formulário
                 self.controller.clear_form()
                 self.controller.mostrar_sucesso("Sucesso", resultado['message'])
+            elif resultado.get('error_code') == 'DUPLICATE_NAME':
+                self.controller.exibir_erro_validacao(resultado)
             else:
                 self.controller.mostrar_erro("Erro", resultado['message'])
 
@@ -486,7 +510,7 @@ class ContratosView:
         details = [
             ("Nome:", contrato.nome),
             ("Valor:", f"R$ {contrato.valor:.2f}"),
-            ("Data de Vencimento:", contrato.data_vencimento),
+            ("Data de Vencimento:", para_exibicao(contrato.data_vencimento)),
             ("Periodicidade:", contrato.periodicidade),
             ("Categoria:", contrato.categoria),  # Categoria do contrato
         ]
@@ -589,7 +613,7 @@ class ContratosView:
         tk.Label(data_frame, text="Vencimento (DD/MM/AAAA): ", font=UI.FONT_LABEL, bg=UI.BOX_BG).pack(side="left")
         tk.Label(data_frame, text="*", font=UI.FONT_LABEL, bg=UI.BOX_BG, fg="#d32f2f").pack(side="left")
         entry_data = tk.Entry(content_frame, font=UI.FONT_ENTRY, bg=UI.ENTRY_BG, fg=UI.ENTRY_FG)
-        entry_data.insert(0, contrato.data_vencimento)
+        entry_data.insert(0, para_exibicao(contrato.data_vencimento))
         entry_data.pack(fill="x", pady=(0, 10))
 
         period_frame = tk.Frame(content_frame, bg=UI.BOX_BG)
@@ -680,6 +704,8 @@ class ContratosView:
                 
                 if resultado['success']:
                     self.controller.mostrar_sucesso("Sucesso", resultado['message'])
+                elif resultado.get('error_code') == 'DUPLICATE_NAME':
+                    self.controller.exibir_erro_validacao(resultado)
                 else:
                     self.controller.mostrar_erro("Erro", resultado['message'])
         
@@ -744,10 +770,27 @@ class ContratosView:
                 if self.controller:
                     self.controller.toggle_favorito(contrato_id)
     
-    def atualizar_lista(self, contratos):
-        """Atualiza a lista de contratos no treeview."""
+    def mostrar_carregando(self, ativo: bool):
+        """Exibe/esconde o aviso de carregamento da lista."""
+        self._lista.mostrar_carregando(ativo)
+    
+    def atualizar_lista(self, contratos, total=None):
+        """Atualiza a lista de contratos no treeview (dados novos: recalcula o total)."""
         # Store full data
         self.contratos_data = contratos
+        self._ordenacao.invalidar()
+        self._ordenacao.ordenar(self.contratos_data)
         
         # Refresh treeview
-        self._refresh_treeview()
\ No newline at end of file
+        self._refresh_treeview(total)
+
+    def anexar_lista(self, contratos):
+        """Acrescenta uma página de contratos, sem redesenhar os já exibidos."""
+        self.contratos_data.extend(contratos)
+        self._ordenacao.invalidar()
+        if not self._ordenacao.ativa:
+            self._lista.anexar(contratos)
+        else:
+            # Mantém a ordenação escolhida: as linhas restantes (carregar_restante) se intercalam às exibidas
+            self._ordenacao.ordenar(self.contratos_data)
+            self._lista.reconciliar(self.contratos_data)
\ No newline at end of file
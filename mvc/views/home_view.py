@@ -9,22 +9,48 @@ from mvc.controllers.assinaturas_controller import AssinaturasController
 from mvc.views.contratos_view import ContratosView
 from mvc.controllers.contratos_controller import ContratosController
 from mvc.views.pagamentos_view import PagamentosView
+from mvc.controllers.background_executor import executor_de_dados
 
 
 class HomeView:
-    """View for home screen with navigation."""
+    """
+    View for home screen with navigation.
+
+    Cada tela (home, assinaturas, contratos, metas, perfil, pagamentos) é
+    construída uma vez por sessão, com sua view, controller e DAOs, e fica
+    guardada em self._telas; a navegação só esconde a tela atual e exibe a
+    escolhida. Ao sair de uma tela, as telas cujos dados ela pode ter
+    alterado (TELAS_AFETADAS) são marcadas como desatualizadas e só elas
+    recarregam seus dados quando voltam a ser exibidas.
+
+    As telas com lista leem o banco no executor de dados compartilhado; ao
+    sair de uma tela, as leituras dela ainda em andamento são descartadas
+    (e a tela fica marcada para recarregar na volta).
+    """
+
+    # tela -> telas que exibem dados que ela pode alterar
+    TELAS_AFETADAS = {
+        "metas": ("home", "assinaturas", "contratos"),  # limites
+        "pagamentos": ("assinaturas", "contratos"),  # meios de pagamento dos formulários
+    }
 
     def __init__(self, parent, usuario_controller=None):
         self.parent = parent
         self.usuario_controller = usuario_controller
         self.frame = tk.Frame(parent, bg=UI.BG_COLOR)
         self._home_imgs = []
+        self._home_valores = {}  # título do card -> label com o limite
         self.navbar = None
         self.metas_view = None
         self.perfil_view = None
+        self.pagamentos_view = None
         self.assinaturas_controller = None
         self.contratos_controller = None
         self.on_logout = None
+        self._telas = {}  # nome -> frame da tela já construída
+        self._tela_atual = None
+        self._telas_desatualizadas = set()
+        self._usuario_das_telas = None  # user_id para o qual as telas foram construídas
         # Don't create home screen yet - will be created on first show
 
     def aside_perfil(self):
@@ -63,18 +89,10 @@ class HomeView:
                     bg=UI.BOX_CARD_BG).pack(pady=(0, 30))
 
         # Botões
-        def abrir_pagamentos():
-            for w in self.frame.winfo_children():
-                w.destroy()
-            self._render_navbar(self.frame, active="")
-            content = tk.Frame(self.frame, bg=UI.BG_COLOR)
-            content.pack(fill="both", expand=True)
-            PagamentosView(content, self.usuario_controller)
-
         botoes_config = [
             ("Fazer backup", None),
             ("Restaurar backup", None),
-            ("Meios de pagamento", abrir_pagamentos),
+            ("Meios de pagamento", self.show_pagamentos_screen),
             ("Sair", self._on_logout)
         ]
 
@@ -101,15 +119,107 @@ class HomeView:
         
         self.navbar = NavbarView(parent, active=active, callback_dict=callbacks)
 
-    def _create_home_screen(self):
-        for widget in self.frame.winfo_children():
-            widget.destroy()
+    # ---------------- CACHE DE TELAS ----------------
+    def _mostrar_tela(self, nome: str, construir, active: str = ""):
+        """
+        Exibe a tela `nome`, construindo-a na primeira vez com construir(content).
+        Telas já construídas são apenas reexibidas; se estiverem marcadas como
+        desatualizadas, recarregam seus dados antes.
+        """
+        self._fechar_aside()
+        self._validar_usuario_das_telas()
+
+        if self._tela_atual is not None and self._tela_atual != nome:
+            self._telas[self._tela_atual].pack_forget()
+            self.marcar_desatualizadas(*self.TELAS_AFETADAS.get(self._tela_atual, ()))
+            if self._cancelar_carregamento(self._tela_atual):
+                self.marcar_desatualizadas(self._tela_atual)
+
+        tela = self._telas.get(nome)
+        if tela is None:
+            tela = tk.Frame(self.frame, bg=UI.BG_COLOR)
+            self._render_navbar(tela, active=active)
+            content = tk.Frame(tela, bg=UI.BG_COLOR)
+            content.pack(fill="both", expand=True)
+            construir(content)
+            self._telas[nome] = tela
+            self._telas_desatualizadas.discard(nome)
+        elif nome in self._telas_desatualizadas:
+            self._telas_desatualizadas.discard(nome)
+            self._atualizar_tela(nome)
+
+        if self._tela_atual != nome or not tela.winfo_ismapped():
+            tela.pack(fill="both", expand=True)
+        self._tela_atual = nome
+
+    def _atualizar_tela(self, nome: str):
+        """Recarrega os dados de uma tela já construída."""
+        if nome == "home":
+            self._atualizar_home()
+        elif nome == "assinaturas" and self.assinaturas_controller:
+            self.assinaturas_controller.recarregar()
+        elif nome == "contratos" and self.contratos_controller:
+            self.contratos_controller.recarregar()
+        elif nome == "pagamentos" and self.pagamentos_view:
+            self.pagamentos_view.recarregar()
+
+    def _carregador(self, nome: str):
+        """Objeto que carrega os dados da tela `nome` no executor (ou None)."""
+        return {
+            "assinaturas": self.assinaturas_controller,
+            "contratos": self.contratos_controller,
+            "pagamentos": self.pagamentos_view,
+        }.get(nome)
+
+    def _cancelar_carregamento(self, nome: str) -> bool:
+        """Descarta as leituras pendentes da tela; True se havia alguma."""
+        carregador = self._carregador(nome)
+        return carregador.cancelar_carregamento() if carregador else False
+
+    def marcar_desatualizadas(self, *nomes: str):
+        """Marca telas cujos dados devem ser recarregados na próxima exibição."""
+        self._telas_desatualizadas.update(nomes)
+
+    def limpar_telas(self):
+        """
+        Destrói todas as telas guardadas, com os dados já carregados nelas
+        (logout ou troca de usuário); a próxima exibição reconstrói do zero.
+        """
+        for nome in self._telas:
+            self._cancelar_carregamento(nome)
+        for tela in self._telas.values():
+            tela.destroy()
+        self._telas.clear()
+        self._telas_desatualizadas.clear()
+        self._tela_atual = None
+        self._usuario_das_telas = None
+        self._home_valores = {}
+        self.navbar = None
+        self.metas_view = None
+        self.perfil_view = None
+        self.pagamentos_view = None
+        self.assinaturas_controller = None
+        self.contratos_controller = None
+
+    def _validar_usuario_das_telas(self):
+        """As telas guardadas pertencem a um usuário; outro login começa do zero."""
+        user_id = self._user_id()
+        if user_id != self._usuario_das_telas:
+            self.limpar_telas()
+            self._usuario_das_telas = user_id
+
+    def _user_id(self):
+        return self.usuario_controller.get_user_id() if self.usuario_controller else None
 
-        # Header
-        self._render_navbar(self.frame, active="")
+    def _fechar_aside(self):
+        for widget in self.frame.winfo_children():
+            if isinstance(widget, tk.Frame) and hasattr(widget, '_aside_perfil_flag'):
+                widget.destroy()
 
+    # ---------------- TELAS ----------------
+    def _create_home_screen(self, parent):
         # Conteúdo
-        content_frame = tk.Frame(self.frame, bg=UI.BG_COLOR)
+        content_frame = tk.Frame(parent, bg=UI.BG_COLOR)
         content_frame.pack(fill="both", expand=True)
 
         # Dividir em 2: esquerda 1/3, direita 2/3
@@ -143,13 +253,7 @@ class HomeView:
             btn.pack(fill="both", expand=True, pady=25, padx=5)
 
         # Prévia das metas
-        uc = self.usuario_controller
-        if uc and getattr(uc, "usuario", None):
-            val_ass = float(uc.get_limite_assinaturas())
-            val_con = float(uc.get_limite_contratos())
-        else:
-            val_ass = 0.0
-            val_con = 0.0
+        val_ass, val_con = self._limites()
 
         cards_container = tk.Frame(right_frame, bg=UI.BG_COLOR)
         cards_container.pack(fill="both", expand=True)
@@ -166,6 +270,21 @@ class HomeView:
         self._home_meta_card(mini_row, "Assinaturas", val_ass)
         self._home_meta_card(mini_row, "Contratos", val_con)
 
+    def _limites(self):
+        """Limites (assinaturas, contratos) do usuário logado."""
+        uc = self.usuario_controller
+        if uc and getattr(uc, "usuario", None):
+            return float(uc.get_limite_assinaturas()), float(uc.get_limite_contratos())
+        return 0.0, 0.0
+
+    def _atualizar_home(self):
+        """Atualiza só os valores dos cards de metas da home."""
+        val_ass, val_con = self._limites()
+        for titulo, valor in (("Assinaturas", val_ass), ("Contratos", val_con)):
+            label = self._home_valores.get(titulo)
+            if label is not None:
+                label.config(text=self._format_metas_display(valor))
+
     def _format_metas_display(self, valor: float) -> str:
         sign = "-" if valor < 0 else ""
         v = abs(float(valor))
@@ -211,62 +330,52 @@ class HomeView:
                         font=("Arial", 12, "bold"),
                         bg=box_bg)
         val_lbl.place(in_=circle_lbl, relx=0.5, rely=0.5, anchor="center")
+        self._home_valores[titulo] = val_lbl
 
     def show_metas_screen(self):
         """Mostra a tela Metas."""
-        for w in self.frame.winfo_children():
-            w.destroy()
-
-        self._render_navbar(self.frame, active="Metas")
+        def construir(content):
+            self.metas_view = MetasView(content, self.usuario_controller)
 
-        content = tk.Frame(self.frame, bg=UI.BG_COLOR)
-        content.pack(fill="both", expand=True)
-
-        self.metas_view = MetasView(content, self.usuario_controller)
+        self._mostrar_tela("metas", construir, active="Metas")
 
     def show_profile_screen(self):
         """Mostra a tela de perfil."""
-        for w in self.frame.winfo_children():
-            w.destroy()
+        def construir(content):
+            self.perfil_view = PerfilView(content, self.usuario_controller)
 
-        self._render_navbar(self.frame, active="")
+        self._mostrar_tela("profile", construir)
 
-        content = tk.Frame(self.frame, bg=UI.BG_COLOR)
-        content.pack(fill="both", expand=True)
+    def show_pagamentos_screen(self):
+        """Mostra a tela de meios de pagamento."""
+        def construir(content):
+            self.pagamentos_view = PagamentosView(content, self.usuario_controller, executor_de_dados(self.frame))
 
-        self.perfil_view = PerfilView(content, self.usuario_controller)
+        self._mostrar_tela("pagamentos", construir)
 
     def show_assinaturas_screen(self):
         """Mostra a tela de Assinaturas."""
-        for w in self.frame.winfo_children():
-            w.destroy()
-
-        self._render_navbar(self.frame, active="Assinaturas")
-
-        content = tk.Frame(self.frame, bg=UI.BG_COLOR)
-        content.pack(fill="both", expand=True)
+        def construir(content):
+            assinaturas_view = AssinaturasView(content)
+            self.assinaturas_controller = AssinaturasController(
+                assinaturas_view, self._user_id(), self.usuario_controller, executor_de_dados(self.frame)
+            )
 
-        assinaturas_view = AssinaturasView(content)
-        user_id = self.usuario_controller.usuario.id if self.usuario_controller and hasattr(self.usuario_controller, 'usuario') else None
-        self.assinaturas_controller = AssinaturasController(assinaturas_view, user_id, self.usuario_controller)
+        self._mostrar_tela("assinaturas", construir, active="Assinaturas")
 
     def show_contratos_screen(self):
         """Mostra a tela de Contratos."""
-        for w in self.frame.winfo_children():
-            w.destroy()
-
-        self._render_navbar(self.frame, active="Contratos")
-
-        content = tk.Frame(self.frame, bg=UI.BG_COLOR)
-        content.pack(fill="both", expand=True)
+        def construir(content):
+            contratos_view = ContratosView(content)
+            self.contratos_controller = ContratosController(
+                contratos_view, self._user_id(), self.usuario_controller, executor_de_dados(self.frame)
+            )
 
-        contratos_view = ContratosView(content)
-        user_id = self.usuario_controller.usuario.id if self.usuario_controller and hasattr(self.usuario_controller, 'usuario') else None
-        self.contratos_controller = ContratosController(contratos_view, user_id, self.usuario_controller)
+        self._mostrar_tela("contratos", construir, active="Contratos")
 
     def show_home_screen(self):
-        """Recarrega a home screen."""
-        self._create_home_screen()
+        """Mostra a home screen."""
+        self._mostrar_tela("home", self._create_home_screen)
 
     def show_message(self, title, message):
         messagebox.showinfo(title, message)
@@ -277,8 +386,8 @@ class HomeView:
     def show(self):
         self.frame.pack(fill="both", expand=True)
         # Create home screen content if not already created
-        if not self.navbar:
-            self._create_home_screen()
+        if self._tela_atual is None:
+            self.show_home_screen()
 
     def hide(self):
         self.frame.pack_forget()
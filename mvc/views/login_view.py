@@ -96,6 +96,13 @@ class LoginView:
         )
         self.switch_to_register_button.pack(pady=UI.PAD_Y)
 
+    def set_busy(self, busy: bool):
+        """Bloqueia os botões enquanto a senha é processada em segundo plano."""
+        state = "disabled" if busy else "normal"
+        self.login_button.config(state=state, text="Entrando..." if busy else "Login")
+        self.switch_to_register_button.config(state=state)
+        self.frame.config(cursor="watch" if busy else "")
+
     def show(self):
         self.frame.pack(fill="both", expand=True)
 
@@ -6,14 +6,25 @@ from tkcalendar import DateEntry
 from mvc import ui_constants as UI
 from mvc.models.forma_pagamento_enum import FormaPagamento
 from mvc.controllers.pagamentos_controller import PagamentosController
+from mvc.controllers.background_executor import InlineExecutor
+from mvc.views.virtual_list import VirtualList
+from dao import PAGINA_PADRAO, NomeDuplicadoError
 
 class PagamentosView:
     """View para gerenciamento de métodos de pagamento."""
 
-    def __init__(self, parent, usuario_controller=None):
+    # Chaves das leituras no executor
+    CHAVE_LISTA = "pagamentos:lista"
+    CHAVE_MAIS = "pagamentos:mais"
+
+    def __init__(self, parent, usuario_controller=None, executor=None):
         self.parent = parent
-        user_id = usuario_controller.usuario.id if usuario_controller and usuario_controller.usuario else None
+        user_id = usuario_controller.get_user_id() if usuario_controller else None
         self.controller = PagamentosController(user_id=user_id)
+        # Leituras do banco rodam no executor; sem ele, na própria thread
+        self.executor = executor or InlineExecutor()
+        self._proxima_pagina = None  # cursor da próxima página da lista
+        self._carregados = 0  # quantos pagamentos a lista exibida já tem
         self._setup_ui()
         self._load_data()
 
@@ -172,13 +183,16 @@ class PagamentosView:
             columns=("id", "nome", "forma", "vencimento"),
             show="headings",
             height=15,
-            yscrollcommand=scrollbar_y.set,
             xscrollcommand=scrollbar_x.set,
             displaycolumns=("nome", "forma", "vencimento")  # Apenas estas colunas serão exibidas
         )
         
-        scrollbar_y.config(command=self.tree.yview)
         scrollbar_x.config(command=self.tree.xview)
+
+        # Lista virtualizada: só as linhas visíveis (mais uma margem) existem no Treeview.
+        # A próxima página é carregada ao rolar até o fim
+        self._lista = VirtualList(self.tree, scrollbar_y, self._valores_linha,
+                                  ao_chegar_no_fim=self._carregar_mais)
         
         # Posicionar scrollbars e treeview
         self.tree.grid(row=0, column=0, sticky="nsew")
@@ -224,8 +238,7 @@ class PagamentosView:
 
     def _abrir_janela_edicao(self, pagamento_id):
         """Abre janela para editar ou excluir um pagamento."""
-        pagamentos = self.controller.listar_pagamentos()
-        pagamento = next((p for p in pagamentos if getattr(p, 'id', None) == pagamento_id), None)
+        pagamento = self.controller.obter_pagamento(pagamento_id)
         
         if not pagamento:
             self._mostrar_erro("Pagamento não encontrado!")
@@ -357,6 +370,8 @@ class PagamentosView:
                 )
                 self._load_data()
                 edit_window.destroy()
+            except NomeDuplicadoError:
+                self._mostrar_erro("Já existe um método de pagamento com esse nome.")
             except Exception as e:
                 self._mostrar_erro(str(e))
 
@@ -446,14 +461,8 @@ class PagamentosView:
         """Verifica se já existe um pagamento com o mesmo nome (case-insensitive).
            Se ignore_id for fornecido, ignora o registro com esse id (útil na edição).
         """
-        nome_clean = nome.strip().lower()
         try:
-            for p in self.controller.listar_pagamentos():
-                pid = getattr(p, "id", None)
-                if ignore_id is not None and pid == ignore_id:
-                    continue
-                if getattr(p, "nome", "").strip().lower() == nome_clean:
-                    return True
+            return self.controller.nome_existe(nome, ignore_id)
         except Exception:
             # Em caso de erro ao listar, não considerar como duplicado
             pass
@@ -484,35 +493,77 @@ class PagamentosView:
             # Recarrega dados
             self._load_data()
             
+        except NomeDuplicadoError:
+            self._mostrar_erro("Já existe um método de pagamento com esse nome.")
         except Exception as e:
             self._mostrar_erro(str(e))
 
     def _load_data(self):
-        """Carrega os dados na TreeView."""
-        # Limpa dados existentes
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-
-        # Carrega novos dados
-        pagamentos = self.controller.listar_pagamentos()
-        for pagamento in pagamentos:
-            try:
-                # Formata a data apenas se existir
-                data_formatada = (
-                    pagamento.vencimento.strftime("%d/%m/%Y")
-                    if pagamento.vencimento
-                    else "Sem vencimento"
-                )
-                
-                values = (
-                    getattr(pagamento, 'id', ''),  # ID oculto
-                    pagamento.nome,
-                    pagamento.forma_de_pagamento.value,
-                    data_formatada
-                )
-                self.tree.insert("", "end", values=values)
-            except Exception as e:
-                print(f"Erro ao inserir pagamento na TreeView: {str(e)}")
+        """Carrega os dados na TreeView (mantendo a posição de rolagem), lendo no executor."""
+        # Relê tudo o que já estava na tela (ao menos uma página), para que
+        # salvar ou excluir não encolha a lista; o resto vem ao rolar (_carregar_mais)
+        limite = max(PAGINA_PADRAO, self._carregados)
+        self.executor.cancelar(self.CHAVE_MAIS)
+        self._lista.mostrar_carregando(True)
+        self.executor.submit(
+            self.CHAVE_LISTA, self.controller.listar_pagina, None, limite, substituir=True,
+            on_success=self._exibir_pagamentos, on_error=self._falha_ao_carregar
+        )
+
+    def _exibir_pagamentos(self, resultado):
+        pagamentos, self._proxima_pagina = resultado
+        self._carregados = len(pagamentos)
+        self._lista.mostrar_carregando(False)
+        self._lista.reconciliar(pagamentos)
+
+    def _carregar_mais(self):
+        """Anexa a próxima página de pagamentos ao fim da lista."""
+        if self._proxima_pagina is None or self.executor.is_busy(self.CHAVE_LISTA):
+            return
+        self.executor.submit(
+            self.CHAVE_MAIS, self.controller.listar_pagina, self._proxima_pagina,
+            on_success=self._anexar_pagamentos, on_error=self._falha_ao_carregar
+        )
+
+    def _anexar_pagamentos(self, resultado):
+        pagamentos, self._proxima_pagina = resultado
+        self._carregados += len(pagamentos)
+        self._lista.anexar(pagamentos)
+
+    def _falha_ao_carregar(self, erro):
+        self._lista.mostrar_carregando(False)
+        self._mostrar_erro(f"Não foi possível carregar os pagamentos: {erro}")
+
+    def cancelar_carregamento(self) -> bool:
+        """
+        Descarta as leituras em andamento (ex.: o usuário saiu da tela).
+
+        Returns:
+            bool: True se alguma leitura foi descartada
+        """
+        cancelados = [self.executor.cancelar(chave) for chave in (self.CHAVE_LISTA, self.CHAVE_MAIS)]
+        self._lista.mostrar_carregando(False)
+        return any(cancelados)
+
+    def recarregar(self):
+        """Recarrega a lista (tela reexibida com dados desatualizados)."""
+        self._load_data()
+
+    def _valores_linha(self, pagamento):
+        """Valores exibidos na linha de um pagamento."""
+        # Formata a data apenas se existir
+        data_formatada = (
+            pagamento.vencimento.strftime("%d/%m/%Y")
+            if pagamento.vencimento
+            else "Sem vencimento"
+        )
+
+        return (
+            pagamento.id,  # ID oculto
+            pagamento.nome,
+            pagamento.forma_de_pagamento.value,
+            data_formatada
+        )
     
     def _mostrar_erro(self, mensagem: str):
         """Método centralizado para exibir mensagens de erro."""
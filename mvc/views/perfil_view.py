@@ -1,16 +1,22 @@
 import tkinter as tk
 from tkinter import messagebox
 from mvc import ui_constants as UI
+from mvc.controllers.background_executor import executor_de_autenticacao
 
 class PerfilView:
     def __init__(self, parent, usuario_controller, on_profile_updated=None):
         self.parent = parent
         self.usuario_controller = usuario_controller
-        self.usuario = usuario_controller.usuario
         self.on_profile_updated = on_profile_updated
         self._placeholders = {}
+        self.executor = executor_de_autenticacao(parent)
         self._create_profile_screen()
 
+    @property
+    def usuario(self):
+        """Usuário da sessão atual, lido do controller a cada uso."""
+        return self.usuario_controller.usuario
+
     def _add_placeholder(self, entry, text, is_password=False):
         def on_focus_in(event):
             if entry.get() == text:
@@ -102,11 +108,27 @@ class PerfilView:
             messagebox.showerror("Erro de Validação", "A senha deve ter pelo menos 6 caracteres.")
             return
 
-        try:
-            self.usuario_controller.update_profile(new_name, new_email, new_password)
-            # Atualiza visual da sidebar se callback disponível
-            if callable(self.on_profile_updated):
-                self.on_profile_updated()
-            messagebox.showinfo("Sucesso", "Perfil atualizado com sucesso!")
-        except Exception as e:
-            messagebox.showerror("Erro", str(e))
+        # O hash da nova senha é gerado em segundo plano; cliques repetidos são ignorados
+        if self.usuario_controller.update_profile_async(
+            self.executor, new_name, new_email, new_password,
+            on_success=self._perfil_salvo,
+            on_error=self._perfil_falhou,
+        ) and self.executor.is_busy("perfil"):
+            self._set_busy(True)
+
+    def _set_busy(self, busy: bool):
+        self.save_button.config(
+            state="disabled" if busy else "normal",
+            text="Salvando..." if busy else "Salvar Alterações"
+        )
+
+    def _perfil_salvo(self):
+        self._set_busy(False)
+        # Atualiza visual da sidebar se callback disponível
+        if callable(self.on_profile_updated):
+            self.on_profile_updated()
+        messagebox.showinfo("Sucesso", "Perfil atualizado com sucesso!")
+
+    def _perfil_falhou(self, erro: Exception):
+        self._set_busy(False)
+        messagebox.showerror("Erro", str(erro))
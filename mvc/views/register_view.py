@@ -105,6 +105,13 @@ class RegisterView:
         )
         self.switch_to_login_button.pack(pady=UI.PAD_Y)
 
+    def set_busy(self, busy: bool):
+        """Bloqueia os botões enquanto a senha é processada em segundo plano."""
+        state = "disabled" if busy else "normal"
+        self.register_button.config(state=state, text="Registrando..." if busy else "Registrar")
+        self.switch_to_login_button.config(state=state)
+        self.frame.config(cursor="watch" if busy else "")
+
     def show(self):
         self.frame.pack(fill="both", expand=True)
 
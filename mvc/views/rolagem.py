@@ -0,0 +1,32 @@
+import tkinter as tk
+from typing import Callable
+
+
+def monitorar_fim(widget: tk.Misc, destino: Callable, callback: Callable, limiar: float = 0.9) -> Callable:
+    """
+    Retorna uma função (primeiro, ultimo) no formato de yscrollcommand que
+    repassa as frações para destino (ex.: scrollbar.set) e chama callback
+    quando ultimo >= limiar. O callback roda em after_idle, no máximo um
+    agendamento por vez.
+
+    Usado pela VirtualList nas listas paginadas: as páginas seguintes são
+    carregadas conforme o usuário rola. Se a lista ainda não preenche a área
+    visível, o callback também é chamado, completando a tela.
+    """
+    agendado = [False]
+
+    def _executar():
+        agendado[0] = False
+        callback()
+
+    def _yscroll(primeiro, ultimo):
+        destino(primeiro, ultimo)
+        if float(ultimo) >= limiar and not agendado[0]:
+            try:
+                widget.after_idle(_executar)
+                agendado[0] = True
+            except tk.TclError:
+                # Widget já destruído
+                pass
+
+    return _yscroll
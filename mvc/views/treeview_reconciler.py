@@ -0,0 +1,142 @@
+from bisect import bisect_left
+from tkinter import ttk
+from typing import Callable, Iterable
+
+
+class TreeviewReconciler:
+    """
+    Mantém um ttk.Treeview sincronizado com uma lista de registros sem
+    apagar e reinserir tudo a cada atualização.
+
+    Cada linha usa o id do registro como iid. A cada reconciliar(), a nova
+    lista é comparada com a última exibida e o Treeview recebe apenas as
+    operações necessárias: delete das linhas que saíram, insert das novas,
+    item(values=...) das que mudaram e move das que trocaram de posição.
+    Alternar o favorito de um registro mexe em uma linha (e a move), não
+    na lista inteira.
+    """
+
+    def __init__(self, tree: ttk.Treeview, valores: Callable, chave: Callable = lambda item: item.id):
+        """
+        Args:
+            tree: Treeview a manter
+            valores: função item -> tupla de valores da linha
+            chave: função item -> identificador único (vira o iid)
+        """
+        self.tree = tree
+        self.valores = valores
+        self.chave = chave
+        self._valores = {}  # iid -> tupla exibida
+        self._ordem = []  # iids na ordem exibida
+
+    def iid(self, item) -> str:
+        return str(self.chave(item))
+
+    # ---------------- SINCRONIZAÇÃO ----------------
+    def reconciliar(self, itens: Iterable) -> dict:
+        """
+        Faz o Treeview exibir exatamente `itens`, nesta ordem.
+
+        Returns:
+            dict: quantidade de linhas {'inseridas', 'atualizadas', 'movidas', 'removidas'}
+        """
+        novos = [(self.iid(item), self.valores(item)) for item in itens]
+        novos_iids = {iid for iid, _valores in novos}
+        resumo = {'inseridas': 0, 'atualizadas': 0, 'movidas': 0, 'removidas': 0}
+
+        removidos = [iid for iid in self._ordem if iid not in novos_iids]
+        if removidos:
+            self.tree.delete(*removidos)
+            for iid in removidos:
+                del self._valores[iid]
+            resumo['removidas'] = len(removidos)
+
+        # Linhas que ficam no lugar: a maior subsequência que já está na ordem nova.
+        # As demais saem da tela (detach) e voltam direto na posição final.
+        posicao_atual = {iid: i for i, iid in enumerate(iid for iid in self._ordem if iid in novos_iids)}
+        existentes = [iid for iid, _valores in novos if iid in posicao_atual]
+        fixas = _maior_subsequencia_crescente(existentes, posicao_atual)
+        fora_do_lugar = [iid for iid in existentes if iid not in fixas]
+        if fora_do_lugar:
+            self.tree.detach(*fora_do_lugar)
+            resumo['movidas'] = len(fora_do_lugar)
+
+        # Com as linhas fora do lugar destacadas, o que resta na tela está na
+        # ordem nova; cada linha inserida/reposicionada vai direto para o índice final.
+        for posicao, (iid, valores) in enumerate(novos):
+            anterior = self._valores.get(iid)
+            if anterior is None:
+                self.tree.insert("", posicao, iid=iid, values=valores)
+                resumo['inseridas'] += 1
+            else:
+                if anterior != valores:
+                    self.tree.item(iid, values=valores)
+                    resumo['atualizadas'] += 1
+                if iid not in fixas:
+                    self.tree.move(iid, "", posicao)
+            self._valores[iid] = valores
+
+        self._ordem = [iid for iid, _valores in novos]
+        return resumo
+
+    def reordenar(self, itens: Iterable) -> None:
+        """
+        Reordena as linhas já exibidas (ex.: ordenação por coluna) sem
+        recalcular nem reenviar os valores. Se o conjunto de ids mudou,
+        faz uma reconciliação completa.
+        """
+        itens = list(itens)
+        ordem = [self.iid(item) for item in itens]
+        if len(ordem) != len(self._ordem) or set(ordem) != self._valores.keys():
+            self.reconciliar(itens)
+            return
+        # Uma única chamada ao Tk substitui a ordem de todos os filhos
+        self.tree.set_children("", *ordem)
+        self._ordem = ordem
+
+    def anexar(self, itens: Iterable) -> None:
+        """Acrescenta itens ao fim (ex.: próxima página); ids já exibidos são apenas atualizados."""
+        for item in itens:
+            iid = self.iid(item)
+            valores = self.valores(item)
+            if iid in self._valores:
+                if self._valores[iid] != valores:
+                    self.tree.item(iid, values=valores)
+            else:
+                self.tree.insert("", "end", iid=iid, values=valores)
+                self._ordem.append(iid)
+            self._valores[iid] = valores
+
+    def limpar(self) -> None:
+        """Remove todas as linhas."""
+        if self._ordem:
+            self.tree.delete(*self._ordem)
+        self._valores.clear()
+        self._ordem = []
+
+
+def _maior_subsequencia_crescente(iids: list, posicao: dict) -> set:
+    """
+    Retorna os iids da maior subsequência de `iids` cujas posições antigas
+    (posicao[iid]) são crescentes, em O(n log n).
+    """
+    caudas = []  # posição antiga no fim de cada subsequência de tamanho i + 1
+    indices_caudas = []
+    predecessor = [-1] * len(iids)
+    for i, iid in enumerate(iids):
+        valor = posicao[iid]
+        k = bisect_left(caudas, valor)
+        if k == len(caudas):
+            caudas.append(valor)
+            indices_caudas.append(i)
+        else:
+            caudas[k] = valor
+            indices_caudas[k] = i
+        predecessor[i] = indices_caudas[k - 1] if k > 0 else -1
+
+    fixas = set()
+    i = indices_caudas[-1] if indices_caudas else -1
+    while i >= 0:
+        fixas.add(iids[i])
+        i = predecessor[i]
+    return fixas
@@ -0,0 +1,215 @@
+import tkinter as tk
+from tkinter import ttk
+from typing import Callable, Iterable, Optional
+
+from mvc.views.rolagem import monitorar_fim
+from mvc.views.treeview_reconciler import TreeviewReconciler
+
+ALTURA_LINHA_PADRAO = 20  # px, altura de linha do tema padrão do ttk
+
+
+class VirtualList:
+    """
+    Lista virtualizada sobre um ttk.Treeview: guarda todos os registros em
+    memória, mas só mantém no Treeview as linhas visíveis mais uma margem
+    acima e abaixo. Abrir uma lista com milhares de registros custa o mesmo
+    que abrir uma com algumas dezenas.
+
+    A scrollbar vertical representa a lista inteira; rolar (scrollbar, roda
+    do mouse ou teclado) troca as linhas materializadas pelas da nova janela,
+    usando um TreeviewReconciler (as linhas que continuam visíveis não são
+    recriadas). Cada linha continua com o id do registro como iid e os
+    mesmos valores de antes, então heading/sort, clique no favorito, duplo
+    clique e tree.selection() funcionam como em um Treeview comum. A
+    seleção só vale para linhas materializadas.
+
+    Expõe a mesma interface do TreeviewReconciler (reconciliar, reordenar,
+    anexar, limpar), mantendo a posição de rolagem entre atualizações.
+    """
+
+    def __init__(self, tree: ttk.Treeview, scrollbar: ttk.Scrollbar, valores: Callable,
+                 chave: Callable = lambda item: item.id,
+                 ao_chegar_no_fim: Optional[Callable] = None,
+                 limiar: float = 0.9, margem: int = 20):
+        """
+        Args:
+            tree: Treeview onde as linhas são exibidas
+            scrollbar: scrollbar vertical (passa a ser controlada pela lista)
+            valores: função item -> tupla de valores da linha
+            chave: função item -> identificador único (vira o iid)
+            ao_chegar_no_fim: chamado quando a rolagem se aproxima do fim (próxima página)
+            limiar: fração da lista a partir da qual ao_chegar_no_fim é chamado
+            margem: linhas materializadas acima e abaixo da área visível
+        """
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.margem = margem
+        self._janela = TreeviewReconciler(tree, valores, chave)
+
+        self._itens = []
+        self._topo = 0  # índice do primeiro registro visível
+        self._inicio = 0  # janela materializada: self._itens[_inicio:_fim]
+        self._fim = 0
+        self._visiveis = int(tree.cget("height")) or 10
+        self._recentrar_agendado = False
+        self._aviso_carregando = None
+
+        if ao_chegar_no_fim is not None:
+            self._yscroll = monitorar_fim(tree, scrollbar.set, ao_chegar_no_fim, limiar)
+        else:
+            self._yscroll = scrollbar.set
+
+        scrollbar.configure(command=self._ao_mover_scrollbar)
+        tree.configure(yscrollcommand=self._ao_rolar_arvore)
+        tree.bind("<Configure>", self._ao_redimensionar, add="+")
+        for evento in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            tree.bind(evento, self._ao_rodar_mouse, add="+")
+
+    @property
+    def itens(self) -> list:
+        """Todos os registros da lista, na ordem exibida."""
+        return self._itens
+
+    def iid(self, item) -> str:
+        return self._janela.iid(item)
+
+    # ---------------- DADOS ----------------
+    def reconciliar(self, itens: Iterable) -> dict:
+        """Substitui os registros da lista, mantendo a posição de rolagem."""
+        self._itens = list(itens)
+        return self._materializar()
+
+    def reordenar(self, itens: Iterable) -> None:
+        """Mesmos registros em outra ordem (ex.: ordenação por coluna)."""
+        self._itens = list(itens)
+        self._materializar(reordenar=True)
+
+    def anexar(self, itens: Iterable) -> None:
+        """Acrescenta registros ao fim (ex.: próxima página)."""
+        self._itens.extend(itens)
+        if self._fim < min(len(self._itens), self._topo + self._visiveis + self.margem):
+            # A janela ainda não estava cheia: as linhas novas aparecem na tela
+            self._materializar()
+        else:
+            self._atualizar_scrollbar()
+
+    def limpar(self) -> None:
+        """Remove todos os registros."""
+        self._itens = []
+        self._topo = self._inicio = self._fim = 0
+        self._janela.limpar()
+        self._atualizar_scrollbar()
+
+    def mostrar_carregando(self, ativo: bool, texto: str = "Carregando...") -> None:
+        """
+        Exibe (ou esconde) um aviso sobre a lista enquanto os dados são lidos
+        em segundo plano. Só aparece se a lista estiver vazia; numa recarga,
+        as linhas atuais continuam na tela até os dados novos chegarem.
+        """
+        if not ativo or self._itens:
+            if self._aviso_carregando is not None:
+                self._aviso_carregando.place_forget()
+            return
+        if self._aviso_carregando is None:
+            self._aviso_carregando = ttk.Label(self.tree.master, text=texto)
+        self._aviso_carregando.config(text=texto)
+        self._aviso_carregando.place(in_=self.tree, relx=0.5, rely=0.5, anchor="center")
+
+    # ---------------- JANELA ----------------
+    def _materializar(self, reordenar: bool = False) -> dict:
+        """Recalcula a janela em torno de self._topo e sincroniza o Treeview com ela."""
+        total = len(self._itens)
+        self._topo = max(0, min(self._topo, total - self._visiveis))
+        self._inicio = max(0, self._topo - self.margem)
+        self._fim = min(total, self._topo + self._visiveis + self.margem)
+
+        janela = self._itens[self._inicio:self._fim]
+        if reordenar:
+            self._janela.reordenar(janela)
+            resumo = None
+        else:
+            resumo = self._janela.reconciliar(janela)
+        self._posicionar()
+        return resumo
+
+    def _posicionar(self) -> None:
+        """Rola o Treeview para que self._topo seja a primeira linha visível."""
+        tamanho = self._fim - self._inicio
+        if tamanho:
+            self.tree.yview_moveto((self._topo - self._inicio) / tamanho)
+        self._atualizar_scrollbar()
+
+    def _mostrar(self, topo: int) -> None:
+        """Exibe a lista a partir do registro de índice topo."""
+        self._topo = max(0, min(topo, len(self._itens) - self._visiveis))
+        if self._precisa_recentrar():
+            self._materializar()
+        else:
+            self._posicionar()
+
+    def _precisa_recentrar(self) -> bool:
+        """Indica se a área visível chegou perto da borda da janela materializada."""
+        folga = self.margem // 2
+        antes = self._topo - self._inicio
+        depois = self._fim - (self._topo + self._visiveis)
+        return (antes < folga and self._inicio > 0) or (depois < folga and self._fim < len(self._itens))
+
+    def _atualizar_scrollbar(self) -> None:
+        total = len(self._itens)
+        if total <= self._visiveis:
+            self._yscroll(0.0, 1.0)
+            return
+        self._yscroll(self._topo / total, min(1.0, (self._topo + self._visiveis) / total))
+
+    # ---------------- EVENTOS ----------------
+    def _ao_mover_scrollbar(self, *args) -> None:
+        """command da scrollbar: ('moveto', fração) ou ('scroll', n, 'units'|'pages')."""
+        if not args:
+            return
+        if args[0] == "moveto":
+            self._mostrar(int(float(args[1]) * len(self._itens)))
+        elif args[0] == "scroll":
+            passo = self._visiveis if args[2] == "pages" else 1
+            self._mostrar(self._topo + int(args[1]) * passo)
+
+    def _ao_rolar_arvore(self, primeiro, ultimo) -> None:
+        """
+        yscrollcommand do Treeview: a rolagem interna da janela (teclado,
+        tree.see) é traduzida em posição na lista inteira.
+        """
+        tamanho = self._fim - self._inicio
+        if tamanho:
+            self._topo = self._inicio + int(round(float(primeiro) * tamanho))
+        if self._precisa_recentrar() and not self._recentrar_agendado:
+            # Não mexe no Treeview de dentro do próprio callback de rolagem
+            try:
+                self.tree.after_idle(self._recentrar)
+                self._recentrar_agendado = True
+            except tk.TclError:
+                return
+        self._atualizar_scrollbar()
+
+    def _recentrar(self) -> None:
+        self._recentrar_agendado = False
+        self._materializar()
+
+    def _ao_rodar_mouse(self, event):
+        if getattr(event, "num", None) == 4 or getattr(event, "delta", 0) > 0:
+            self._mostrar(self._topo - 3)
+        else:
+            self._mostrar(self._topo + 3)
+        return "break"
+
+    def _ao_redimensionar(self, event) -> None:
+        # Uma linha a menos: o cabeçalho ocupa mais ou menos a altura de uma linha
+        visiveis = max(1, event.height // self._altura_linha() - 1)
+        if visiveis != self._visiveis:
+            self._visiveis = visiveis
+            self._materializar()
+
+    def _altura_linha(self) -> int:
+        estilo = self.tree.cget("style") or "Treeview"
+        try:
+            return int(ttk.Style(self.tree).lookup(estilo, "rowheight")) or ALTURA_LINHA_PADRAO
+        except (ValueError, tk.TclError):
+            return ALTURA_LINHA_PADRAO
@@ -0,0 +1,98 @@
+# tests/test_background_executor.py
+"""
+Entrega dos resultados do BackgroundExecutor na thread do Tk: um callback
+que falha é reportado e não impede a entrega dos demais resultados, nem
+a continuação do polling enquanto houver tarefas pendentes.
+
+Usa um widget falso no lugar da janela; o teste roda os polls agendados
+com after() manualmente.
+
+Rodar: python -m unittest discover -s tests
+"""
+import threading
+import time
+import unittest
+
+from mvc.controllers.background_executor import BackgroundExecutor
+
+
+class WidgetFalso:
+    """Só o que o executor usa do widget: after() e report_callback_exception()."""
+
+    def __init__(self):
+        self.agendados = []
+        self.erros = []
+
+    def after(self, _ms, func):
+        self.agendados.append(func)
+
+    def report_callback_exception(self, tipo, valor, _tb):
+        self.erros.append(valor)
+
+    def rodar_agendados(self):
+        agendados, self.agendados = self.agendados, []
+        for func in agendados:
+            func()
+
+
+class TestBackgroundExecutor(unittest.TestCase):
+
+    def setUp(self):
+        self.widget = WidgetFalso()
+        self.executor = BackgroundExecutor(self.widget, max_workers=2)
+
+    def tearDown(self):
+        self.executor.shutdown()
+
+    def _esperar_resultados(self, quantidade: int):
+        limite = time.monotonic() + 5
+        while self.executor._resultados.qsize() < quantidade:
+            self.assertLess(time.monotonic(), limite, "tarefas não terminaram")
+            time.sleep(0.005)
+
+    def _falhar(self, _resultado):
+        raise RuntimeError("tela destruída")
+
+    def test_callback_com_erro_nao_bloqueia_o_proximo_resultado(self):
+        entregues = []
+        self.executor.submit("a", lambda: 1, on_success=self._falhar)
+        self.executor.submit("b", lambda: 2, on_success=entregues.append)
+        self._esperar_resultados(2)
+
+        self.widget.rodar_agendados()
+
+        self.assertEqual(entregues, [2])
+        self.assertEqual([str(e) for e in self.widget.erros], ["tela destruída"])
+        self.assertFalse(self.executor.is_busy())
+
+    def test_on_error_com_erro_tambem_e_reportado(self):
+        entregues = []
+        self.executor.submit("a", lambda: 1 / 0, on_error=self._falhar)
+        self.executor.submit("b", lambda: 2, on_success=entregues.append)
+        self._esperar_resultados(2)
+
+        self.widget.rodar_agendados()
+
+        self.assertEqual(entregues, [2])
+        self.assertEqual(len(self.widget.erros), 1)
+
+    def test_polling_continua_apos_callback_com_erro(self):
+        liberar = threading.Event()
+        entregues = []
+        self.executor.submit("a", lambda: 1, on_success=self._falhar)
+        self.executor.submit("b", lambda: liberar.wait(5) and 2, on_success=entregues.append)
+        self._esperar_resultados(1)
+
+        self.widget.rodar_agendados()
+        self.assertEqual(len(self.widget.erros), 1)
+        self.assertTrue(self.executor.is_busy("b"))
+        self.assertEqual(len(self.widget.agendados), 1, "polling não foi reagendado")
+
+        liberar.set()
+        self._esperar_resultados(1)
+        self.widget.rodar_agendados()
+        self.assertEqual(entregues, [2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+# tests/test_email_resolver.py
+"""
+O EmailResolver guarda em cache só os emails encontrados: um email sem
+usuário passa a ser resolvido assim que a conta existir, mesmo que ela
+tenha sido criada sem passar pelo UserDAO (ex.: outro processo).
+
+Rodar: python -m unittest discover -s tests
+"""
+import os
+import shutil
+import tempfile
+import unittest
+
+from dao import ConnectionManager, EmailResolver
+
+
+class TestEmailResolver(unittest.TestCase):
+
+    def setUp(self):
+        self._dir = tempfile.mkdtemp(prefix="signum-test-")
+        self.db_file = os.path.join(self._dir, "database.sqlite")
+        self.conn = ConnectionManager.get_connection(self.db_file)  # aplica as migrações
+        self.resolvedor = EmailResolver(self.db_file)
+
+    def tearDown(self):
+        ConnectionManager.close_all()
+        shutil.rmtree(self._dir, ignore_errors=True)
+
+    def _inserir_sem_invalidar(self, email: str) -> int:
+        cur = self.conn.execute("INSERT INTO users (nome, email, senha_hash) VALUES ('Ana', ?, 'h')", (email,))
+        self.conn.commit()
+        return cur.lastrowid
+
+    def test_email_sem_usuario_nao_fica_em_cache(self):
+        self.assertIsNone(self.resolvedor.resolver("ana@x.com"))
+        user_id = self._inserir_sem_invalidar("ana@x.com")
+        self.assertEqual(self.resolvedor.resolver(" ANA@x.com "), user_id)
+
+    def test_resolver_varios_nao_guarda_ausentes(self):
+        self.assertEqual(self.resolvedor.resolver_varios(["ana@x.com"]), {"ana@x.com": None})
+        user_id = self._inserir_sem_invalidar("ana@x.com")
+        self.assertEqual(self.resolvedor.resolver_varios(["ana@x.com"]), {"ana@x.com": user_id})
+
+    def test_email_encontrado_fica_em_cache(self):
+        user_id = self._inserir_sem_invalidar("ana@x.com")
+        self.assertEqual(self.resolvedor.resolver("ana@x.com"), user_id)
+        self.conn.execute("DELETE FROM users")
+        self.conn.commit()
+        self.assertEqual(self.resolvedor.resolver("ana@x.com"), user_id)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+# tests/test_indices.py
+"""
+Garante que os caminhos de acesso por usuário e de compartilhamento usam
+os índices criados pelas migrações (EXPLAIN QUERY PLAN), para que as
+listas não voltem a fazer varredura completa conforme o banco cresce.
+
+As consultas são capturadas das próprias chamadas aos DAOs (trace do
+sqlite3), então o teste acompanha o SQL real em vez de uma cópia.
+
+Rodar: python -m unittest discover -s tests
+"""
+import os
+import re
+import shutil
+import tempfile
+import unittest
+
+from dao import AssinaturasDAO, ConnectionManager, ContratosDAO, PagamentosDAO, UserDAO
+
+
+class TestIndices(unittest.TestCase):
+
+    def setUp(self):
+        self._dir = tempfile.mkdtemp(prefix="signum-test-")
+        self.db_file = os.path.join(self._dir, "database.sqlite")
+        self.conn = ConnectionManager.get_connection(self.db_file)  # aplica as migrações
+
+        self.conn.execute("INSERT INTO users (nome, email, senha_hash) VALUES ('Ana', 'ana@x.com', 'h')")
+        self.user_id = self.conn.execute("SELECT id FROM users").fetchone()[0]
+        self.conn.commit()
+
+    def tearDown(self):
+        ConnectionManager.close_all()
+        shutil.rmtree(self._dir, ignore_errors=True)
+
+    # ---------------- HELPERS ----------------
+    def _planos(self, chamada) -> list:
+        """Executa chamada() e retorna o plano de cada SELECT que ela rodou."""
+        consultas = []
+        self.conn.set_trace_callback(consultas.append)
+        try:
+            chamada()
+        finally:
+            self.conn.set_trace_callback(None)
+
+        planos = []
+        for sql in consultas:
+            if sql.lstrip().upper().startswith("SELECT"):
+                linhas = self.conn.execute("EXPLAIN QUERY PLAN " + sql).fetchall()
+                planos.append([linha[3] for linha in linhas])
+        self.assertTrue(planos, "a chamada não executou nenhum SELECT")
+        return planos
+
+    def assertUsaIndice(self, chamada, tabela: str, indice: str):
+        """Todo SELECT da chamada busca `tabela` (nome ou alias) pelo índice informado."""
+        padrao = re.compile(rf"^SEARCH {tabela} USING (COVERING )?INDEX {indice}\b")
+        for plano in self._planos(chamada):
+            self.assertTrue(any(padrao.match(passo) for passo in plano), f"{indice} não usado: {plano}")
+            self.assertFalse(any(passo.startswith(f"SCAN {tabela}") for passo in plano), f"varredura: {plano}")
+
+    # ---------------- LISTAS POR USUÁRIO ----------------
+    def test_lista_de_assinaturas_do_usuario(self):
+        dao = AssinaturasDAO(self.db_file)
+        self.assertUsaIndice(lambda: dao.obter_assinaturas_por_usuario(self.user_id),
+                             "assinaturas", "idx_assinaturas_user_fav_venc")
+
+    def test_lista_de_contratos_do_usuario(self):
+        dao = ContratosDAO(self.db_file)
+        self.assertUsaIndice(lambda: dao.get_contratos_by_user(self.user_id),
+                             "contratos", "idx_contratos_user_fav_venc")
+
+    def test_lista_de_pagamentos_do_usuario(self):
+        dao = PagamentosDAO(self.db_file, user_id=self.user_id)
+        self.assertUsaIndice(dao.get_all_pagamentos, "pagamentos", "idx_pagamentos_user_venc")
+
+    # ---------------- VENCIDOS ----------------
+    def test_assinaturas_vencidas(self):
+        dao = AssinaturasDAO(self.db_file)
+        self.assertUsaIndice(lambda: dao.obter_vencidas(self.user_id, "2024-01-01"),
+                             "assinaturas", "idx_assinaturas_user_status_venc")
+
+    def test_contratos_vencidos(self):
+        dao = ContratosDAO(self.db_file)
+        self.assertUsaIndice(lambda: dao.get_vencidos(self.user_id, "2024-01-01"),
+                             "contratos", "idx_contratos_user_status_venc")
+
+    # ---------------- COMPARTILHADOS COMIGO ----------------
+    def test_assinaturas_compartilhadas_comigo(self):
+        dao = AssinaturasDAO(self.db_file)
+        self.assertUsaIndice(lambda: dao.obter_assinaturas_compartilhadas_comigo(self.user_id),
+                             "ac", "idx_assinaturas_comp_destino")
+
+    def test_contratos_compartilhados_comigo(self):
+        dao = ContratosDAO(self.db_file)
+        self.assertUsaIndice(lambda: dao.obter_contratos_compartilhados_comigo(self.user_id),
+                             "cc", "idx_contratos_comp_destino")
+
+    # ---------------- NOMES ÚNICOS ----------------
+    def test_existe_nome_assinatura(self):
+        dao = AssinaturasDAO(self.db_file)
+        self.assertUsaIndice(lambda: dao.existe_nome(self.user_id, "Netflix"),
+                             "assinaturas", "ux_assinaturas_user_nome")
+
+    def test_existe_nome_contrato(self):
+        dao = ContratosDAO(self.db_file)
+        self.assertUsaIndice(lambda: dao.existe_nome(self.user_id, "Aluguel"),
+                             "contratos", "ux_contratos_user_nome")
+
+    def test_existe_nome_pagamento(self):
+        dao = PagamentosDAO(self.db_file, user_id=self.user_id)
+        self.assertUsaIndice(lambda: dao.existe_nome("Pix"), "pagamentos", "ux_pagamentos_user_nome")
+
+    # ---------------- USUÁRIOS ----------------
+    def test_usuario_por_email(self):
+        dao = UserDAO(self.db_file)
+        self.assertUsaIndice(lambda: dao.get_user_id_by_email("ANA@x.com"), "users", "idx_users_email_nocase")
+
+
+if __name__ == "__main__":
+    unittest.main()
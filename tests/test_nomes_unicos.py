@@ -0,0 +1,80 @@
+# tests/test_nomes_unicos.py
+"""
+Nomes únicos por usuário sem diferenciar maiúsculas, inclusive acentuadas
+("Água" e "água"), tanto na verificação prévia (existe_nome) quanto na
+restrição do banco (NomeDuplicadoError).
+
+Rodar: python -m unittest discover -s tests
+"""
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+
+from dao import ConnectionManager, NomeDuplicadoError, PagamentosDAO
+from migrations import MIGRACOES, aplicar_migracoes, chave_nome, versao_atual
+from mvc.models.forma_pagamento_enum import FormaPagamento
+from mvc.models.pagamentos_model import PagamentoModel
+
+
+class TestNomesUnicos(unittest.TestCase):
+
+    def setUp(self):
+        self._dir = tempfile.mkdtemp(prefix="signum-test-")
+        self.db_file = os.path.join(self._dir, "database.sqlite")
+
+    def tearDown(self):
+        ConnectionManager.close_all()
+        shutil.rmtree(self._dir, ignore_errors=True)
+
+    def _novo_usuario(self, conn) -> int:
+        cur = conn.execute("INSERT INTO users (nome, email, senha_hash) VALUES ('Ana', 'ana@x.com', 'h')")
+        conn.commit()
+        return cur.lastrowid
+
+    def test_chave_nome(self):
+        self.assertEqual(chave_nome("  Água "), chave_nome("ÁGUA"))
+        self.assertEqual(chave_nome("Ótica"), chave_nome("ótica"))
+        # "Á" decomposto (A + acento combinante) tem a mesma chave do composto
+        self.assertEqual(chave_nome("A\u0301gua"), chave_nome("\u00c1gua"))
+        self.assertNotEqual(chave_nome("Agua"), chave_nome("Água"))
+
+    def test_existe_nome_e_restricao_com_acentos(self):
+        conn = ConnectionManager.get_connection(self.db_file)
+        dao = PagamentosDAO(self.db_file, user_id=self._novo_usuario(conn))
+        pagamento_id = dao.add_pagamento(PagamentoModel("Água", None, FormaPagamento.PIX))
+
+        self.assertTrue(dao.existe_nome("água"))
+        self.assertTrue(dao.existe_nome(" ÁGUA "))
+        self.assertFalse(dao.existe_nome("água", ignorar_id=pagamento_id))
+        self.assertFalse(dao.existe_nome("Agua"))
+        with self.assertRaises(NomeDuplicadoError):
+            dao.add_pagamento(PagamentoModel("ÁGUA", None, FormaPagamento.PIX))
+
+    def test_migracao_renomeia_duplicatas_que_so_diferem_em_acentuadas(self):
+        # Banco na versão 9, onde lower() deixava "Água" e "água" coexistirem
+        conn = sqlite3.connect(self.db_file)
+        for numero, _descricao, migracao in MIGRACOES:
+            if numero <= 9:
+                migracao(conn)
+        conn.execute("PRAGMA user_version = 9")
+        user_id = self._novo_usuario(conn)
+        for nome in ("Água", "água", "Luz"):
+            conn.execute(
+                "INSERT INTO pagamentos (user_id, nome, forma_pagamento) VALUES (?, ?, ?)",
+                (user_id, nome, FormaPagamento.PIX.value),
+            )
+        conn.commit()
+
+        self.assertEqual(aplicar_migracoes(conn), versao_atual(conn))
+        linhas = conn.execute("SELECT id, nome, nome_chave FROM pagamentos ORDER BY id").fetchall()
+        (id1, nome1, chave1), (id2, nome2, chave2), (_id3, nome3, chave3) = linhas
+        self.assertEqual((nome1, chave1), ("Água", "água"))
+        self.assertEqual((nome2, chave2), (f"água ({id2})", f"água ({id2})"))
+        self.assertEqual((nome3, chave3), ("Luz", "luz"))
+        conn.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+# tests/test_recorrencia.py
+"""
+Cálculo de vencimentos recorrentes em forma fechada (mvc.recorrencia),
+conferido contra o laço período a período que os controllers usavam antes.
+
+O laço antigo limitava o dia a cada passo (31/01 -> 29/02 -> 29/03); a
+forma fechada limita a partir da âncora (31/01 -> 29/02 -> 31/03). Por
+isso a comparação direta com o laço antigo vale para dias até 28, e os
+fins de mês são conferidos contra a soma de k períodos à âncora.
+
+Rodar: python -m unittest discover -s tests
+"""
+import calendar
+import random
+import unittest
+from datetime import date, timedelta
+
+from mvc.models.periodicidade_enum import Periodicidade
+from mvc.recorrencia import (
+    MESES_POR_PERIODICIDADE, adicionar_meses, meses_da_periodicidade,
+    proxima_ocorrencia, proximas_ocorrencias,
+)
+
+MENSAL = Periodicidade.MENSAL.value
+ANUAL = Periodicidade.ANUAL.value
+
+
+# ---------------- REFERÊNCIAS ----------------
+def _passo_antigo(data: date, meses: int) -> date:
+    """Um período do laço antigo (_calcular_proxima_data), com calendar.monthrange."""
+    mes = data.month + meses
+    ano = data.year
+    while mes > 12:
+        mes -= 12
+        ano += 1
+    return data.replace(year=ano, month=mes, day=min(data.day, calendar.monthrange(ano, mes)[1]))
+
+
+def laco_antigo(ancora: date, periodicidade: str, alvo: date) -> date:
+    """Avança período a período a partir da âncora até alcançar o alvo."""
+    data = ancora
+    while data < alvo:
+        data = _passo_antigo(data, MESES_POR_PERIODICIDADE[periodicidade])
+    return data
+
+
+def laco_pela_ancora(ancora: date, periodicidade: str, alvo: date) -> date:
+    """Soma k períodos à âncora (k = 1, 2, ...) até alcançar o alvo."""
+    passo = MESES_POR_PERIODICIDADE[periodicidade]
+    k = 0
+    data = ancora
+    while data < alvo:
+        k += 1
+        data = adicionar_meses(ancora, k * passo)
+    return data
+
+
+class TestRecorrencia(unittest.TestCase):
+
+    # ---------------- FIM DE MÊS ----------------
+    def test_31_de_janeiro_mais_um_mes(self):
+        self.assertEqual(adicionar_meses(date(2023, 1, 31), 1), date(2023, 2, 28))
+        self.assertEqual(proxima_ocorrencia(date(2023, 1, 31), MENSAL, date(2023, 2, 1)), date(2023, 2, 28))
+
+    def test_volta_ao_dia_da_ancora_num_mesmo_calculo(self):
+        # O laço antigo ficaria preso no dia 28 (28/02 -> 28/03)
+        self.assertEqual(proxima_ocorrencia(date(2023, 1, 31), MENSAL, date(2023, 3, 1)), date(2023, 3, 31))
+        self.assertEqual(laco_antigo(date(2023, 1, 31), MENSAL, date(2023, 3, 1)), date(2023, 3, 28))
+
+    def test_anos_bissextos(self):
+        self.assertEqual(adicionar_meses(date(2024, 1, 31), 1), date(2024, 2, 29))
+        self.assertEqual(adicionar_meses(date(2024, 2, 29), 12), date(2025, 2, 28))
+        self.assertEqual(proxima_ocorrencia(date(2024, 2, 29), ANUAL, date(2027, 3, 1)), date(2028, 2, 29))
+        self.assertEqual(adicionar_meses(date(1900, 1, 31), 1), date(1900, 2, 28))
+        self.assertEqual(adicionar_meses(date(2000, 1, 31), 1), date(2000, 2, 29))
+
+    # ---------------- ÂNCORA E ALVO ----------------
+    def test_ancora_depois_do_alvo_e_mantida(self):
+        ancora = date(2025, 6, 15)
+        self.assertEqual(proxima_ocorrencia(ancora, MENSAL, date(2025, 1, 1)), ancora)
+        self.assertEqual(proxima_ocorrencia(ancora, MENSAL, ancora), ancora)
+
+    def test_alvo_no_mesmo_mes_depois_do_dia(self):
+        self.assertEqual(proxima_ocorrencia(date(2025, 1, 10), MENSAL, date(2025, 3, 20)), date(2025, 4, 10))
+
+    # ---------------- PERIODICIDADES ----------------
+    def test_cada_periodicidade(self):
+        ancora, alvo = date(2024, 1, 15), date(2024, 1, 16)
+        esperado = {
+            Periodicidade.MENSAL: date(2024, 2, 15),
+            Periodicidade.TRIMESTRAL: date(2024, 4, 15),
+            Periodicidade.SEMESTRAL: date(2024, 7, 15),
+            Periodicidade.ANUAL: date(2025, 1, 15),
+        }
+        for periodicidade, data in esperado.items():
+            with self.subTest(periodicidade=periodicidade):
+                self.assertEqual(proxima_ocorrencia(ancora, periodicidade, alvo), data)
+                self.assertEqual(proxima_ocorrencia(ancora, periodicidade.value, alvo), data)
+
+    def test_periodicidade_desconhecida(self):
+        self.assertIsNone(meses_da_periodicidade("Quinzenal"))
+        self.assertIsNone(proxima_ocorrencia(date(2024, 1, 1), "Quinzenal", date(2024, 5, 1)))
+
+    # ---------------- COMPARAÇÃO COM O LAÇO ----------------
+    def _casos(self, quantidade: int, dia_maximo: int):
+        aleatorio = random.Random(10)
+        for _ in range(quantidade):
+            ancora = date(aleatorio.randint(1990, 2030), aleatorio.randint(1, 12), aleatorio.randint(1, dia_maximo))
+            alvo = ancora + timedelta(days=aleatorio.randint(-60, 4000))
+            yield ancora, aleatorio.choice(list(MESES_POR_PERIODICIDADE)), alvo
+
+    def test_igual_ao_laco_antigo_ate_o_dia_28(self):
+        for ancora, periodicidade, alvo in self._casos(3000, 28):
+            with self.subTest(ancora=ancora, periodicidade=periodicidade, alvo=alvo):
+                self.assertEqual(proxima_ocorrencia(ancora, periodicidade, alvo),
+                                 laco_antigo(ancora, periodicidade, alvo))
+
+    def test_igual_a_soma_de_periodos_a_ancora(self):
+        for ancora, periodicidade, alvo in self._casos(3000, 28):
+            ancora = ancora.replace(day=calendar.monthrange(ancora.year, ancora.month)[1])
+            with self.subTest(ancora=ancora, periodicidade=periodicidade, alvo=alvo):
+                self.assertEqual(proxima_ocorrencia(ancora, periodicidade, alvo),
+                                 laco_pela_ancora(ancora, periodicidade, alvo))
+
+    def test_versao_em_lote(self):
+        itens = [(ancora, periodicidade) for ancora, periodicidade, _alvo in self._casos(200, 28)]
+        itens += [(date(2024, 1, 31), Periodicidade.MENSAL), (date(2024, 1, 1), "Quinzenal")]
+        alvo = date(2026, 5, 17)
+        self.assertEqual(proximas_ocorrencias(itens, alvo),
+                         [proxima_ocorrencia(ancora, periodicidade, alvo) for ancora, periodicidade in itens])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+# tests/test_renovacao.py
+"""
+Renovação em lote de assinaturas e contratos vencidos (mvc.renovacao) sobre
+um banco em memória: contagens de renovados/ignorados, datas gravadas em
+ISO e idempotência (uma segunda execução no mesmo dia não muda nada).
+
+Rodar: python -m unittest discover -s tests
+"""
+import unittest
+from datetime import date
+
+from dao import AssinaturasDAO, ConnectionManager, ContratosDAO
+from mvc.renovacao import calcular_renovacao, renovar_vencidos
+
+HOJE = date(2024, 3, 15)
+BANCO = ":memory:"
+
+
+class TestRenovacao(unittest.TestCase):
+
+    def setUp(self):
+        self.conn = ConnectionManager.get_connection(BANCO)  # banco novo, já migrado
+        self.user_id = self.conn.execute(
+            "INSERT INTO users (nome, email, senha_hash) VALUES ('Ana', 'ana@x.com', 'h')"
+        ).lastrowid
+        self.outro_id = self.conn.execute(
+            "INSERT INTO users (nome, email, senha_hash) VALUES ('Bia', 'bia@x.com', 'h')"
+        ).lastrowid
+        self.conn.commit()
+
+    def tearDown(self):
+        ConnectionManager.close_all()
+
+    # ---------------- HELPERS ----------------
+    def _inserir(self, tabela: str, nome: str, vencimento: str, periodicidade: str,
+                 status: str = "Ativo", user_id: int = None) -> int:
+        colunas = {
+            "user_id": user_id or self.user_id, "nome": nome, "nome_chave": nome.casefold(),
+            "data_vencimento": vencimento, "valor": 10.0, "periodicidade": periodicidade,
+            "categoria": "Outros", "forma_pagamento": "Pix", "status": status,
+        }
+        cursor = self.conn.execute(
+            f"INSERT INTO {tabela} ({', '.join(colunas)}) VALUES ({', '.join('?' * len(colunas))})",
+            list(colunas.values()),
+        )
+        self.conn.commit()
+        return cursor.lastrowid
+
+    def _vencimentos(self, tabela: str) -> dict:
+        return dict(self.conn.execute(f"SELECT nome, data_vencimento FROM {tabela}"))
+
+    def _semear(self, tabela: str) -> dict:
+        """Mesmo cenário nas duas tabelas; retorna as datas esperadas após renovar."""
+        self._inserir(tabela, "Mensal fim de mês", "2024-01-31", "Mensal")
+        self._inserir(tabela, "Trimestral", "2023-11-20", "Trimestral")
+        self._inserir(tabela, "Anual", "2023-03-15", "Anual")
+        self._inserir(tabela, "Periodicidade desconhecida", "2024-01-10", "Quinzenal")
+        self._inserir(tabela, "Vence hoje", "2024-03-15", "Mensal")
+        self._inserir(tabela, "Cancelado", "2024-01-10", "Mensal", status="Inativo")
+        self._inserir(tabela, "De outro usuário", "2024-01-10", "Mensal", user_id=self.outro_id)
+        return {
+            "Mensal fim de mês": "2024-03-31",
+            "Trimestral": "2024-05-20",
+            "Anual": "2024-03-15",
+            "Periodicidade desconhecida": "2024-01-10",
+            "Vence hoje": "2024-03-15",
+            "Cancelado": "2024-01-10",
+            "De outro usuário": "2024-01-10",
+        }
+
+    def _renovar_e_conferir(self, tabela: str, buscar, gravar):
+        esperado = self._semear(tabela)
+
+        resumo = renovar_vencidos(buscar, gravar, hoje=HOJE)
+        self.assertEqual((resumo["renovados"], resumo["ignorados"]), (3, 1))
+        self.assertEqual(
+            sorted(nova for _id, _antiga, nova in resumo["itens"]),
+            ["2024-03-15", "2024-03-31", "2024-05-20"],
+        )
+        self.assertEqual(self._vencimentos(tabela), esperado)
+
+        # Segunda execução no mesmo dia: nada mais está vencido
+        resumo = renovar_vencidos(buscar, gravar, hoje=HOJE)
+        self.assertEqual((resumo["renovados"], resumo["itens"]), (0, []))
+        self.assertEqual(self._vencimentos(tabela), esperado)
+
+    # ---------------- LOTE ----------------
+    def test_renova_assinaturas_vencidas(self):
+        dao = AssinaturasDAO(BANCO)
+        self._renovar_e_conferir(
+            "assinaturas",
+            lambda hoje_iso: dao.iterar_vencidas(self.user_id, hoje_iso),
+            dao.atualizar_vencimentos,
+        )
+
+    def test_renova_contratos_vencidos(self):
+        dao = ContratosDAO(BANCO)
+        self._renovar_e_conferir(
+            "contratos",
+            lambda hoje_iso: dao.iter_vencidos(self.user_id, hoje_iso),
+            dao.update_vencimentos,
+        )
+
+    def test_data_invalida_e_ignorada(self):
+        gravados = []
+        resumo = renovar_vencidos(
+            lambda _hoje_iso: [(1, "data?", "Mensal"), (2, "2024-02-10", "Mensal")],
+            gravados.extend, hoje=HOJE,
+        )
+        self.assertEqual((resumo["renovados"], resumo["ignorados"]), (1, 1))
+        self.assertEqual(gravados, [("2024-04-10", 2)])
+
+    def test_nada_vencido_nao_grava(self):
+        gravados = []
+        resumo = renovar_vencidos(lambda _hoje_iso: [], gravados.append, hoje=HOJE)
+        self.assertEqual(resumo, {"renovados": 0, "ignorados": 0, "itens": []})
+        self.assertEqual(gravados, [])
+
+    # ---------------- ITEM ÚNICO ----------------
+    def test_calcular_renovacao(self):
+        self.assertEqual(calcular_renovacao("2024-01-31", "Mensal", HOJE), date(2024, 3, 31))
+        self.assertEqual(calcular_renovacao("31/01/2024", "Mensal", HOJE), date(2024, 3, 31))
+        self.assertIsNone(calcular_renovacao("2024-03-15", "Mensal", HOJE))  # ainda não venceu
+        self.assertIsNone(calcular_renovacao("2024-01-10", "Quinzenal", HOJE))
+        self.assertIsNone(calcular_renovacao("data?", "Mensal", HOJE))
+
+
+if __name__ == "__main__":
+    unittest.main()
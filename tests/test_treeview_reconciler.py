@@ -0,0 +1,185 @@
+# tests/test_treeview_reconciler.py
+"""
+TreeviewReconciler sobre um Treeview falso (sem display): a ordem final
+das linhas, os valores exibidos e o conjunto mínimo de linhas movidas
+(todas fora da maior subsequência que já estava na ordem nova).
+
+Rodar: python -m unittest discover -s tests
+"""
+import random
+import unittest
+
+from mvc.views.treeview_reconciler import TreeviewReconciler
+
+
+class TreeviewFalso:
+    """As operações do ttk.Treeview usadas pelo reconciliador, só na raiz ("")."""
+
+    def __init__(self):
+        self.filhos = []  # iids anexados, na ordem exibida
+        self.valores = {}  # iid -> values (inclusive de linhas destacadas)
+        self.chamadas = []  # (operação, iids)
+
+    def get_children(self, _pai=""):
+        return tuple(self.filhos)
+
+    def insert(self, _pai, indice, iid, values):
+        assert iid not in self.valores, f"iid duplicado: {iid}"
+        self.valores[iid] = values
+        self.filhos.insert(len(self.filhos) if indice == "end" else indice, iid)
+        self.chamadas.append(("insert", iid))
+
+    def delete(self, *iids):
+        for iid in iids:
+            if iid in self.filhos:
+                self.filhos.remove(iid)
+            del self.valores[iid]
+        self.chamadas.append(("delete", iids))
+
+    def detach(self, *iids):
+        for iid in iids:
+            self.filhos.remove(iid)
+        self.chamadas.append(("detach", iids))
+
+    def move(self, iid, _pai, indice):
+        if iid in self.filhos:
+            self.filhos.remove(iid)
+        self.filhos.insert(indice, iid)
+        self.chamadas.append(("move", iid))
+
+    def item(self, iid, values):
+        self.valores[iid] = values
+        self.chamadas.append(("item", iid))
+
+    def set_children(self, _pai, *iids):
+        self.filhos = list(iids)
+        self.chamadas.append(("set_children", iids))
+
+
+class Registro:
+    __slots__ = ("id", "nome")
+
+    def __init__(self, registro_id, nome):
+        self.id = registro_id
+        self.nome = nome
+
+
+def _registros(*pares):
+    return [Registro(registro_id, nome) for registro_id, nome in pares]
+
+
+def _tamanho_maior_subsequencia(sequencia: list) -> int:
+    """Referência O(n²) para o tamanho da maior subsequência crescente."""
+    melhores = []
+    for i, valor in enumerate(sequencia):
+        melhores.append(1 + max((melhores[j] for j in range(i) if sequencia[j] < valor), default=0))
+    return max(melhores, default=0)
+
+
+class TestTreeviewReconciler(unittest.TestCase):
+
+    def setUp(self):
+        self.tree = TreeviewFalso()
+        self.reconciliador = TreeviewReconciler(self.tree, lambda r: (r.id, r.nome))
+
+    def _exibir(self, registros):
+        resumo = self.reconciliador.reconciliar(registros)
+        self.assertEqual(self.tree.get_children(), tuple(str(r.id) for r in registros))
+        self.assertEqual(self.tree.valores, {str(r.id): (r.id, r.nome) for r in registros})
+        return resumo
+
+    def _movidas(self) -> set:
+        """iids reposicionados na última reconciliação (destacados e movidos)."""
+        destacadas = set()
+        for operacao, iids in self.tree.chamadas:
+            if operacao == "detach":
+                destacadas.update(iids)
+        movidas = {iid for operacao, iid in self.tree.chamadas if operacao == "move"}
+        self.assertEqual(destacadas, movidas)
+        return movidas
+
+    # ---------------- OPERAÇÕES ----------------
+    def test_insercoes(self):
+        self._exibir(_registros((1, "a"), (3, "c")))
+        self.tree.chamadas.clear()
+
+        resumo = self._exibir(_registros((0, "z"), (1, "a"), (2, "b"), (3, "c"), (4, "d")))
+        self.assertEqual(resumo, {'inseridas': 3, 'atualizadas': 0, 'movidas': 0, 'removidas': 0})
+        self.assertEqual(self._movidas(), set())
+
+    def test_remocoes(self):
+        self._exibir(_registros((1, "a"), (2, "b"), (3, "c"), (4, "d")))
+        self.tree.chamadas.clear()
+
+        resumo = self._exibir(_registros((1, "a"), (4, "d")))
+        self.assertEqual(resumo, {'inseridas': 0, 'atualizadas': 0, 'movidas': 0, 'removidas': 2})
+        self.assertEqual(self.tree.chamadas, [("delete", ("2", "3"))])
+
+    def test_favorito_move_uma_linha(self):
+        registros = _registros(*((i, f"r{i}") for i in range(1, 101)))
+        self._exibir(registros)
+        self.tree.chamadas.clear()
+
+        # O registro 50 vira favorito: muda o valor e sobe para o topo
+        registros[49].nome = "r50 ★"
+        resumo = self._exibir([registros[49]] + registros[:49] + registros[50:])
+        self.assertEqual(resumo, {'inseridas': 0, 'atualizadas': 1, 'movidas': 1, 'removidas': 0})
+        self.assertEqual(self._movidas(), {"50"})
+
+    def test_inversao(self):
+        registros = _registros((1, "a"), (2, "b"), (3, "c"), (4, "d"))
+        self._exibir(registros)
+        self.tree.chamadas.clear()
+
+        resumo = self._exibir(list(reversed(registros)))
+        self.assertEqual(resumo['movidas'], 3)  # só uma linha pode ficar no lugar
+        self.assertEqual(len(self._movidas()), 3)
+
+    def test_sem_mudancas_nao_toca_no_treeview(self):
+        registros = _registros((1, "a"), (2, "b"), (3, "c"))
+        self._exibir(registros)
+        self.tree.chamadas.clear()
+
+        resumo = self._exibir(_registros((1, "a"), (2, "b"), (3, "c")))
+        self.assertEqual(resumo, {'inseridas': 0, 'atualizadas': 0, 'movidas': 0, 'removidas': 0})
+        self.assertEqual(self.tree.chamadas, [])
+
+    def test_aleatorio_ordem_final_e_movimentos_minimos(self):
+        aleatorio = random.Random(21)
+        atual = []
+        for _ in range(300):
+            ids = aleatorio.sample(range(60), aleatorio.randint(0, 40))
+            novos = [Registro(i, aleatorio.choice("abc")) for i in ids]
+
+            antigos = [str(r.id) for r in atual]
+            novos_iids = [str(i) for i in ids]
+            posicao = {iid: i for i, iid in enumerate(iid for iid in antigos if iid in novos_iids)}
+            existentes = [posicao[iid] for iid in novos_iids if iid in posicao]
+
+            self.tree.chamadas.clear()
+            resumo = self._exibir(novos)
+            movidas = self._movidas()
+            self.assertEqual(len(movidas), resumo['movidas'])
+            self.assertEqual(resumo['movidas'], len(existentes) - _tamanho_maior_subsequencia(existentes))
+            self.assertEqual(resumo['removidas'], len(set(antigos) - set(novos_iids)))
+            atual = novos
+
+    # ---------------- REORDENAR / ANEXAR ----------------
+    def test_reordenar_troca_a_ordem_numa_chamada(self):
+        registros = _registros((1, "a"), (2, "b"), (3, "c"))
+        self._exibir(registros)
+        self.tree.chamadas.clear()
+
+        self.reconciliador.reordenar(list(reversed(registros)))
+        self.assertEqual(self.tree.get_children(), ("3", "2", "1"))
+        self.assertEqual(self.tree.chamadas, [("set_children", ("3", "2", "1"))])
+
+    def test_anexar_acrescenta_no_fim_e_atualiza_repetidos(self):
+        self._exibir(_registros((1, "a"), (2, "b")))
+        self.reconciliador.anexar(_registros((2, "B"), (3, "c")))
+        self.assertEqual(self.tree.get_children(), ("1", "2", "3"))
+        self.assertEqual(self.tree.valores["2"], (2, "B"))
+
+
+if __name__ == "__main__":
+    unittest.main()